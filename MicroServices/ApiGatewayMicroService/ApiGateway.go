@@ -11,6 +11,7 @@ import (
 	"net/url"
 	"bytes"
 	"os"
+	"strconv"
 	"strings"
 	"sync"
 	"time"
@@ -94,6 +95,30 @@ func dropHopByHop(h http.Header) {
 	}
 }
 
+func envInt(name string, fallback int) int {
+	raw := strings.TrimSpace(os.Getenv(name))
+	if raw == "" {
+		return fallback
+	}
+	value, err := strconv.Atoi(raw)
+	if err != nil {
+		log.Fatalf("%s must be an integer, got %q", name, raw)
+	}
+	return value
+}
+
+func tlsMinVersion() uint16 {
+	switch strings.TrimSpace(os.Getenv("MTLS_MIN_VERSION")) {
+	case "", "1.2":
+		return tls.VersionTLS12
+	case "1.3":
+		return tls.VersionTLS13
+	default:
+		log.Fatalf("MTLS_MIN_VERSION must be 1.2 or 1.3")
+	}
+	return 0
+}
+
 func defaultTransport() http.RoundTripper {
 	certPath := strings.TrimSpace(os.Getenv("MTLS_CLIENT_CERT"))
 	keyPath := strings.TrimSpace(os.Getenv("MTLS_CLIENT_KEY"))
@@ -115,7 +140,7 @@ func defaultTransport() http.RoundTripper {
 		}
 
 		tlsConfig = &tls.Config{
-			MinVersion:   tls.VersionTLS12,
+			MinVersion:   tlsMinVersion(),
 			Certificates: []tls.Certificate{clientCert},
 		}
 	}
@@ -131,12 +156,15 @@ func defaultTransport() http.RoundTripper {
 		}
 
 		if tlsConfig == nil {
-			tlsConfig = &tls.Config{MinVersion: tls.VersionTLS12}
+			tlsConfig = &tls.Config{MinVersion: tlsMinVersion()}
 		}
 		tlsConfig.RootCAs = pool
 	}
 
 	if tlsConfig != nil {
+		// Keep session tickets from the services so reconnects resume instead
+		// of repeating the full mTLS handshake.
+		tlsConfig.ClientSessionCache = tls.NewLRUClientSessionCache(envInt("MTLS_SESSION_CACHE_SIZE", 256))
 		tlsConfig.VerifyConnection = func(cs tls.ConnectionState) error {
 			serverCN := ""
 			if len(cs.PeerCertificates) > 0 {
@@ -157,7 +185,10 @@ func defaultTransport() http.RoundTripper {
 			Timeout:   5 * time.Second,
 			KeepAlive: 30 * time.Second,
 		}).DialContext,
-		MaxIdleConns:          200,
+		MaxIdleConns: 200,
+		// The default of 2 idle connections per backend forces a new
+		// handshake for most requests under concurrency.
+		MaxIdleConnsPerHost:   envInt("GATEWAY_MAX_IDLE_CONNS_PER_HOST", 64),
 		IdleConnTimeout:       90 * time.Second,
 		TLSHandshakeTimeout:   5 * time.Second,
 		ExpectContinueTimeout: 1 * time.Second,
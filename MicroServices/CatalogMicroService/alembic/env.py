@@ -10,17 +10,15 @@ from sqlmodel import SQLModel
 load_dotenv()
 
 config = context.config
-if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
-else:
-    fileConfig("alembic.ini")
+# The service runs migrations in-process at startup and keeps its own logging setup.
+if config.attributes.get("configure_logger", True):
+    if config.config_file_name is not None:
+        fileConfig(config.config_file_name)
+    else:
+        fileConfig("alembic.ini")
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-
-config = context.config
-fileConfig(config.config_file_name)
-
 target_metadata = SQLModel.metadata
 
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -0,0 +1,33 @@
+"""add catalog item filter indexes
+
+Revision ID: 0979b5f29407
+Revises: cc406ec5107d
+Create Date: 2026-10-17 09:12:31.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0979b5f29407'
+down_revision: Union[str, Sequence[str], None] = 'cc406ec5107d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Listing filters on brand and/or type with equality and pages in id order.
+    op.create_index('ix_catalogitem_brand_id_id', 'catalogitem', ['catalog_brand_id', 'id'])
+    op.create_index('ix_catalogitem_type_id_id', 'catalogitem', ['catalog_type_id', 'id'])
+    op.create_index('ix_catalogitem_brand_id_type_id_id', 'catalogitem', ['catalog_brand_id', 'catalog_type_id', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_catalogitem_brand_id_type_id_id', table_name='catalogitem')
+    op.drop_index('ix_catalogitem_type_id_id', table_name='catalogitem')
+    op.drop_index('ix_catalogitem_brand_id_id', table_name='catalogitem')
@@ -0,0 +1,45 @@
+"""add unique catalog item name
+
+Revision ID: 51ac70640363
+Revises: 0979b5f29407
+Create Date: 2026-10-17 11:40:05.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '51ac70640363'
+down_revision: Union[str, Sequence[str], None] = '0979b5f29407'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Bulk imports upsert on the item name (the seeder already treats it as the
+    # natural key). Duplicates are not merged here: orders refer to items by
+    # id, so which row survives is an operator decision.
+    duplicates = op.get_bind().execute(
+        sa.text(
+            "SELECT name, COUNT(*) AS copies FROM catalogitem "
+            "GROUP BY name HAVING COUNT(*) > 1 ORDER BY name LIMIT 20"
+        )
+    ).all()
+    if duplicates:
+        listed = ", ".join(f"{name!r} ({copies} rows)" for name, copies in duplicates)
+        raise RuntimeError(
+            "Cannot add unique index ux_catalogitem_name: catalogitem has duplicate "
+            f"names: {listed}. Rename or delete the extra rows (find them with "
+            "SELECT id, name FROM catalogitem WHERE name IN (SELECT name FROM "
+            "catalogitem GROUP BY name HAVING COUNT(*) > 1)) and restart."
+        )
+    op.create_index('ux_catalogitem_name', 'catalogitem', ['name'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ux_catalogitem_name', table_name='catalogitem')
@@ -0,0 +1,69 @@
+"""add catalog item search index
+
+Revision ID: 8c2f4e1d9a07
+Revises: 51ac70640363
+Create Date: 2026-10-17 14:05:47.311920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2f4e1d9a07'
+down_revision: Union[str, Sequence[str], None] = '51ac70640363'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+SQLITE_UPGRADE = (
+    "CREATE VIRTUAL TABLE catalogitem_fts USING fts5("
+    "name, description, content='catalogitem', content_rowid='id', "
+    "tokenize='porter unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER catalogitem_fts_ai AFTER INSERT ON catalogitem BEGIN "
+    "INSERT INTO catalogitem_fts(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+    "CREATE TRIGGER catalogitem_fts_ad AFTER DELETE ON catalogitem BEGIN "
+    "INSERT INTO catalogitem_fts(catalogitem_fts, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); END",
+    "CREATE TRIGGER catalogitem_fts_au AFTER UPDATE OF name, description ON catalogitem BEGIN "
+    "INSERT INTO catalogitem_fts(catalogitem_fts, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    "INSERT INTO catalogitem_fts(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+    # Index the rows that already exist.
+    "INSERT INTO catalogitem_fts(catalogitem_fts) VALUES ('rebuild')",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.create_index(
+            'ix_catalogitem_search',
+            'catalogitem',
+            [sa.text(f'({SEARCH_VECTOR})')],
+            postgresql_using='gin',
+        )
+    elif dialect == 'sqlite':
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.drop_index('ix_catalogitem_search', table_name='catalogitem')
+    elif dialect == 'sqlite':
+        for trigger in ('catalogitem_fts_ai', 'catalogitem_fts_ad', 'catalogitem_fts_au'):
+            op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        op.execute('DROP TABLE IF EXISTS catalogitem_fts')
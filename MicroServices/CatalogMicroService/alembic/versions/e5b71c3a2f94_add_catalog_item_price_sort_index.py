@@ -0,0 +1,31 @@
+"""add catalog item price sort index
+
+Revision ID: e5b71c3a2f94
+Revises: 8c2f4e1d9a07
+Create Date: 2026-10-17 15:22:09.604318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b71c3a2f94'
+down_revision: Union[str, Sequence[str], None] = '8c2f4e1d9a07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # orderBy=price pages are keyset-sought on (price, id) so that equal prices
+    # keep a stable order; this serves the seek, the sort in either direction
+    # and the minPrice/maxPrice range. orderBy=name uses ux_catalogitem_name.
+    op.create_index('ix_catalogitem_price_id', 'catalogitem', ['price', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_catalogitem_price_id', table_name='catalogitem')
@@ -0,0 +1,62 @@
+import time
+from typing import Any
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+
+class PoolCheckoutStats:
+    """Counters for how long requests wait to get a pooled connection."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, wait_seconds: float, timed_out: bool = False) -> None:
+        self.checkouts += 1
+        self.timeouts += timed_out
+        self.total_wait_seconds += wait_seconds
+        if wait_seconds > self.max_wait_seconds:
+            self.max_wait_seconds = wait_seconds
+
+
+pool_checkout_stats = PoolCheckoutStats()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` that records checkout wait times.
+
+    The measured time covers waiting for a free slot, opening an overflow
+    connection and the pre-ping, i.e. everything between asking for a
+    connection and being able to use it.
+    """
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            pool_checkout_stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        pool_checkout_stats.record(time.perf_counter() - started)
+        return connection
+
+
+def pool_status(pool: Pool) -> dict[str, Any]:
+    stats = pool_checkout_stats
+    # Only queue pools track sizes; SQLite test/local engines may use others.
+    sized = isinstance(pool, AsyncAdaptedQueuePool)
+    return {
+        "pool_class": type(pool).__name__,
+        "size": pool.size() if sized else None,
+        "max_overflow": pool._max_overflow if sized else None,
+        "checked_out": pool.checkedout() if sized else None,
+        "checked_in": pool.checkedin() if sized else None,
+        "overflow": pool.overflow() if sized else None,
+        "checkouts": stats.checkouts,
+        "timeouts": stats.timeouts,
+        "avg_wait_ms": stats.total_wait_seconds / stats.checkouts * 1000 if stats.checkouts else 0.0,
+        "max_wait_ms": stats.max_wait_seconds * 1000,
+    }
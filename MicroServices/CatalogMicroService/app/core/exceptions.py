@@ -25,3 +25,17 @@ class NotFoundError(ServiceError):
     def __init__(self, message: str = "Resource not found"):
         super().__init__(message, status_code=404)
 
+
+
+class BadRequestError(ServiceError):
+    """Raised when request parameters are well-formed but cannot be honoured."""
+
+    def __init__(self, message: str = "Bad request"):
+        super().__init__(message, status_code=400)
+
+
+class ConflictError(ServiceError):
+    """Raised when a write would break a uniqueness rule."""
+
+    def __init__(self, message: str = "Conflict"):
+        super().__init__(message, status_code=409)
@@ -0,0 +1,182 @@
+"""Prometheus metrics for HTTP requests and database queries.
+
+``PrometheusMiddleware`` times every request by route template and
+``instrument_engine`` times every statement at the driver call;
+``metrics_response`` renders them for ``GET /metrics``. With several uvicorn
+workers each process counts on its own, so ``app/server.py`` sets
+``PROMETHEUS_MULTIPROC_DIR`` before they start and the response aggregates
+all workers.
+"""
+import os
+import shutil
+import time
+from pathlib import Path
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from starlette.responses import Response
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method, route template and status code.",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "HTTP response body size by method and route template.",
+    ["method", "route"],
+    buckets=SIZE_BUCKETS,
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served.",
+    multiprocess_mode="livesum",
+)
+QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Database statement execution time by SQL verb.",
+    ["operation"],
+    buckets=QUERY_BUCKETS,
+)
+
+# Unmatched paths share one label so scanners cannot blow up cardinality.
+UNMATCHED_ROUTE = "unmatched"
+_QUERY_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"})
+
+# Label lookups take a lock in prometheus_client; resolve each child once.
+_request_children: dict[tuple[str, str, int], tuple] = {}
+_query_children: dict[str, object] = {}
+
+
+def _request_metrics(method: str, route: str, status: int):
+    key = (method, route, status)
+    children = _request_children.get(key)
+    if children is None:
+        children = _request_children[key] = (
+            REQUEST_DURATION.labels(method, route, str(status)),
+            RESPONSE_SIZE.labels(method, route),
+        )
+    return children
+
+
+class PrometheusMiddleware:
+    """Pure ASGI middleware; a BaseHTTPMiddleware would add a task per request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            REQUESTS_IN_FLIGHT.dec()
+            # The router stores the matched route in the shared scope.
+            route = scope.get("route")
+            duration, response_size = _request_metrics(
+                scope["method"], getattr(route, "path", UNMATCHED_ROUTE), status
+            )
+            duration.observe(elapsed)
+            response_size.observe(size)
+
+
+def _observe_query(statement: str, elapsed: float) -> None:
+    operation = statement.lstrip()[:6].upper()
+    if operation not in _QUERY_OPERATIONS:
+        operation = "OTHER"
+    child = _query_children.get(operation)
+    if child is None:
+        child = _query_children[operation] = QUERY_DURATION.labels(operation)
+    child.observe(elapsed)
+
+
+def instrument_engine(engine) -> None:
+    """Record ``db_query_duration_seconds`` for every statement ``engine`` runs.
+
+    Hooks the dialect's ``do_execute*`` rather than ``before/after_cursor_execute``:
+    any connection event listener moves every statement onto SQLAlchemy's
+    slower event-dispatch path, while a dialect hook only wraps the driver call.
+    Each hook still delegates to the dialect's own method (e.g. psycopg2's
+    batched ``executemany``) and returns True so it is not run twice.
+    """
+    dialect = getattr(engine, "sync_engine", engine).dialect
+
+    @event.listens_for(dialect, "do_execute")
+    def _execute(cursor, statement, parameters, context):
+        started = time.perf_counter()
+        try:
+            dialect.do_execute(cursor, statement, parameters, context)
+        finally:
+            _observe_query(statement, time.perf_counter() - started)
+        return True
+
+    @event.listens_for(dialect, "do_executemany")
+    def _executemany(cursor, statement, parameters, context):
+        started = time.perf_counter()
+        try:
+            dialect.do_executemany(cursor, statement, parameters, context)
+        finally:
+            _observe_query(statement, time.perf_counter() - started)
+        return True
+
+    @event.listens_for(dialect, "do_execute_no_params")
+    def _execute_no_params(cursor, statement, context):
+        started = time.perf_counter()
+        try:
+            dialect.do_execute_no_params(cursor, statement, context)
+        finally:
+            _observe_query(statement, time.perf_counter() - started)
+        return True
+
+
+def metrics_response() -> Response:
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+def prepare_multiprocess_dir(path: str) -> None:
+    """Empty ``path`` so counters left by a previous run are not aggregated."""
+    directory = Path(path)
+    if directory.exists():
+        shutil.rmtree(directory)
+    directory.mkdir(parents=True)
+
+
+def mark_worker_stopped() -> None:
+    """Drop this worker's in-flight gauge from the aggregate when it exits."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(os.getpid())
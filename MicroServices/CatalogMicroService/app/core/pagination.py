@@ -0,0 +1,24 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from app.core.exceptions import BadRequestError
+
+
+def encode_cursor(position: dict[str, Any]) -> str:
+    """Serialize a keyset position into an opaque, URL-safe token."""
+    raw = json.dumps(position, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """Inverse of :func:`encode_cursor`; raises ``BadRequestError`` on tampered input."""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        position = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise BadRequestError("Invalid cursor") from exc
+    if not isinstance(position, dict):
+        raise BadRequestError("Invalid cursor")
+    return position
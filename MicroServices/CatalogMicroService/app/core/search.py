@@ -0,0 +1,29 @@
+import re
+
+from app.core.exceptions import BadRequestError
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+MAX_SEARCH_TERMS = 8
+
+
+def parse_search_terms(query: str) -> list[str]:
+    """Split free text into lower-cased word terms, dropping any operators.
+
+    Every term is later matched as a prefix, and all terms must match.
+    """
+    terms = list(dict.fromkeys(term.lower() for term in _TERM.findall(query)))
+    if not terms:
+        raise BadRequestError("Search query must contain at least one word")
+    if len(terms) > MAX_SEARCH_TERMS:
+        raise BadRequestError(f"Search query may contain at most {MAX_SEARCH_TERMS} words")
+    return terms
+
+
+def fts5_match_expression(terms: list[str]) -> str:
+    """Build an FTS5 ``MATCH`` string: quoted prefix terms joined by ``AND``."""
+    return " AND ".join(f'"{term}"*' for term in terms)
+
+
+def tsquery_expression(terms: list[str]) -> str:
+    """Build a ``to_tsquery`` string: prefix terms joined by ``&``."""
+    return " & ".join(f"{term}:*" for term in terms)
@@ -0,0 +1,62 @@
+import hashlib
+from dataclasses import dataclass
+
+from typing import Any
+
+from fastapi import Request, Response
+
+from app.core.cache import TTLCache
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """A pre-serialized JSON response body and its strong ETag."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "Snapshot":
+        # Content-derived, so every worker computes the same tag for the same data.
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+class SnapshotCache:
+    """Holds the current :class:`Snapshot` of a small lookup table.
+
+    Writers call :meth:`invalidate`; the next reader rebuilds the snapshot. The
+    TTL bounds how long other workers keep serving a snapshot after a write.
+    """
+
+    _KEY = "snapshot"
+
+    def __init__(self, name: str, ttl_seconds: float):
+        self._cache: TTLCache[Snapshot] = TTLCache(name, max_size=1, ttl_seconds=ttl_seconds)
+
+    def get(self) -> Snapshot | None:
+        return self._cache.get(self._KEY)
+
+    def set(self, snapshot: Snapshot) -> None:
+        self._cache.set(self._KEY, snapshot)
+
+    def invalidate(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return self._cache.stats()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+def snapshot_response(request: Request, snapshot: Snapshot, max_age: int) -> Response:
+    """Serve ``snapshot``, answering a matching ``If-None-Match`` with 304 and no body."""
+    headers = {"ETag": snapshot.etag, "Cache-Control": f"public, max-age={max_age}"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
@@ -1,13 +1,22 @@
 import asyncio
 import logging
 import os
+from pathlib import Path
 
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
 from dotenv import load_dotenv
+from sqlalchemy import exists, inspect, make_url, or_, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
+from app.core.db_pool import InstrumentedAsyncQueuePool
 from app.core.exceptions import DatabaseOperationError
+from app.core.metrics import instrument_engine
+from app.models import CatalogBrand, CatalogItem, CatalogType
 from app.seeder import seed_db
 
 if not logging.getLogger().handlers:
@@ -24,7 +33,33 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is not set in .env")
 
-engine = create_async_engine(DATABASE_URL, echo=True)
+DB_INIT_MODE = os.getenv("CATALOG_DB_INIT_MODE", "migrate").lower()
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+def _env_flag(name: str, default: bool) -> bool:
+    return os.getenv(name, str(default)).strip().lower() in ("1", "true", "yes", "on")
+
+def _engine_options(url: str) -> dict:
+    options: dict = {"echo": _env_flag("DB_ECHO", False)}
+    if make_url(url).get_backend_name() == "sqlite":
+        # SQLite picks its own pool (StaticPool for :memory:); leave it alone.
+        return options
+    # Each worker process owns a pool, so split the connection budget evenly.
+    workers = max(int(os.getenv("WEB_CONCURRENCY", "1")), 1)
+    max_connections = int(os.getenv("DB_MAX_CONNECTIONS", "40"))
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=int(os.getenv("DB_POOL_SIZE", str(max(max_connections // workers, 1)))),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "0")),
+        pool_timeout=float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800")),
+        pool_pre_ping=_env_flag("DB_POOL_PRE_PING", True),
+    )
+    return options
+
+engine = create_async_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
+if _env_flag("DB_QUERY_METRICS", False):
+    instrument_engine(engine)
 
 async_session: async_sessionmaker[AsyncSession] = async_sessionmaker(
     bind=engine,
@@ -36,19 +71,79 @@ async def get_db():
         yield session
 
 async def init_db():
-    try:
-        async with engine.begin() as conn:
-            await conn.run_sync(SQLModel.metadata.drop_all)
-            await conn.run_sync(SQLModel.metadata.create_all)
+    """Bring the schema up to date and seed an empty catalog.
 
-        logger.info("Database schema recreated")
+    ``CATALOG_DB_INIT_MODE=migrate`` (default) applies pending alembic
+    revisions only when the database is behind head, verifies the schema and
+    seeds only when the catalog tables are empty, so a warm restart costs a
+    couple of lookups. ``recreate`` drops and rebuilds every table from the
+    models first, which is only meant for throwaway local databases.
+    ``skip`` does nothing; ``app/server.py`` sets it for its workers after
+    initializing the database once itself.
+    """
+    if DB_INIT_MODE == "skip":
+        logger.info("CATALOG_DB_INIT_MODE=skip; leaving schema and data alone")
+        return
+    try:
+        if DB_INIT_MODE == "recreate":
+            await _recreate_schema()
+        else:
+            await _migrate_schema()
+            await _verify_schema()
 
         async with async_session() as session:
-            await seed_db(session)
-        logger.info("Database seeding complete")
+            if await _catalog_is_empty(session):
+                await seed_db(session)
+                logger.info("Database seeding complete")
+            else:
+                logger.info("Catalog already populated; skipping seed")
     except (SQLAlchemyError, DatabaseOperationError) as exc:
         logger.exception("Failed to initialize database")
         raise DatabaseOperationError("Failed to initialize database") from exc
 
+async def _recreate_schema():
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+    logger.info("Database schema recreated")
+
+def _alembic_config() -> Config:
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["configure_logger"] = False
+    return config
+
+async def _migrate_schema():
+    config = _alembic_config()
+    head = ScriptDirectory.from_config(config).get_current_head()
+    async with engine.connect() as conn:
+        current = await conn.run_sync(
+            lambda sync_conn: MigrationContext.configure(sync_conn).get_current_revision()
+        )
+    if current == head:
+        logger.info("Database schema is at head revision %s", head)
+        return
+    logger.info("Upgrading database schema from %s to %s", current, head)
+    # alembic's env.py drives its own event loop, so keep it off this one.
+    await asyncio.to_thread(command.upgrade, config, "head")
+
+async def _verify_schema():
+    async with engine.connect() as conn:
+        existing = await conn.run_sync(lambda sync_conn: set(inspect(sync_conn).get_table_names()))
+    missing = sorted(set(SQLModel.metadata.tables) - existing)
+    if missing:
+        raise DatabaseOperationError(f"Database schema is missing tables: {', '.join(missing)}")
+    logger.info("Database schema verified")
+
+async def _catalog_is_empty(session: AsyncSession) -> bool:
+    stmt = select(
+        or_(
+            exists().where(CatalogBrand.id.is_not(None)),
+            exists().where(CatalogType.id.is_not(None)),
+            exists().where(CatalogItem.id.is_not(None)),
+        )
+    )
+    result = await session.execute(stmt)
+    return not result.scalar_one()
+
 if __name__ == "__main__":
     asyncio.run(init_db())
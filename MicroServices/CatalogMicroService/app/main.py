@@ -6,10 +6,13 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.error_handlers import register_exception_handlers
 from app.core.logging import configure_logging
+from app.core.metrics import PrometheusMiddleware, mark_worker_stopped
 from app.database import init_db
 from app.routers.catalog_brand_router import router as catalog_brand_router
 from app.routers.catalog_item_router import router as catalog_item_router
 from app.routers.catalog_type_router import router as catalog_type_router
+from app.routers.diagnostics_router import router as diagnostics_router
+from app.routers.metrics_router import router as metrics_router
 
 configure_logging()
 logger = logging.getLogger("catalog.app")
@@ -20,10 +23,12 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("Database ready")
     yield
+    mark_worker_stopped()
     logger.info("Application shutdown complete")
 
 app = FastAPI(title="Catalog Microservice", lifespan=lifespan)
 register_exception_handlers(app)
+app.add_middleware(PrometheusMiddleware)
 
 # app.add_middleware(
 #     CORSMiddleware,
@@ -35,4 +40,6 @@ register_exception_handlers(app)
 
 app.include_router(catalog_item_router)
 app.include_router(catalog_brand_router)
-app.include_router(catalog_type_router)
\ No newline at end of file
+app.include_router(catalog_type_router)
+app.include_router(diagnostics_router)
+app.include_router(metrics_router)
\ No newline at end of file
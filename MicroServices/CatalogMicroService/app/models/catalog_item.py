@@ -1,12 +1,36 @@
 from sqlmodel import Field, Relationship, SQLModel
-from sqlalchemy import DECIMAL, Column
+from sqlalchemy import DDL, DECIMAL, Column, Index, event, text
 from typing import Optional
 from datetime import datetime
 from app.models.catalog_type import CatalogType
 from app.models.catalog_brand import CatalogBrand
 
+# Weighted search document over name (A) and description (B). Queries must use
+# this exact expression for Postgres to match it against the GIN index.
+CATALOG_ITEM_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+# SQLite keeps an external-content FTS5 index over the same two columns.
+CATALOG_ITEM_FTS_TABLE = "catalogitem_fts"
+
 
 class CatalogItem(SQLModel, table=True):
+    # Mirrors alembic revisions 0979b5f29407, 51ac70640363, 8c2f4e1d9a07 and
+    # e5b71c3a2f94; keep them in sync.
+    __table_args__ = (
+        Index("ix_catalogitem_brand_id_id", "catalog_brand_id", "id"),
+        Index("ix_catalogitem_type_id_id", "catalog_type_id", "id"),
+        Index("ix_catalogitem_brand_id_type_id_id", "catalog_brand_id", "catalog_type_id", "id"),
+        Index("ux_catalogitem_name", "name", unique=True),
+        Index("ix_catalogitem_price_id", "price", "id"),
+        Index(
+            "ix_catalogitem_search",
+            text(f"({CATALOG_ITEM_SEARCH_VECTOR})"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
+
     id: int = Field(default=None, primary_key=True)
 
     name: str = Field(max_length=50, nullable=False)
@@ -42,3 +66,29 @@ class CatalogItem(SQLModel, table=True):
             self.picture_uri = ""
             return
         self.picture_uri = f"images/products/{picture_name}?{datetime.now().timestamp()}"
+
+
+_SQLITE_SEARCH_DDL = (
+    f"CREATE VIRTUAL TABLE {CATALOG_ITEM_FTS_TABLE} USING fts5("
+    "name, description, content='catalogitem', content_rowid='id', "
+    "tokenize='porter unicode61 remove_diacritics 2', prefix='2 3')",
+    f"CREATE TRIGGER catalogitem_fts_ai AFTER INSERT ON catalogitem BEGIN "
+    f"INSERT INTO {CATALOG_ITEM_FTS_TABLE}(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+    f"CREATE TRIGGER catalogitem_fts_ad AFTER DELETE ON catalogitem BEGIN "
+    f"INSERT INTO {CATALOG_ITEM_FTS_TABLE}({CATALOG_ITEM_FTS_TABLE}, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); END",
+    f"CREATE TRIGGER catalogitem_fts_au AFTER UPDATE OF name, description ON catalogitem BEGIN "
+    f"INSERT INTO {CATALOG_ITEM_FTS_TABLE}({CATALOG_ITEM_FTS_TABLE}, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    f"INSERT INTO {CATALOG_ITEM_FTS_TABLE}(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+)
+
+for _statement in _SQLITE_SEARCH_DDL:
+    event.listen(CatalogItem.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    CatalogItem.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {CATALOG_ITEM_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
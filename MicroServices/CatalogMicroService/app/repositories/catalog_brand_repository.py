@@ -1,15 +1,24 @@
 import logging
+import os
 from typing import Sequence
 
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.core.exceptions import DatabaseOperationError
+from app.core.snapshot import SnapshotCache
 from app.models.catalog_brand import CatalogBrand
 
 logger = logging.getLogger(__name__)
 
+# Serialized GET /brands response; dropped whenever brands change.
+catalog_brand_snapshot = SnapshotCache(
+    "catalog_brands",
+    ttl_seconds=float(os.getenv("CATALOG_LOOKUP_SNAPSHOT_TTL_SECONDS", "300")),
+)
+
 class CatalogBrandRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -40,16 +49,18 @@ class CatalogBrandRepository:
         return brands
 
     async def add(self, catalog_brand: CatalogBrand) -> CatalogBrand:
-        self.session.add(catalog_brand)
+        stmt = insert(CatalogBrand).values(brand=catalog_brand.brand).returning(CatalogBrand)
         try:
+            result = await self.session.execute(stmt)
+            created = result.scalar_one()
             await self.session.commit()
-            await self.session.refresh(catalog_brand)
         except SQLAlchemyError as exc:
             await self.session.rollback()
             logger.exception("Failed to create catalog brand")
             raise DatabaseOperationError("Failed to create catalog brand") from exc
-        logger.info("Catalog brand %s created", catalog_brand.id)
-        return catalog_brand
+        catalog_brand_snapshot.invalidate()
+        logger.info("Catalog brand %s created", created.id)
+        return created
 
     async def delete(self, brand_id: int) -> None:
         catalog_brand = await self.get_by_id(brand_id)
@@ -61,6 +72,7 @@ class CatalogBrandRepository:
                 await self.session.rollback()
                 logger.exception("Failed to delete catalog brand %s", brand_id)
                 raise DatabaseOperationError("Failed to delete catalog brand") from exc
+            catalog_brand_snapshot.invalidate()
             logger.info("Catalog brand %s deleted", brand_id)
         else:
             logger.warning("Catalog brand %s could not be deleted because it does not exist", brand_id)
\ No newline at end of file
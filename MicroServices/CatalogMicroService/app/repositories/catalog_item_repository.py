@@ -1,21 +1,192 @@
 import logging
-from typing import Sequence
+import os
+from decimal import Decimal
+from typing import Any, AsyncIterator, Sequence
 
-from sqlalchemy import func
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import Float, cast, column, func, insert, literal_column, table, tuple_, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 from sqlmodel import select
 
-from app.core.exceptions import DatabaseOperationError
-from app.models.catalog_item import CatalogItem
+from app.core.cache import TTLCache
+from app.core.exceptions import ConflictError, DatabaseOperationError
+from app.core.search import fts5_match_expression, tsquery_expression
+from app.models.catalog_item import (
+    CATALOG_ITEM_FTS_TABLE,
+    CATALOG_ITEM_SEARCH_VECTOR,
+    CatalogItem,
+)
 
 logger = logging.getLogger(__name__)
 
+# Process-wide read-through cache of catalog item column values keyed by id.
+# Writes made through the repository refresh or drop entries; writes made by
+# other workers become visible once their entries expire.
+catalog_item_cache: TTLCache[dict[str, Any]] = TTLCache(
+    "catalog_item",
+    max_size=int(os.getenv("CATALOG_ITEM_CACHE_SIZE", "1024")),
+    ttl_seconds=float(os.getenv("CATALOG_ITEM_CACHE_TTL_SECONDS", "30")),
+)
+
+# Per-(brand, type) item counts backing count_catalog_items; invalidated on
+# every write so the aggregate is rebuilt with a single grouped query.
+catalog_item_count_cache: TTLCache[dict[tuple[int, int], int]] = TTLCache(
+    "catalog_item_counts",
+    max_size=1,
+    ttl_seconds=float(os.getenv("CATALOG_ITEM_COUNT_CACHE_TTL_SECONDS", "30")),
+)
+_COUNTS_KEY = "all"
+
+_CATALOG_ITEM_COLUMNS = tuple(column.key for column in CatalogItem.__table__.columns)
+
+# asyncpg accepts at most 32767 bind parameters per statement and SQLite
+# (3.32+) 32766; bulk_upsert splits its rows to stay under both.
+MAX_BIND_PARAMETERS = 32766
+
+# Plain-row projection for read paths that serialize straight to JSON. Price is
+# cast so drivers hand back a float (the DTO type) instead of a Decimal.
+_ROW_COLUMNS = (
+    CatalogItem.id,
+    CatalogItem.name,
+    CatalogItem.description,
+    cast(CatalogItem.price, Float).label("price"),
+    CatalogItem.picture_uri,
+    CatalogItem.catalog_type_id,
+    CatalogItem.catalog_brand_id,
+)
+_ROW_KEYS = tuple(column.key for column in _ROW_COLUMNS)
+
+
+def _select_items(as_rows: bool):
+    return select(*_ROW_COLUMNS) if as_rows else select(CatalogItem)
+
+
+def _items_from_rows(rows, as_rows: bool) -> list:
+    """Entities, or column dicts when ``as_rows``; trailing extra columns are dropped."""
+    if as_rows:
+        return [{key: row[index] for index, key in enumerate(_ROW_KEYS)} for row in rows]
+    return [row[0] for row in rows]
+
+
+def _apply_filters(
+    stmt,
+    brand_id: int | None,
+    type_id: int | None,
+    min_price: Decimal | None = None,
+    max_price: Decimal | None = None,
+):
+    if brand_id is not None:
+        stmt = stmt.where(CatalogItem.catalog_brand_id == brand_id)
+    if type_id is not None:
+        stmt = stmt.where(CatalogItem.catalog_type_id == type_id)
+    if min_price is not None:
+        stmt = stmt.where(CatalogItem.price >= min_price)
+    if max_price is not None:
+        stmt = stmt.where(CatalogItem.price <= max_price)
+    return stmt
+
+
+# Listing sort keys. Each key is unique - price is tie-broken on id, names are
+# unique already - so the order is total and keyset cursors never skip or
+# repeat rows. ix_catalogitem_price_id and ux_catalogitem_name serve them.
+SORT_KEYS = {
+    "id": (CatalogItem.id,),
+    "price": (CatalogItem.price, CatalogItem.id),
+    "name": (CatalogItem.name,),
+}
+
+
+def _apply_ordering(
+    stmt,
+    order_by: str,
+    descending: bool,
+    after_id: int | None = None,
+    after_value: Any = None,
+):
+    """Order by ``order_by`` and, given the last row seen, seek past it."""
+    keys = SORT_KEYS[order_by]
+    if after_id is not None:
+        position = tuple(after_id if key.key == "id" else after_value for key in keys)
+        if len(keys) == 1:
+            key, position = keys[0], position[0]
+        else:
+            key = tuple_(*keys)
+        stmt = stmt.where(key < position if descending else key > position)
+    return stmt.order_by(*(key.desc() if descending else key for key in keys))
+
+
+def _upsert_statement(dialect_name: str, rows: Sequence[dict[str, Any]], update_existing: bool):
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise DatabaseOperationError(f"Bulk upsert is not supported on {dialect_name}")
+    stmt = insert(CatalogItem.__table__).values(list(rows))
+    if not update_existing:
+        return stmt.on_conflict_do_nothing(index_elements=["name"])
+    updated = {key: stmt.excluded[key] for key in rows[0] if key not in ("id", "name")}
+    return stmt.on_conflict_do_update(index_elements=["name"], set_=updated)
+
+
+def _search_statement(dialect_name: str, terms: Sequence[str], base):
+    """Narrow ``base`` to items matching every term, best match first."""
+    if dialect_name == "postgresql":
+        vector = literal_column(f"({CATALOG_ITEM_SEARCH_VECTOR})")
+        query = func.to_tsquery(literal_column("'english'"), tsquery_expression(terms))
+        rank = func.ts_rank_cd(vector, query)
+        return (
+            base
+            .where(vector.op("@@")(query))
+            .order_by(rank.desc(), CatalogItem.id)
+        )
+    if dialect_name == "sqlite":
+        fts = table(CATALOG_ITEM_FTS_TABLE, column("rowid"))
+        fts_ref = literal_column(CATALOG_ITEM_FTS_TABLE)
+        # bm25() only works in the query that runs MATCH, so rank inside the FTS
+        # lookup. Scores are negative, lower is better; a name hit outweighs a
+        # description hit.
+        matches = (
+            select(fts.c.rowid, func.bm25(fts_ref, 10.0, 1.0).label("rank"))
+            .where(fts_ref.op("MATCH")(fts5_match_expression(terms)))
+            .subquery("matches")
+        )
+        return (
+            base
+            .join(matches, matches.c.rowid == CatalogItem.id)
+            .order_by(matches.c.rank, CatalogItem.id)
+        )
+    raise DatabaseOperationError(f"Search is not supported on {dialect_name}")
+
+
+def _snapshot(item: CatalogItem) -> dict[str, Any]:
+    return {key: getattr(item, key) for key in _CATALOG_ITEM_COLUMNS}
+
+
+def _is_duplicate_name(exc: IntegrityError) -> bool:
+    # PostgreSQL reports the index name, SQLite the column.
+    message = str(exc.orig)
+    return "ux_catalogitem_name" in message or "catalogitem.name" in message
+
+
 class CatalogItemRepository:
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        cache: TTLCache[dict[str, Any]] | None = None,
+        count_cache: TTLCache[dict[tuple[int, int], int]] | None = None,
+    ):
         self.db = db
+        self.cache = catalog_item_cache if cache is None else cache
+        self.count_cache = catalog_item_count_cache if count_cache is None else count_cache
 
     async def get_by_id(self, id: int) -> CatalogItem | None:
+        cached = self.cache.get(id)
+        if cached is not None:
+            logger.debug("Catalog item %s served from cache", id)
+            return await self._attach(cached)
+
         try:
             item = await self.db.get(CatalogItem, id)
         except SQLAlchemyError as exc:
@@ -23,11 +194,54 @@ class CatalogItemRepository:
             raise DatabaseOperationError("Failed to load catalog item") from exc
 
         if item:
+            self.cache.set(id, _snapshot(item))
             logger.debug("Catalog item %s loaded", id)
         else:
             logger.debug("Catalog item %s not found", id)
         return item
 
+    async def get_many(self, ids: Sequence[int]) -> list[CatalogItem]:
+        """Load several items in request order; unknown ids are left out.
+
+        Ids found in the cache are served from it and the rest are fetched with
+        a single ``WHERE id IN (...)`` query. Duplicate ids are returned once.
+        """
+        requested = list(dict.fromkeys(ids))
+        found: dict[int, CatalogItem] = {}
+        missing: list[int] = []
+        for item_id in requested:
+            cached = self.cache.get(item_id)
+            if cached is None:
+                missing.append(item_id)
+            else:
+                found[item_id] = await self._attach(cached)
+
+        if missing:
+            stmt = select(CatalogItem).where(CatalogItem.id.in_(missing))
+            try:
+                result = await self.db.execute(stmt)
+            except SQLAlchemyError as exc:
+                logger.exception("Failed to load catalog items %s", missing)
+                raise DatabaseOperationError("Failed to load catalog items") from exc
+            for item in result.scalars():
+                self.cache.set(item.id, _snapshot(item))
+                found[item.id] = item
+
+        logger.debug(
+            "Loaded %s of %s catalog items (%s from cache)",
+            len(found),
+            len(requested),
+            len(requested) - len(missing),
+        )
+        return [found[item_id] for item_id in requested if item_id in found]
+
+    async def _attach(self, values: dict[str, Any]) -> CatalogItem:
+        # Rebuild the row as a persistent instance without issuing a SELECT so
+        # callers can still modify or delete what they got from the cache.
+        item = CatalogItem(**values)
+        make_transient_to_detached(item)
+        return await self.db.merge(item, load=False)
+
     async def list_catalog_items(
         self,
         skip: int = 0,
@@ -35,40 +249,225 @@ class CatalogItemRepository:
         brand_id: int | None = None,
         type_id: int | None = None,
         db: AsyncSession | None = None,
-    ) -> Sequence[CatalogItem]:
+        after_id: int | None = None,
+        as_rows: bool = False,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+        after_value: Any = None,
+    ) -> Sequence[CatalogItem] | Sequence[dict[str, Any]]:
+        """List items ordered by ``order_by`` (a :data:`SORT_KEYS` name).
+
+        Passing ``after_id`` (plus ``after_value``, the last row's sort value,
+        when not ordering by id) switches from ``OFFSET`` paging to a keyset
+        seek: with the brand/type filters being equalities, ``id > after_id``
+        walks the (brand, id) / (type, id) index order directly and ``skip`` is
+        ignored. With ``as_rows`` the page is plain column dicts instead of
+        entities, skipping identity-map and ORM instance construction.
+        """
         session = db or self.db
-        stmt = select(CatalogItem)
-        if brand_id is not None:
-            stmt = stmt.where(CatalogItem.catalog_brand_id == brand_id)
-        if type_id is not None:
-            stmt = stmt.where(CatalogItem.catalog_type_id == type_id)
-        stmt = stmt.offset(skip).limit(take)
+        stmt = _apply_filters(_select_items(as_rows), brand_id, type_id, min_price, max_price)
+        stmt = _apply_ordering(stmt, order_by, descending, after_id, after_value)
+        if after_id is None:
+            stmt = stmt.offset(skip)
+        stmt = stmt.limit(take)
         try:
             result = await session.execute(stmt)
         except SQLAlchemyError as exc:
             logger.exception("Failed to list catalog items")
             raise DatabaseOperationError("Failed to list catalog items") from exc
         logger.debug(
-            "Listing catalog items skip=%s take=%s brand_id=%s type_id=%s",
+            "Listing catalog items skip=%s take=%s after_id=%s brand_id=%s type_id=%s "
+            "price=[%s, %s] order_by=%s descending=%s",
+            skip,
+            take,
+            after_id,
+            brand_id,
+            type_id,
+            min_price,
+            max_price,
+            order_by,
+            descending,
+        )
+        return _items_from_rows(result.all(), as_rows)
+
+    async def list_catalog_items_with_total(
+        self,
+        skip: int = 0,
+        take: int = 10,
+        brand_id: int | None = None,
+        type_id: int | None = None,
+        as_rows: bool = False,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> tuple[Sequence[CatalogItem] | Sequence[dict[str, Any]], int]:
+        """Fetch an offset page together with the filtered total in one query.
+
+        ``COUNT(*) OVER ()`` is evaluated before ``LIMIT``, so every returned row
+        carries the size of the whole filtered set. Only when the page is empty
+        does this fall back to :meth:`count_catalog_items`.
+        """
+        stmt = _apply_filters(
+            _select_items(as_rows).add_columns(func.count().over().label("total")),
+            brand_id,
+            type_id,
+            min_price,
+            max_price,
+        )
+        stmt = _apply_ordering(stmt, order_by, descending).offset(skip).limit(take)
+        try:
+            result = await self.db.execute(stmt)
+        except SQLAlchemyError as exc:
+            logger.exception("Failed to list catalog items")
+            raise DatabaseOperationError("Failed to list catalog items") from exc
+        rows = result.all()
+        if not rows:
+            total = await self.count_catalog_items(
+                brand_id, type_id, min_price=min_price, max_price=max_price
+            )
+            return [], total
+        logger.debug(
+            "Listing catalog items with total skip=%s take=%s brand_id=%s type_id=%s",
+            skip,
+            take,
+            brand_id,
+            type_id,
+        )
+        return _items_from_rows(rows, as_rows), rows[0].total
+
+    async def search_catalog_items(
+        self,
+        terms: Sequence[str],
+        skip: int = 0,
+        take: int = 10,
+        brand_id: int | None = None,
+        type_id: int | None = None,
+        as_rows: bool = False,
+    ) -> tuple[Sequence[CatalogItem] | Sequence[dict[str, Any]], int]:
+        """Rank items whose name or description match every term as a prefix.
+
+        Matching is answered by the full-text index (a GIN index over a
+        weighted ``tsvector`` on Postgres, an FTS5 table on SQLite) and the
+        page carries the total number of matches, as in
+        :meth:`list_catalog_items_with_total`.
+        """
+        stmt = _search_statement(self.db.get_bind().dialect.name, terms, _select_items(as_rows))
+        stmt = _apply_filters(stmt, brand_id, type_id)
+        paged = stmt.add_columns(func.count().over().label("total")).offset(skip).limit(take)
+        try:
+            rows = (await self.db.execute(paged)).all()
+            if rows:
+                total = rows[0].total
+            elif skip > 0:
+                counted = select(func.count()).select_from(stmt.order_by(None).subquery())
+                total = (await self.db.execute(counted)).scalar_one()
+            else:
+                total = 0
+        except SQLAlchemyError as exc:
+            logger.exception("Failed to search catalog items")
+            raise DatabaseOperationError("Failed to search catalog items") from exc
+        logger.debug(
+            "Searched catalog items terms=%s skip=%s take=%s brand_id=%s type_id=%s total=%s",
+            terms,
             skip,
             take,
             brand_id,
             type_id,
+            total,
         )
-        return result.scalars().all()
+        return _items_from_rows(rows, as_rows), total
+
+    async def stream_catalog_items(
+        self,
+        brand_id: int | None = None,
+        type_id: int | None = None,
+        batch_size: int = 500,
+        as_rows: bool = False,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> AsyncIterator[Sequence[CatalogItem] | Sequence[dict[str, Any]]]:
+        """Yield every matching item in listing order, ``batch_size`` rows at a time.
+
+        Rows are read through a server-side cursor, so memory use is bounded by
+        the batch size rather than by the size of the catalog.
+        """
+        stmt = _apply_filters(_select_items(as_rows), brand_id, type_id, min_price, max_price)
+        stmt = _apply_ordering(stmt, order_by, descending).execution_options(yield_per=batch_size)
+        try:
+            result = await self.db.stream(stmt)
+            async for batch in result.partitions(batch_size):
+                yield _items_from_rows(batch, as_rows)
+        except SQLAlchemyError as exc:
+            logger.exception("Failed to stream catalog items")
+            raise DatabaseOperationError("Failed to stream catalog items") from exc
+        logger.debug("Streamed catalog items brand_id=%s type_id=%s", brand_id, type_id)
 
     async def count_catalog_items(
         self,
         brand_id: int | None = None,
         type_id: int | None = None,
         db: AsyncSession | None = None,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
     ) -> int:
+        """Count items matching the filters.
+
+        Counts are answered from a cached ``GROUP BY brand, type`` aggregate that
+        is tiny (brands x types rows) and dropped by every write through this
+        repository, so a listing normally costs no counting query at all. Price
+        ranges are not covered by the aggregate and are always counted exactly.
+        """
         session = db or self.db
-        stmt = select(func.count()).select_from(CatalogItem)
-        if brand_id is not None:
-            stmt = stmt.where(CatalogItem.catalog_brand_id == brand_id)
-        if type_id is not None:
-            stmt = stmt.where(CatalogItem.catalog_type_id == type_id)
+        if not self.count_cache.enabled or min_price is not None or max_price is not None:
+            return await self._count_exact(session, brand_id, type_id, min_price, max_price)
+
+        counts = self.count_cache.get(_COUNTS_KEY)
+        if counts is None:
+            counts = await self._load_counts(session)
+            self.count_cache.set(_COUNTS_KEY, counts)
+        count = sum(
+            n
+            for (item_brand_id, item_type_id), n in counts.items()
+            if (brand_id is None or item_brand_id == brand_id)
+            and (type_id is None or item_type_id == type_id)
+        )
+        logger.debug(
+            "Counted %s catalog items for brand_id=%s type_id=%s",
+            count,
+            brand_id,
+            type_id,
+        )
+        return count
+
+    async def _load_counts(self, session: AsyncSession) -> dict[tuple[int, int], int]:
+        stmt = select(
+            CatalogItem.catalog_brand_id, CatalogItem.catalog_type_id, func.count()
+        ).group_by(CatalogItem.catalog_brand_id, CatalogItem.catalog_type_id)
+        try:
+            result = await session.execute(stmt)
+        except SQLAlchemyError as exc:
+            logger.exception("Failed to count catalog items")
+            raise DatabaseOperationError("Failed to count catalog items") from exc
+        counts = {(brand_id, type_id): n for brand_id, type_id, n in result.all()}
+        logger.debug("Loaded catalog item counts for %s brand/type pairs", len(counts))
+        return counts
+
+    async def _count_exact(
+        self,
+        session: AsyncSession,
+        brand_id: int | None,
+        type_id: int | None,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
+    ) -> int:
+        stmt = _apply_filters(
+            select(func.count()).select_from(CatalogItem), brand_id, type_id, min_price, max_price
+        )
         try:
             result = await session.execute(stmt)
         except SQLAlchemyError as exc:
@@ -83,30 +482,94 @@ class CatalogItemRepository:
         )
         return count
 
+    async def bulk_upsert(
+        self, rows: Sequence[dict[str, Any]], update_existing: bool = True
+    ) -> None:
+        """Write ``rows`` with multi-row ``INSERT ... ON CONFLICT (name)`` statements.
+
+        Existing items with the same name are updated in place, or left alone
+        when ``update_existing`` is false. Rows are split into as few
+        statements as ``MAX_BIND_PARAMETERS`` allows, and the batch is
+        committed once on success.
+        """
+        # One statement may not touch the same conflicting row twice; last row wins.
+        rows = list({row["name"]: row for row in rows}.values())
+        if not rows:
+            return
+        dialect_name = self.db.get_bind().dialect.name
+        rows_per_statement = max(MAX_BIND_PARAMETERS // len(rows[0]), 1)
+        try:
+            for start in range(0, len(rows), rows_per_statement):
+                chunk = rows[start:start + rows_per_statement]
+                await self.db.execute(_upsert_statement(dialect_name, chunk, update_existing))
+            await self.db.commit()
+        except SQLAlchemyError as exc:
+            await self.db.rollback()
+            logger.exception("Failed to upsert %s catalog items", len(rows))
+            raise DatabaseOperationError("Failed to import catalog items") from exc
+        self.cache.clear()
+        self.count_cache.clear()
+        logger.debug("Upserted %s catalog items", len(rows))
+
     async def add(self, item: CatalogItem) -> CatalogItem:
-        self.db.add(item)
+        """Insert ``item`` and return the stored row from the same ``INSERT ... RETURNING``."""
+        stmt = (
+            insert(CatalogItem)
+            .values(**item.model_dump(exclude={"id"} if item.id is None else None))
+            .returning(CatalogItem)
+        )
         try:
+            result = await self.db.execute(stmt)
+            created = result.scalar_one()
             await self.db.commit()
-            await self.db.refresh(item)
+        except IntegrityError as exc:
+            await self.db.rollback()
+            if not _is_duplicate_name(exc):
+                logger.exception("Failed to create catalog item")
+                raise DatabaseOperationError("Failed to create catalog item") from exc
+            raise ConflictError(f"A catalog item named '{item.name}' already exists") from exc
         except SQLAlchemyError as exc:
             await self.db.rollback()
             logger.exception("Failed to create catalog item")
             raise DatabaseOperationError("Failed to create catalog item") from exc
-        logger.info("Catalog item %s created", item.id)
-        return item
+        self.cache.set(created.id, _snapshot(created))
+        self.count_cache.clear()
+        logger.info("Catalog item %s created", created.id)
+        return created
 
-    async def update(self, item: CatalogItem) -> CatalogItem:
+    async def update_by_id(self, item_id: int, values: dict[str, Any]) -> CatalogItem | None:
+        """Apply ``values`` with one ``UPDATE ... RETURNING``; ``None`` when no row matched."""
+        stmt = (
+            update(CatalogItem)
+            .where(CatalogItem.id == item_id)
+            .values(**values)
+            .returning(CatalogItem)
+        )
         try:
+            result = await self.db.execute(stmt)
+            updated = result.scalar_one_or_none()
             await self.db.commit()
-            await self.db.refresh(item)
+        except IntegrityError as exc:
+            await self.db.rollback()
+            if not _is_duplicate_name(exc):
+                logger.exception("Failed to update catalog item %s", item_id)
+                raise DatabaseOperationError("Failed to update catalog item") from exc
+            raise ConflictError(f"A catalog item named '{values.get('name')}' already exists") from exc
         except SQLAlchemyError as exc:
             await self.db.rollback()
-            logger.exception("Failed to update catalog item %s", item.id)
+            self.cache.invalidate(item_id)
+            logger.exception("Failed to update catalog item %s", item_id)
             raise DatabaseOperationError("Failed to update catalog item") from exc
-        logger.info("Catalog item %s updated", item.id)
-        return item
+        if updated is None:
+            logger.debug("Catalog item %s not found for update", item_id)
+            return None
+        self.cache.set(item_id, _snapshot(updated))
+        self.count_cache.clear()
+        logger.info("Catalog item %s updated", item_id)
+        return updated
 
     async def delete(self, item: CatalogItem) -> None:
+        self.cache.invalidate(item.id)
         try:
             await self.db.delete(item)
             await self.db.commit()
@@ -114,4 +577,5 @@ class CatalogItemRepository:
             await self.db.rollback()
             logger.exception("Failed to delete catalog item %s", item.id)
             raise DatabaseOperationError("Failed to delete catalog item") from exc
+        self.count_cache.clear()
         logger.info("Catalog item %s deleted", item.id)
\ No newline at end of file
@@ -1,14 +1,23 @@
 import logging
+import os
 
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.core.exceptions import DatabaseOperationError
+from app.core.snapshot import SnapshotCache
 from app.models.catalog_type import CatalogType
 
 logger = logging.getLogger(__name__)
 
+# Serialized GET /types response; dropped whenever types change.
+catalog_type_snapshot = SnapshotCache(
+    "catalog_types",
+    ttl_seconds=float(os.getenv("CATALOG_LOOKUP_SNAPSHOT_TTL_SECONDS", "300")),
+)
+
 class CatalogTypeRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -39,16 +48,18 @@ class CatalogTypeRepository:
         return catalog_types
 
     async def add(self, catalog_type: CatalogType) -> CatalogType:
-        self.session.add(catalog_type)
+        stmt = insert(CatalogType).values(type=catalog_type.type).returning(CatalogType)
         try:
+            result = await self.session.execute(stmt)
+            created = result.scalar_one()
             await self.session.commit()
-            await self.session.refresh(catalog_type)
         except SQLAlchemyError as exc:
             await self.session.rollback()
             logger.exception("Failed to create catalog type")
             raise DatabaseOperationError("Failed to create catalog type") from exc
-        logger.info("Catalog type %s created", catalog_type.id)
-        return catalog_type
+        catalog_type_snapshot.invalidate()
+        logger.info("Catalog type %s created", created.id)
+        return created
 
     async def delete(self, type_id: int) -> None:
         catalog_type = await self.get_by_id(type_id)
@@ -60,6 +71,7 @@ class CatalogTypeRepository:
                 await self.session.rollback()
                 logger.exception("Failed to delete catalog type %s", type_id)
                 raise DatabaseOperationError("Failed to delete catalog type") from exc
+            catalog_type_snapshot.invalidate()
             logger.info("Catalog type %s deleted", type_id)
         else:
             logger.warning("Catalog type %s could not be deleted because it does not exist", type_id)
\ No newline at end of file
@@ -1,20 +1,33 @@
 import logging
+import os
 from typing import List
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.snapshot import Snapshot, snapshot_response
 from app.database import get_db
 from app.dto.catalog_brand_dto import CatalogBrandDTO
-from app.repositories.catalog_brand_repository import CatalogBrandRepository
+from app.repositories.catalog_brand_repository import CatalogBrandRepository, catalog_brand_snapshot
 
 router = APIRouter(prefix="/brands", tags=["catalog-brands"])
 
 logger = logging.getLogger("catalog.router.brands")
 
+LOOKUP_MAX_AGE_SECONDS = int(os.getenv("CATALOG_LOOKUP_MAX_AGE_SECONDS", "60"))
+
+_brand_list_adapter = TypeAdapter(List[CatalogBrandDTO])
+
 @router.get("", response_model=List[CatalogBrandDTO])
-async def read_brands(db: AsyncSession = Depends(get_db)):
-    repo = CatalogBrandRepository(db)
-    items = await repo.list_all()
-    logger.info("Returning %s catalog brands", len(items))
-    return [CatalogBrandDTO.model_validate(item) for item in items]
\ No newline at end of file
+async def read_brands(request: Request, db: AsyncSession = Depends(get_db)):
+    snapshot = catalog_brand_snapshot.get()
+    if snapshot is None:
+        repo = CatalogBrandRepository(db)
+        items = await repo.list_all()
+        logger.info("Rebuilding catalog brands snapshot from %s rows", len(items))
+        snapshot = Snapshot.from_body(
+            _brand_list_adapter.dump_json([CatalogBrandDTO.model_validate(item) for item in items])
+        )
+        catalog_brand_snapshot.set(snapshot)
+    return snapshot_response(request, snapshot, LOOKUP_MAX_AGE_SECONDS)
\ No newline at end of file
@@ -1,19 +1,85 @@
 import logging
-from typing import Optional
+import os
+from decimal import Decimal, InvalidOperation
+from typing import Any, AsyncIterator, List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app import seeder
+from app.core.exceptions import BadRequestError
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.search import parse_search_terms
 from app.database import get_db
 from app.dto.catalog_item_dto import CatalogItemDTO
 from app.repositories.catalog_item_repository import CatalogItemRepository
+from app.schemas.catalog_items_batch_request import CatalogItemsBatchRequest
 from app.schemas.delete_catalog_item_response import DeleteCatalogItemResponse
-from app.schemas.list_paged_catalog_item_response import ListPagedCatalogItemResponse
+from app.schemas.import_catalog_items_response import ImportCatalogItemsResponse
+from app.schemas.list_paged_catalog_item_response import (
+    CatalogItemRow,
+    ListPagedCatalogItemPage,
+    ListPagedCatalogItemResponse,
+)
 
 router = APIRouter(prefix="/items", tags=["catalog-items"])
 
 logger = logging.getLogger("catalog.router.items")
 
+# "cached" answers page_count from the repository's cached per-(brand, type)
+# counts; "window" fetches offset pages and their total in a single query.
+COUNT_STRATEGY = os.getenv("CATALOG_ITEM_COUNT_STRATEGY", "cached").lower()
+STREAM_BATCH_SIZE = int(os.getenv("CATALOG_ITEM_STREAM_BATCH_SIZE", "500"))
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+IMPORT_CONTENT_TYPES = {"text/csv": "csv", NDJSON_MEDIA_TYPE: "ndjson", "application/jsonl": "ndjson"}
+BATCH_MAX_IDS = int(os.getenv("CATALOG_BATCH_MAX_IDS", "100"))
+IMPORT_MAX_BATCH_SIZE = int(os.getenv("CATALOG_IMPORT_MAX_BATCH_SIZE", "10000"))
+
+# List and search responses are encoded straight from the repository's plain
+# rows; the response_model on those routes only documents the shape.
+_page_adapter = TypeAdapter(ListPagedCatalogItemPage)
+_rows_adapter = TypeAdapter(List[CatalogItemRow])
+_row_adapter = TypeAdapter(CatalogItemRow)
+
+def _page_response(rows, page_count: int, next_cursor: Optional[str] = None) -> Response:
+    body = _page_adapter.dump_json(
+        {"catalog_items": rows, "page_count": page_count, "next_cursor": next_cursor}
+    )
+    return Response(content=body, media_type="application/json")
+
+@router.get("/search", response_model=ListPagedCatalogItemResponse)
+async def search_catalog_items(
+    q: str,
+    pageSize: int = 10,
+    pageIndex: int = 0,
+    catalogBrandId: Optional[int] = None,
+    catalogTypeId: Optional[int] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    if pageSize < 1 or pageIndex < 0:
+        raise BadRequestError("pageSize must be positive and pageIndex non-negative")
+    terms = parse_search_terms(q)
+    logger.info(
+        "Searching catalog items terms=%s page_size=%s page_index=%s brand_id=%s type_id=%s",
+        terms,
+        pageSize,
+        pageIndex,
+        catalogBrandId,
+        catalogTypeId,
+    )
+    repo = CatalogItemRepository(db)
+    items, total_items = await repo.search_catalog_items(
+        terms,
+        skip=pageIndex * pageSize,
+        take=pageSize,
+        brand_id=catalogBrandId,
+        type_id=catalogTypeId,
+        as_rows=True,
+    )
+    return _page_response(items, (total_items + pageSize - 1) // pageSize)
+
 @router.get("/{catalog_item_id}", response_model=CatalogItemDTO)
 async def get_catalog_item(catalog_item_id: int, db: AsyncSession = Depends(get_db)):
     logger.info("Fetching catalog item %s", catalog_item_id)
@@ -28,52 +94,166 @@ async def get_catalog_item(catalog_item_id: int, db: AsyncSession = Depends(get_
 
 @router.get("", response_model=ListPagedCatalogItemResponse)
 async def list_catalog_items(
+    request: Request,
     pageSize: Optional[int] = None,
     pageIndex: int = 0,
     catalogBrandId: Optional[int] = None,
     catalogTypeId: Optional[int] = None,
+    cursor: Optional[str] = None,
+    minPrice: Optional[Decimal] = None,
+    maxPrice: Optional[Decimal] = None,
+    orderBy: Literal["id", "price", "name"] = "id",
+    orderDirection: Literal["asc", "desc"] = "asc",
     db: AsyncSession = Depends(get_db)
 ):
     repo = CatalogItemRepository(db)
     logger.info(
-        "Listing catalog items page_size=%s page_index=%s brand_id=%s type_id=%s",
+        "Listing catalog items page_size=%s page_index=%s cursor=%s brand_id=%s type_id=%s "
+        "price=[%s, %s] order=%s %s",
         pageSize,
         pageIndex,
+        cursor,
         catalogBrandId,
         catalogTypeId,
+        minPrice,
+        maxPrice,
+        orderBy,
+        orderDirection,
     )
+    if minPrice is not None and maxPrice is not None and minPrice > maxPrice:
+        raise BadRequestError("minPrice must not be greater than maxPrice")
+
+    listing = {
+        "brand_id": catalogBrandId,
+        "type_id": catalogTypeId,
+        "min_price": minPrice,
+        "max_price": maxPrice,
+        "order_by": orderBy,
+        "descending": orderDirection == "desc",
+    }
+    scope = {
+        "brand": catalogBrandId,
+        "type": catalogTypeId,
+        "minPrice": None if minPrice is None else str(minPrice),
+        "maxPrice": None if maxPrice is None else str(maxPrice),
+        "order": f"{orderBy}:{orderDirection}",
+    }
 
-    total_items = await repo.count_catalog_items(catalogBrandId, catalogTypeId)
+    after_id = after_value = carried_total = None
+    if cursor is not None:
+        if pageSize is None:
+            raise BadRequestError("pageSize is required when paging with a cursor")
+        after_id, after_value, carried_total = _decode_item_cursor(cursor, scope)
 
     if pageSize is None:
-        items = await repo.list_catalog_items(
-            skip=0,
-            take=total_items,
-            brand_id=catalogBrandId,
-            type_id=catalogTypeId
+        # "Return everything" is streamed in fixed-size batches instead of
+        # being materialized as one response document.
+        if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+            body = _stream_items_ndjson(repo, listing)
+            media_type = NDJSON_MEDIA_TYPE
+        else:
+            body = _stream_items_json(repo, listing)
+            media_type = "application/json"
+        return StreamingResponse(body, media_type=media_type)
+
+    next_cursor = None
+    # Price ranges are not covered by the cached counts, so count them in the
+    # page query itself. Fetch one extra row to learn whether a next page exists.
+    price_filtered = minPrice is not None or maxPrice is not None
+    if (COUNT_STRATEGY == "window" or price_filtered) and after_id is None:
+        items, total_items = await repo.list_catalog_items_with_total(
+            skip=pageIndex * pageSize,
+            take=pageSize + 1,
+            as_rows=True,
+            **listing,
         )
-        page_count = 1 if total_items > 0 else 0
     else:
+        if price_filtered and carried_total is not None:
+            # Counted once by the first page and carried in the cursor, so
+            # later pages of a price range run no COUNT(*).
+            total_items = carried_total
+        else:
+            total_items = await repo.count_catalog_items(
+                catalogBrandId, catalogTypeId, min_price=minPrice, max_price=maxPrice
+            )
         items = await repo.list_catalog_items(
             skip=pageIndex * pageSize,
-            take=pageSize,
-            brand_id=catalogBrandId,
-            type_id=catalogTypeId
+            take=pageSize + 1,
+            after_id=after_id,
+            after_value=after_value,
+            as_rows=True,
+            **listing,
         )
-        page_count = (total_items + pageSize - 1) // pageSize
+    if len(items) > pageSize:
+        items = items[:pageSize]
+        next_cursor = _encode_item_cursor(items[-1], scope, orderBy, total_items if price_filtered else None)
+    page_count = (total_items + pageSize - 1) // pageSize
 
-    catalog_items = [CatalogItemDTO.model_validate(i) for i in items]
     logger.info(
         "Returning %s catalog items (page_count=%s) from %s total",
-        len(catalog_items),
+        len(items),
         page_count,
         total_items,
     )
 
-    return ListPagedCatalogItemResponse(
-        catalog_items=catalog_items,
-        page_count=page_count
-    )
+    return _page_response(items, page_count, next_cursor)
+
+async def _stream_items_json(repo: CatalogItemRepository, listing: dict) -> AsyncIterator[bytes]:
+    # Same document shape as ListPagedCatalogItemResponse, emitted piecewise.
+    yield b'{"catalog_items":['
+    separator = b""
+    streamed = 0
+    async for batch in repo.stream_catalog_items(batch_size=STREAM_BATCH_SIZE, as_rows=True, **listing):
+        # Drop the enclosing brackets so batches splice into one array.
+        yield separator + _rows_adapter.dump_json(batch)[1:-1]
+        separator = b","
+        streamed += len(batch)
+    page_count = 1 if streamed > 0 else 0
+    yield f'],"page_count":{page_count},"next_cursor":null}}'.encode()
+    logger.info("Streamed %s catalog items as JSON", streamed)
+
+async def _stream_items_ndjson(repo: CatalogItemRepository, listing: dict) -> AsyncIterator[bytes]:
+    streamed = 0
+    async for batch in repo.stream_catalog_items(batch_size=STREAM_BATCH_SIZE, as_rows=True, **listing):
+        yield b"".join(_row_adapter.dump_json(row) + b"\n" for row in batch)
+        streamed += len(batch)
+    logger.info("Streamed %s catalog items as NDJSON", streamed)
+
+def _encode_item_cursor(last_row: dict, scope: dict, order_by: str, total: Optional[int] = None) -> str:
+    position = {"id": last_row["id"], **scope}
+    if total is not None:
+        position["total"] = total
+    if order_by != "id":
+        # Prices travel as strings so the seek compares exact decimals.
+        value = last_row[order_by]
+        position["value"] = str(value) if order_by == "price" else value
+    return encode_cursor(position)
+
+def _decode_item_cursor(cursor: str, scope: dict) -> tuple[int, Any, Optional[int]]:
+    position = decode_cursor(cursor)
+    # A cursor only identifies a position within the filtered, ordered set it
+    # came from. Cursors issued before sorting existed carry no order.
+    defaults = {"order": "id:asc"}
+    if any(position.get(key, defaults.get(key)) != value for key, value in scope.items()):
+        raise BadRequestError("Cursor does not match the requested filters")
+    last_id = position.get("id")
+    if not isinstance(last_id, int):
+        raise BadRequestError("Invalid cursor")
+    total = position.get("total")
+    if total is not None and not isinstance(total, int):
+        raise BadRequestError("Invalid cursor")
+    order_by = scope["order"].split(":")[0]
+    if order_by == "id":
+        return last_id, None, total
+    value = position.get("value")
+    if not isinstance(value, str):
+        raise BadRequestError("Invalid cursor")
+    if order_by == "price":
+        try:
+            return last_id, Decimal(value), total
+        except InvalidOperation as exc:
+            raise BadRequestError("Invalid cursor") from exc
+    return last_id, value, total
 
 @router.post("", response_model=CatalogItemDTO)
 async def create_catalog_item(item: CatalogItemDTO, db: AsyncSession = Depends(get_db)):
@@ -85,20 +265,49 @@ async def create_catalog_item(item: CatalogItemDTO, db: AsyncSession = Depends(g
     logger.info("Catalog item %s created", dto.id)
     return dto
 
+@router.post("/batch", response_model=List[CatalogItemDTO])
+async def get_catalog_items_batch(request: CatalogItemsBatchRequest, db: AsyncSession = Depends(get_db)):
+    if len(request.ids) > BATCH_MAX_IDS:
+        raise BadRequestError(f"At most {BATCH_MAX_IDS} ids can be requested at once")
+    logger.info("Fetching %s catalog items by id", len(request.ids))
+    repo = CatalogItemRepository(db)
+    items = await repo.get_many(request.ids)
+    return [CatalogItemDTO.model_validate(i) for i in items]
+
+@router.post("/import", response_model=ImportCatalogItemsResponse)
+async def import_catalog_items(
+    request: Request,
+    batchSize: int = 1000,
+    db: AsyncSession = Depends(get_db)
+):
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    fmt = IMPORT_CONTENT_TYPES.get(content_type)
+    if fmt is None:
+        raise HTTPException(status_code=415, detail="Send text/csv or application/x-ndjson")
+    if not 1 <= batchSize <= IMPORT_MAX_BATCH_SIZE:
+        raise BadRequestError(f"batchSize must be between 1 and {IMPORT_MAX_BATCH_SIZE}")
+    logger.info("Importing catalog items format=%s batch_size=%s", fmt, batchSize)
+    lines = seeder.iter_text_lines(request.stream())
+    result = await seeder.import_catalog_items(db, lines, fmt, batchSize)
+    return ImportCatalogItemsResponse.model_validate(result)
+
 @router.put("", response_model=CatalogItemDTO)
 async def update_catalog_item(item: CatalogItemDTO, db: AsyncSession = Depends(get_db)):
     logger.info("Updating catalog item %s", item.id)
     repo = CatalogItemRepository(db)
-    existing = await repo.get_by_id(item.id)
-    if not existing:
+    updated_item = await repo.update_by_id(
+        item.id,
+        {
+            "name": item.name,
+            "description": item.description,
+            "price": item.price,
+            "catalog_brand_id": item.catalog_brand_id,
+            "catalog_type_id": item.catalog_type_id,
+        },
+    )
+    if not updated_item:
         logger.warning("Catalog item %s not found for update", item.id)
         raise HTTPException(status_code=404, detail="Catalog item not found")
-    existing.name = item.name
-    existing.description = item.description
-    existing.price = item.price
-    existing.catalog_brand_id = item.catalog_brand_id
-    existing.catalog_type_id = item.catalog_type_id
-    updated_item = await repo.update(existing)
     dto = CatalogItemDTO.model_validate(updated_item)
     return dto
 
@@ -1,23 +1,36 @@
 import logging
+import os
 from typing import List
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.snapshot import Snapshot, snapshot_response
 from app.database import get_db
 from app.dto.catalog_type_dto import CatalogTypeDTO
-from app.repositories.catalog_type_repository import CatalogTypeRepository
+from app.repositories.catalog_type_repository import CatalogTypeRepository, catalog_type_snapshot
 
 router = APIRouter(prefix="/types", tags=["catalog-types"])
 
 logger = logging.getLogger("catalog.router.types")
 
+LOOKUP_MAX_AGE_SECONDS = int(os.getenv("CATALOG_LOOKUP_MAX_AGE_SECONDS", "60"))
+
+_type_list_adapter = TypeAdapter(List[CatalogTypeDTO])
+
 @router.get("", response_model=List[CatalogTypeDTO])
-async def read_types(db: AsyncSession = Depends(get_db)):
-    repo = CatalogTypeRepository(db)
-    items = await repo.list_all()
-    logger.info("Returning %s catalog types", len(items))
-    return [CatalogTypeDTO.model_validate(item) for item in items]
+async def read_types(request: Request, db: AsyncSession = Depends(get_db)):
+    snapshot = catalog_type_snapshot.get()
+    if snapshot is None:
+        repo = CatalogTypeRepository(db)
+        items = await repo.list_all()
+        logger.info("Rebuilding catalog types snapshot from %s rows", len(items))
+        snapshot = Snapshot.from_body(
+            _type_list_adapter.dump_json([CatalogTypeDTO.model_validate(item) for item in items])
+        )
+        catalog_type_snapshot.set(snapshot)
+    return snapshot_response(request, snapshot, LOOKUP_MAX_AGE_SECONDS)
 
 @router.post("", response_model=CatalogTypeDTO)
 async def add_type(type_dto: CatalogTypeDTO, db: AsyncSession = Depends(get_db)):
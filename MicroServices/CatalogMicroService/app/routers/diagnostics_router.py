@@ -0,0 +1,31 @@
+import logging
+from typing import List
+
+from fastapi import APIRouter
+
+from app.core.db_pool import pool_status
+from app.database import engine
+from app.repositories.catalog_brand_repository import catalog_brand_snapshot
+from app.repositories.catalog_item_repository import catalog_item_cache, catalog_item_count_cache
+from app.repositories.catalog_type_repository import catalog_type_snapshot
+from app.schemas.cache_stats_response import CacheStatsResponse
+from app.schemas.pool_stats_response import PoolStatsResponse
+
+router = APIRouter(prefix="/diagnostics", tags=["diagnostics"])
+
+logger = logging.getLogger("catalog.router.diagnostics")
+
+@router.get("/caches", response_model=List[CacheStatsResponse])
+async def read_cache_stats():
+    stats = [
+        catalog_item_cache.stats(),
+        catalog_item_count_cache.stats(),
+        catalog_brand_snapshot.stats(),
+        catalog_type_snapshot.stats(),
+    ]
+    logger.debug("Returning stats for %s caches", len(stats))
+    return [CacheStatsResponse(**s) for s in stats]
+
+@router.get("/pool", response_model=PoolStatsResponse)
+async def read_pool_stats():
+    return PoolStatsResponse(**pool_status(engine.pool))
@@ -0,0 +1,9 @@
+from fastapi import APIRouter
+
+from app.core.metrics import metrics_response
+
+router = APIRouter(tags=["metrics"])
+
+@router.get("/metrics", include_in_schema=False)
+async def read_metrics():
+    return metrics_response()
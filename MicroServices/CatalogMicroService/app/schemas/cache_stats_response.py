@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class CacheStatsResponse(BaseModel):
+    name: str
+    size: int
+    max_size: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    hit_ratio: float
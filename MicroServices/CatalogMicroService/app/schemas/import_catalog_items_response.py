@@ -0,0 +1,14 @@
+from typing import List
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ImportCatalogItemsResponse(BaseModel):
+    rows_imported: int
+    rows_rejected: int
+    batches: int
+    elapsed_seconds: float
+    rows_per_second: float
+    errors: List[str] = Field(default_factory=list)
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,10 +1,32 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
 
 from app.dto.catalog_item_dto import CatalogItemDTO
 
 
 class ListPagedCatalogItemResponse(BaseModel):
     catalog_items: List[CatalogItemDTO] = Field(default_factory=list)
-    page_count: int = 0
\ No newline at end of file
+    page_count: int = 0
+    next_cursor: Optional[str] = None
+
+
+class CatalogItemRow(TypedDict):
+    """A catalog item as selected by the repository's ``as_rows`` read paths."""
+
+    id: int
+    name: str
+    description: Optional[str]
+    price: float
+    picture_uri: Optional[str]
+    catalog_type_id: int
+    catalog_brand_id: int
+
+
+class ListPagedCatalogItemPage(TypedDict):
+    """Same document as ``ListPagedCatalogItemResponse``, built from plain rows."""
+
+    catalog_items: List[CatalogItemRow]
+    page_count: int
+    next_cursor: Optional[str]
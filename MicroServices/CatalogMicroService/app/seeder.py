@@ -1,11 +1,22 @@
+import argparse
+import asyncio
+import codecs
+import csv
+import json
 import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Iterable
 
+from pydantic import ValidationError
 from sqlalchemy.exc import SQLAlchemyError  # type: ignore[import]
 from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore[import]
 from sqlmodel import select  # type: ignore[import]
 
-from app.core.exceptions import DatabaseOperationError
+from app.core.exceptions import BadRequestError, DatabaseOperationError
+from app.dto.catalog_item_dto import CatalogItemDTO
 from app.models import CatalogBrand, CatalogType, CatalogItem
+from app.repositories.catalog_item_repository import CatalogItemRepository
 
 logger = logging.getLogger(__name__)
 
@@ -20,10 +31,9 @@ async def seed_catalog_brands(session: AsyncSession):
     ]
     
     try:
-        for brand in brands_to_add:
-            result = await session.execute(select(CatalogBrand).where(CatalogBrand.brand == brand.brand))
-            if not result.scalars().first():
-                session.add(brand)
+        result = await session.execute(select(CatalogBrand.brand))
+        existing = set(result.scalars().all())
+        session.add_all(brand for brand in brands_to_add if brand.brand not in existing)
 
         await session.commit()
     except SQLAlchemyError as exc:
@@ -42,10 +52,9 @@ async def seed_catalog_types(session: AsyncSession):
     ]
     
     try:
-        for catalog_type in types_to_add:
-            result = await session.execute(select(CatalogType).where(CatalogType.type == catalog_type.type))
-            if not result.scalars().first():
-                session.add(catalog_type)
+        result = await session.execute(select(CatalogType.type))
+        existing = set(result.scalars().all())
+        session.add_all(catalog_type for catalog_type in types_to_add if catalog_type.type not in existing)
 
         await session.commit()
     except SQLAlchemyError as exc:
@@ -71,15 +80,10 @@ async def seed_catalog_items(session: AsyncSession):
         CatalogItem(catalog_type_id=2, catalog_brand_id=5, description="Prism White TShirt", name="Prism White TShirt", price=12, picture_uri="http://catalogbaseurltobereplaced/images/products/12.png")
     ]
     
+    rows = [item.model_dump(exclude={"id"}) for item in items_to_add]
     try:
-        for item in items_to_add:
-            result = await session.execute(select(CatalogItem).where(CatalogItem.name == item.name))
-            if not result.scalars().first():
-                session.add(item)
-
-        await session.commit()
-    except SQLAlchemyError as exc:
-        await session.rollback()
+        await CatalogItemRepository(session).bulk_upsert(rows, update_existing=False)
+    except DatabaseOperationError as exc:
         logger.exception("Failed to seed catalog items")
         raise DatabaseOperationError("Failed to seed catalog items") from exc
     logger.info("Catalog items ensured")
@@ -90,4 +94,164 @@ async def seed_db(session: AsyncSession):
     await seed_catalog_brands(session)
     await seed_catalog_types(session)
     await seed_catalog_items(session)
-    logger.info("Catalog seed complete")
\ No newline at end of file
+    logger.info("Catalog seed complete")
+
+IMPORT_FORMATS = ("csv", "ndjson")
+MAX_REPORTED_ERRORS = 20
+
+@dataclass
+class ImportResult:
+    rows_imported: int = 0
+    rows_rejected: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_imported / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+async def iter_text_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Decode a UTF-8 byte stream (BOM optional) into lines, keeping their endings."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+async def _as_async(lines: Iterable[str]) -> AsyncIterator[str]:
+    for line in lines:
+        yield line
+
+async def _read_csv_records(lines: AsyncIterable[str]) -> AsyncIterator[tuple[int, Any]]:
+    # Parsed one record at a time so the input can stream; a quoted field may
+    # span lines, so a record ends only once its quotes are balanced.
+    header: list[str] | None = None
+    record_lines: list[str] = []
+    quotes = 0
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        record_lines.append(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            continue
+        row = next(csv.reader(record_lines), [])
+        record_lines, quotes = [], 0
+        if not row:
+            continue
+        if header is None:
+            header = row
+            continue
+        # Same shape csv.DictReader produces for short and long rows.
+        record: dict[Any, Any] = dict(zip(header, row))
+        record.update((name, None) for name in header[len(row):])
+        if len(row) > len(header):
+            record[None] = row[len(header):]
+        yield line_no, record
+
+async def _read_records(lines: AsyncIterable[str], fmt: str) -> AsyncIterator[tuple[int, Any]]:
+    if fmt == "csv":
+        async for record in _read_csv_records(lines):
+            yield record
+    elif fmt == "ndjson":
+        line_no = 0
+        async for line in lines:
+            line_no += 1
+            if not line.strip():
+                continue
+            try:
+                yield line_no, json.loads(line)
+            except ValueError as exc:
+                yield line_no, exc
+    else:
+        raise BadRequestError(f"Unsupported import format '{fmt}'")
+
+async def import_catalog_items(
+    session: AsyncSession,
+    lines: Iterable[str] | AsyncIterable[str],
+    fmt: str,
+    batch_size: int = 1000,
+) -> ImportResult:
+    """Upsert catalog items from CSV or NDJSON lines, one batch at a time.
+
+    ``lines`` may be an async iterable, so an upload is parsed as it arrives
+    and only one batch is held in memory. Rows that fail validation are
+    skipped and reported; each batch is committed on its own so a large file
+    does not hold one long transaction open.
+    """
+    if not isinstance(lines, AsyncIterable):
+        lines = _as_async(lines)
+    repo = CatalogItemRepository(session)
+    result = ImportResult()
+    batch: list[dict[str, Any]] = []
+    started = time.perf_counter()
+
+    def reject(line_no: int, reason: str) -> None:
+        result.rows_rejected += 1
+        if len(result.errors) < MAX_REPORTED_ERRORS:
+            result.errors.append(f"line {line_no}: {reason}")
+
+    async for line_no, record in _read_records(lines, fmt):
+        if isinstance(record, Exception):
+            reject(line_no, "invalid JSON")
+            continue
+        try:
+            item = CatalogItemDTO.model_validate(record)
+        except ValidationError as exc:
+            error = exc.errors()[0]
+            reject(line_no, f"{'.'.join(str(p) for p in error['loc'])}: {error['msg']}")
+            continue
+        batch.append(item.model_dump(exclude={"id"}))
+        if len(batch) >= batch_size:
+            await repo.bulk_upsert(batch)
+            result.rows_imported += len(batch)
+            result.batches += 1
+            batch = []
+    if batch:
+        await repo.bulk_upsert(batch)
+        result.rows_imported += len(batch)
+        result.batches += 1
+
+    result.elapsed_seconds = time.perf_counter() - started
+    logger.info(
+        "Imported %s catalog items in %s batches (%s rejected) at %.0f rows/s",
+        result.rows_imported,
+        result.batches,
+        result.rows_rejected,
+        result.rows_per_second,
+    )
+    return result
+
+async def _run_cli(args: argparse.Namespace) -> None:
+    # Imported lazily: app.database imports this module for seed_db.
+    from app.database import async_session
+
+    async with async_session() as session:
+        if args.command == "seed":
+            await seed_db(session)
+            return
+        fmt = args.format or ("csv" if args.path.endswith(".csv") else "ndjson")
+        with open(args.path, newline="", encoding="utf-8") as lines:
+            result = await import_catalog_items(session, lines, fmt, args.batch_size)
+    print(
+        f"imported={result.rows_imported} rejected={result.rows_rejected} "
+        f"batches={result.batches} seconds={result.elapsed_seconds:.2f} "
+        f"rows_per_second={result.rows_per_second:.0f}"
+    )
+    for error in result.errors:
+        print(error)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Seed or bulk-import the catalog.")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    subcommands.add_parser("seed", help="Insert the demo brands, types and items.")
+    import_parser = subcommands.add_parser("import", help="Upsert catalog items from a CSV or NDJSON file.")
+    import_parser.add_argument("path")
+    import_parser.add_argument("--format", choices=IMPORT_FORMATS)
+    import_parser.add_argument("--batch-size", type=int, default=1000)
+    asyncio.run(_run_cli(parser.parse_args()))
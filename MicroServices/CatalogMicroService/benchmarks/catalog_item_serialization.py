@@ -0,0 +1,96 @@
+"""Per-item cost of fetching and encoding a catalog list page.
+
+Compares the entity path (ORM rows -> CatalogItemDTO.model_validate ->
+ListPagedCatalogItemResponse -> FastAPI response_model validation and JSON
+encoding) with the row path used by ``GET /items`` (column tuples encoded by a
+prebuilt TypeAdapter). Runs against an in-memory SQLite database:
+
+    python -m benchmarks.catalog_item_serialization --items 5000 --page-sizes 10 100 1000
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlmodel import SQLModel
+
+from app.core.cache import TTLCache
+from app.dto.catalog_item_dto import CatalogItemDTO
+from app.models import CatalogBrand, CatalogType
+from app.repositories.catalog_item_repository import CatalogItemRepository
+from app.schemas.list_paged_catalog_item_response import (
+    ListPagedCatalogItemPage,
+    ListPagedCatalogItemResponse,
+)
+
+_response_adapter = TypeAdapter(ListPagedCatalogItemResponse)
+_page_adapter = TypeAdapter(ListPagedCatalogItemPage)
+
+
+async def _populate(session: AsyncSession, items: int) -> None:
+    session.add_all([CatalogBrand(id=1, brand="Bench"), CatalogType(id=1, type="Bench")])
+    await session.commit()
+    rows = [
+        {
+            "name": f"Item {i}",
+            "description": f"Benchmark item number {i}",
+            "price": 10 + i % 90 + 0.99,
+            "picture_uri": f"images/products/{i % 12 + 1}.png",
+            "catalog_brand_id": 1,
+            "catalog_type_id": 1,
+        }
+        for i in range(items)
+    ]
+    await CatalogItemRepository(session).bulk_upsert(rows)
+
+
+async def _entity_path(repo: CatalogItemRepository, page_size: int) -> bytes:
+    items = await repo.list_catalog_items(take=page_size)
+    response = ListPagedCatalogItemResponse(
+        catalog_items=[CatalogItemDTO.model_validate(i) for i in items], page_count=1
+    )
+    # What FastAPI does with a response_model: validate again, dump, json.dumps.
+    validated = _response_adapter.validate_python(response, from_attributes=True)
+    content = _response_adapter.dump_python(validated, mode="json")
+    return json.dumps(content, separators=(",", ":")).encode()
+
+
+async def _row_path(repo: CatalogItemRepository, page_size: int) -> bytes:
+    rows = await repo.list_catalog_items(take=page_size, as_rows=True)
+    return _page_adapter.dump_json({"catalog_items": rows, "page_count": 1, "next_cursor": None})
+
+
+async def _time_per_item(session: AsyncSession, path, page_size: int, rounds: int) -> float:
+    repo = CatalogItemRepository(session, count_cache=TTLCache("bench", max_size=0, ttl_seconds=0))
+    await path(repo, page_size)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await path(repo, page_size)
+        # Keep the identity map from turning later rounds into cache hits.
+        session.expunge_all()
+    return (time.perf_counter() - started) / (rounds * page_size)
+
+
+async def main(items: int, page_sizes: list[int], rounds: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        await _populate(session, items)
+        print(f"{'page size':>10} {'entity us/item':>15} {'rows us/item':>13} {'speedup':>8}")
+        for page_size in page_sizes:
+            entity = await _time_per_item(session, _entity_path, page_size, rounds)
+            row = await _time_per_item(session, _row_path, page_size, rounds)
+            print(f"{page_size:>10} {entity * 1e6:>15.2f} {row * 1e6:>13.2f} {entity / row:>7.1f}x")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.page_sizes, args.rounds))
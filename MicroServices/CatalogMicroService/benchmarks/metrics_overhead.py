@@ -0,0 +1,97 @@
+"""Per-request cost of ``PrometheusMiddleware`` and per-statement cost of the query hooks.
+
+Drives a minimal Starlette app straight through the ASGI interface, so the
+numbers are the instrumentation itself rather than socket or framework time,
+then runs a trivial SQLite query on plain and instrumented engines:
+
+    python -m benchmarks.metrics_overhead --requests 50000 --queries 20000
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import create_engine, text
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.metrics import PrometheusMiddleware, instrument_engine
+
+
+async def _item(request):
+    return PlainTextResponse("ok")
+
+
+def _build_app():
+    return Starlette(routes=[Route("/items/{item_id}", _item)])
+
+
+async def _drive(app, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/items/1",
+        "raw_path": b"/items/1",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [],
+        "client": ("127.0.0.1", 1),
+        "server": ("127.0.0.1", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - started) / requests
+
+
+def _request_overhead(requests: int) -> tuple[float, float]:
+    plain = _build_app()
+    instrumented = PrometheusMiddleware(_build_app())
+    # Warm both paths (route compilation, label children) before timing.
+    for app in (plain, instrumented):
+        asyncio.run(_drive(app, 1000))
+    return asyncio.run(_drive(plain, requests)), asyncio.run(_drive(instrumented, requests))
+
+
+def _query_once(engine, queries: int) -> float:
+    with engine.connect() as conn:
+        statement = text("SELECT 1")
+        conn.execute(statement)
+        started = time.perf_counter()
+        for _ in range(queries):
+            conn.execute(statement).scalar()
+        return (time.perf_counter() - started) / queries
+
+
+def _query_overhead(queries: int) -> tuple[float, float]:
+    plain = create_engine("sqlite://")
+    instrumented = create_engine("sqlite://")
+    instrument_engine(instrumented)
+    return _query_once(plain, queries), _query_once(instrumented, queries)
+
+
+def main(requests: int, queries: int) -> None:
+    print(f"{'path':<10} {'plain us':>9} {'instrumented us':>16} {'overhead us':>12}")
+    for label, (plain, instrumented) in (
+        ("request", _request_overhead(requests)),
+        ("query", _query_overhead(queries)),
+    ):
+        print(f"{label:<10} {plain * 1e6:>9.1f} {instrumented * 1e6:>16.1f} {(instrumented - plain) * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=20_000)
+    args = parser.parse_args()
+    main(args.requests, args.queries)
@@ -0,0 +1,135 @@
+"""Server CPU cost and rate of new mTLS connections, with and without resumption.
+
+Starts a TLS listener in a separate process, configured like the service
+listener (client certs required, ``tune_ssl_context`` applied), and opens
+``--connections`` fresh connections to it for each scenario. Without
+``--cert``/``--key``/``--ca`` a throwaway CA and certificates are generated
+with the ``openssl`` CLI:
+
+    python -m benchmarks.tls_handshake --connections 500
+"""
+import argparse
+import multiprocessing
+import os
+import socket
+import ssl
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from uvicorn.config import create_ssl_context
+
+SCENARIOS = [
+    # (label, TLS version, session tickets issued by the server, client offers session)
+    ("TLS 1.2 full", ssl.TLSVersion.TLSv1_2, 0, False),
+    ("TLS 1.2 resumed", ssl.TLSVersion.TLSv1_2, 2, True),
+    ("TLS 1.3 full", ssl.TLSVersion.TLSv1_3, 0, False),
+    ("TLS 1.3 resumed", ssl.TLSVersion.TLSv1_3, 2, True),
+]
+
+
+def _generate_certificates(directory: Path) -> dict[str, str]:
+    def openssl(*args: str) -> None:
+        subprocess.run(["openssl", *args], check=True, capture_output=True)
+
+    files = {name: str(directory / name) for name in ("ca.crt", "ca.key", "server.crt", "server.key", "client.crt", "client.key")}
+    openssl("req", "-x509", "-newkey", "ec", "-pkeyopt", "ec_paramgen_curve:prime256v1", "-nodes",
+            "-keyout", files["ca.key"], "-out", files["ca.crt"], "-days", "1", "-subj", "/CN=bench-ca")
+    for role in ("server", "client"):
+        csr = str(directory / f"{role}.csr")
+        openssl("req", "-newkey", "ec", "-pkeyopt", "ec_paramgen_curve:prime256v1", "-nodes",
+                "-keyout", files[f"{role}.key"], "-out", csr, "-subj", f"/CN={role}")
+        extensions = directory / f"{role}.ext"
+        extensions.write_text("subjectAltName=DNS:localhost\n" if role == "server" else "extendedKeyUsage=clientAuth\n")
+        openssl("x509", "-req", "-in", csr, "-CA", files["ca.crt"], "-CAkey", files["ca.key"],
+                "-CAcreateserial", "-out", files[f"{role}.crt"], "-days", "1", "-extfile", str(extensions))
+    return files
+
+
+def _serve(listener: socket.socket, certs: dict[str, str], tickets: int, connections: int, report) -> None:
+    os.environ["TLS_SESSION_TICKETS"] = str(tickets)
+    from app.server import tune_ssl_context
+
+    context = tune_ssl_context(
+        create_ssl_context(
+            certfile=certs["server.crt"],
+            keyfile=certs["server.key"],
+            password=None,
+            ssl_version=ssl.PROTOCOL_TLS_SERVER,
+            cert_reqs=ssl.CERT_REQUIRED,
+            ca_certs=certs["ca.crt"],
+            ciphers=None,
+        )
+    )
+    started = time.process_time()
+    for _ in range(connections):
+        conn, _ = listener.accept()
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with context.wrap_socket(conn, server_side=True) as tls:
+            tls.recv(1)
+            # Reply so TLS 1.3 tickets reach the client before it closes.
+            tls.sendall(b"k")
+    report.send(time.process_time() - started)
+
+
+def _run_scenario(certs: dict[str, str], version: ssl.TLSVersion, tickets: int, reuse: bool, connections: int):
+    listener = socket.create_server(("127.0.0.1", 0))
+    port = listener.getsockname()[1]
+    receiver, report = multiprocessing.Pipe(duplex=False)
+    server = multiprocessing.get_context("spawn").Process(
+        target=_serve, args=(listener, certs, tickets, connections, report)
+    )
+    server.start()
+
+    client = ssl.create_default_context(cafile=certs["ca.crt"])
+    client.load_cert_chain(certs["client.crt"], certs["client.key"])
+    client.minimum_version = client.maximum_version = version
+    session = None
+    resumed = 0
+    started = time.perf_counter()
+    for _ in range(connections):
+        with socket.create_connection(("127.0.0.1", port)) as raw:
+            # Keep Nagle/delayed-ACK stalls out of the handshake timings.
+            raw.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with client.wrap_socket(raw, server_hostname="localhost", session=session) as tls:
+                tls.sendall(b"p")
+                tls.recv(1)
+                resumed += tls.session_reused
+                if reuse:
+                    session = tls.session
+    elapsed = time.perf_counter() - started
+    server_cpu = receiver.recv()
+    server.join()
+    listener.close()
+    return connections / elapsed, server_cpu / connections, resumed / connections
+
+
+def main(connections: int, certs: dict[str, str]) -> None:
+    print(f"{'scenario':<18} {'conn/s':>8} {'server CPU us/conn':>19} {'resumed':>8}")
+    for label, version, tickets, reuse in SCENARIOS:
+        rate, cpu, resumed = _run_scenario(certs, version, tickets, reuse, connections)
+        print(f"{label:<18} {rate:>8.0f} {cpu * 1e6:>19.0f} {resumed:>8.0%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=500)
+    parser.add_argument("--cert", help="server certificate (defaults to a generated one)")
+    parser.add_argument("--key", help="server key")
+    parser.add_argument("--ca", help="CA that signed the server and client certificates")
+    parser.add_argument("--client-cert", help="client certificate")
+    parser.add_argument("--client-key", help="client key")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.cert:
+            certs = {
+                "server.crt": args.cert,
+                "server.key": args.key,
+                "ca.crt": args.ca,
+                "client.crt": args.client_cert,
+                "client.key": args.client_key,
+            }
+        else:
+            certs = _generate_certificates(Path(tmp))
+        main(args.connections, certs)
@@ -6,6 +6,7 @@ from sqlalchemy.orm import sessionmaker
 from app.database import get_db
 from app.main import app
 import pytest_asyncio
+import httpx
 import os
 import sys
 
@@ -35,3 +36,15 @@ async def prepare_db():
 async def db_session():
     async with async_session_test() as session:
         yield session
+
+@pytest_asyncio.fixture
+async def client():
+    async def override_get_db():
+        async with async_session_test() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+    app.dependency_overrides.pop(get_db, None)
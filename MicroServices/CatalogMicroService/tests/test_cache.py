@@ -0,0 +1,52 @@
+from app.core.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_counts_hits_and_misses():
+    cache = TTLCache("test", max_size=10, ttl_seconds=60)
+
+    assert cache.get(1) is None
+    cache.set(1, "one")
+    assert cache.get(1) == "one"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+def test_evicts_least_recently_used():
+    cache = TTLCache("test", max_size=2, ttl_seconds=60)
+    cache.set(1, "one")
+    cache.set(2, "two")
+    cache.get(1)
+    cache.set(3, "three")
+
+    assert cache.get(2) is None
+    assert cache.get(1) == "one"
+    assert cache.get(3) == "three"
+    assert cache.evictions == 1
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache("test", max_size=10, ttl_seconds=5, clock=clock)
+    cache.set(1, "one")
+
+    clock.now = 4.9
+    assert cache.get(1) == "one"
+    clock.now = 5.0
+    assert cache.get(1) is None
+    assert len(cache) == 0
+
+def test_zero_size_disables_cache():
+    cache = TTLCache("test", max_size=0, ttl_seconds=60)
+    cache.set(1, "one")
+
+    assert cache.get(1) is None
+    assert not cache.enabled
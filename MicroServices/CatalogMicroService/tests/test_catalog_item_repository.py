@@ -1,4 +1,8 @@
 import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import TTLCache
+from app.dto.catalog_item_dto import CatalogItemDTO
 from app.models.catalog_item import CatalogItem
 from app.repositories.catalog_item_repository import CatalogItemRepository
 
@@ -86,11 +90,7 @@ async def test_update_catalog_item(db_session):
     )
     added = await repo.add(item)
 
-    # Change values
-    added.description = "New Desc"
-    added.price = 10.0
-
-    updated = await repo.update(added)
+    updated = await repo.update_by_id(added.id, {"description": "New Desc", "price": 10.0})
     assert updated.description == "New Desc"
     assert updated.price == 10.0
 
@@ -116,3 +116,187 @@ async def test_delete_catalog_item(db_session):
 
     deleted = await repo.get_by_id(added.id)
     assert deleted is None
+
+@pytest.mark.asyncio
+async def test_get_by_id_is_served_from_cache(db_session):
+    cache = TTLCache("test", max_size=10, ttl_seconds=60)
+    repo = CatalogItemRepository(db_session, cache=cache)
+
+    added = await repo.add(CatalogItem(name="Cached Item", description="Desc", price=3.0, catalog_brand_id=1, catalog_type_id=1))
+    db_session.expunge_all()
+
+    fetched = await repo.get_by_id(added.id)
+    assert fetched.name == "Cached Item"
+    assert cache.hits == 1
+
+    # Cached rows come back attached so they can still be deleted.
+    await repo.delete(fetched)
+    assert await repo.get_by_id(added.id) is None
+
+@pytest.mark.asyncio
+async def test_update_refreshes_cache_for_other_sessions(db_session):
+    cache = TTLCache("test", max_size=10, ttl_seconds=60)
+    writer = CatalogItemRepository(db_session, cache=cache)
+    added = await writer.add(CatalogItem(name="Price Change", description="Desc", price=5.0, catalog_brand_id=1, catalog_type_id=1))
+
+    await writer.update_by_id(added.id, {"price": 7.5})
+
+    async with AsyncSession(db_session.bind, expire_on_commit=False) as other_session:
+        reader = CatalogItemRepository(other_session, cache=cache)
+        fetched = await reader.get_by_id(added.id)
+    assert fetched.price == 7.5
+
+@pytest.mark.asyncio
+async def test_cached_counts_follow_writes(db_session):
+    count_cache = TTLCache("test_counts", max_size=1, ttl_seconds=60)
+    repo = CatalogItemRepository(db_session, count_cache=count_cache)
+
+    before = await repo.count_catalog_items(brand_id=7)
+    assert await repo.count_catalog_items(brand_id=7) == before
+    assert count_cache.hits == 1
+
+    added = await repo.add(CatalogItem(name="Counted Item", description="Desc", price=1.0, catalog_brand_id=7, catalog_type_id=1))
+    assert await repo.count_catalog_items(brand_id=7) == before + 1
+    assert await repo.count_catalog_items(brand_id=7, type_id=1) == before + 1
+
+    moved = await repo.update_by_id(added.id, {"catalog_brand_id": 8})
+    assert await repo.count_catalog_items(brand_id=7) == before
+
+    await repo.delete(moved)
+    assert await repo.count_catalog_items(brand_id=8) == 0
+
+@pytest.mark.asyncio
+async def test_list_catalog_items_with_total(db_session):
+    repo = CatalogItemRepository(db_session)
+    for i in range(5):
+        await repo.add(CatalogItem(name=f"Window Item {i}", description="Desc", price=1.0, catalog_brand_id=9, catalog_type_id=2))
+
+    items, total = await repo.list_catalog_items_with_total(skip=2, take=2, brand_id=9)
+    assert [i.name for i in items] == ["Window Item 2", "Window Item 3"]
+    assert total == 5
+
+    items, total = await repo.list_catalog_items_with_total(skip=10, take=2, brand_id=9)
+    assert items == []
+    assert total == 5
+
+@pytest.mark.asyncio
+async def test_stream_catalog_items_in_batches(db_session):
+    repo = CatalogItemRepository(db_session)
+    for i in range(5):
+        await repo.add(CatalogItem(name=f"Batch Item {i}", description="Desc", price=1.0, catalog_brand_id=10, catalog_type_id=1))
+
+    batches = [batch async for batch in repo.stream_catalog_items(brand_id=10, batch_size=2)]
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert [i.name for b in batches for i in b] == [f"Batch Item {i}" for i in range(5)]
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_keys_on_name(db_session):
+    repo = CatalogItemRepository(db_session)
+    row = dict(name="Upsert Item", description="Desc", price=1.0, picture_uri="", catalog_brand_id=11, catalog_type_id=1)
+
+    await repo.bulk_upsert([row, {**row, "price": 2.0}])
+    await repo.bulk_upsert([{**row, "price": 3.0}], update_existing=False)
+
+    items = await repo.list_catalog_items(brand_id=11)
+    assert len(items) == 1
+    assert items[0].price == 2.0
+    assert await repo.count_catalog_items(brand_id=11) == 1
+
+@pytest.mark.asyncio
+async def test_writes_return_rows_without_extra_selects(db_session):
+    repo = CatalogItemRepository(db_session)
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0].upper())
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        added = await repo.add(CatalogItem(name="Returning Item", description="Desc", price=6.0, catalog_brand_id=1, catalog_type_id=1))
+        updated = await repo.update_by_id(added.id, {"price": 6.5})
+        missing = await repo.update_by_id(-1, {"price": 1.0})
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    assert added.id is not None
+    assert updated.price == 6.5
+    assert missing is None
+    assert statements == ["INSERT", "UPDATE", "UPDATE"]
+
+@pytest.mark.asyncio
+async def test_get_many_keeps_request_order_and_uses_cache(db_session):
+    cache = TTLCache("test", max_size=10, ttl_seconds=60)
+    repo = CatalogItemRepository(db_session, cache=cache)
+    first = await repo.add(CatalogItem(name="Batch One", description="Desc", price=1.0, catalog_brand_id=1, catalog_type_id=1))
+    second = await repo.add(CatalogItem(name="Batch Two", description="Desc", price=2.0, catalog_brand_id=1, catalog_type_id=1))
+    cache.invalidate(second.id)
+
+    items = await repo.get_many([second.id, -1, first.id, second.id])
+
+    assert [i.id for i in items] == [second.id, first.id]
+    assert cache.hits == 1
+    assert len(cache) == 2
+
+@pytest.mark.asyncio
+async def test_search_ranks_prefix_matches_and_follows_writes(db_session):
+    repo = CatalogItemRepository(db_session)
+    in_description = await repo.add(CatalogItem(name="Plain Bottle", description="Keeps tea hot", price=1.0, catalog_brand_id=4, catalog_type_id=1))
+    in_name = await repo.add(CatalogItem(name="Teapot Deluxe", description="Ceramic", price=1.0, catalog_brand_id=4, catalog_type_id=2))
+
+    items, total = await repo.search_catalog_items(["tea"], brand_id=4)
+    assert [i.id for i in items] == [in_name.id, in_description.id]
+    assert total == 2
+
+    items, total = await repo.search_catalog_items(["tea"], brand_id=4, type_id=1)
+    assert [i.id for i in items] == [in_description.id]
+
+    _, total = await repo.search_catalog_items(["tea"], skip=5, brand_id=4)
+    assert total == 2
+
+    await repo.update_by_id(in_name.id, {"name": "Coffee Press", "description": "Glass"})
+    await repo.delete(in_description)
+    items, total = await repo.search_catalog_items(["tea"], brand_id=4)
+    assert (items, total) == ([], 0)
+    items, _ = await repo.search_catalog_items(["coff", "gla"], brand_id=4)
+    assert [i.id for i in items] == [in_name.id]
+
+@pytest.mark.asyncio
+async def test_as_rows_matches_entity_serialization(db_session):
+    repo = CatalogItemRepository(db_session)
+    await repo.add(CatalogItem(name="Row Item", description="Desc", price=12.34, picture_uri="images/r.png", catalog_brand_id=8, catalog_type_id=1))
+
+    entities = await repo.list_catalog_items(take=10, brand_id=8)
+    rows = await repo.list_catalog_items(take=10, brand_id=8, as_rows=True)
+    paged_rows, total = await repo.list_catalog_items_with_total(take=10, brand_id=8, as_rows=True)
+
+    expected = [CatalogItemDTO.model_validate(i).model_dump() for i in entities]
+    assert rows == expected
+    assert (paged_rows, total) == (expected, 1)
+    assert isinstance(rows[0]["price"], float)
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_splits_rows_to_stay_under_the_bind_parameter_limit(db_session, monkeypatch):
+    from app.repositories import catalog_item_repository
+
+    rows = [
+        CatalogItem(name=f"Chunked {n}", description="d", price=n, picture_uri="", catalog_type_id=1, catalog_brand_id=41).model_dump(exclude={"id"})
+        for n in range(5)
+    ]
+    # Room for two rows per statement.
+    monkeypatch.setattr(catalog_item_repository, "MAX_BIND_PARAMETERS", 2 * len(rows[0]) + 1)
+    statements = []
+    real_execute = db_session.execute
+
+    async def counting_execute(stmt, *args, **kwargs):
+        statements.append(stmt)
+        return await real_execute(stmt, *args, **kwargs)
+
+    monkeypatch.setattr(db_session, "execute", counting_execute)
+    await CatalogItemRepository(db_session).bulk_upsert(rows)
+    monkeypatch.undo()
+
+    assert len(statements) == 3
+    stored = await CatalogItemRepository(db_session).list_catalog_items(brand_id=41)
+    assert sorted(item.name for item in stored) == [f"Chunked {n}" for n in range(5)]
@@ -0,0 +1,245 @@
+import pytest
+from sqlalchemy import event
+from app.routers import catalog_item_router
+from app.models.catalog_item import CatalogItem
+from app.repositories.catalog_item_repository import CatalogItemRepository
+
+@pytest.mark.asyncio
+async def test_cursor_pages_match_offset_pages(client, db_session):
+    repo = CatalogItemRepository(db_session)
+    for i in range(7):
+        await repo.add(CatalogItem(name=f"Cursor Item {i}", description="Desc", price=1.0 + i, picture_uri="images/1.png", catalog_brand_id=3, catalog_type_id=4))
+
+    offset_ids = []
+    page_index = 0
+    while True:
+        response = await client.get("/items", params={"pageSize": 3, "pageIndex": page_index, "catalogBrandId": 3})
+        page = response.json()["catalog_items"]
+        if not page:
+            break
+        offset_ids.extend(i["id"] for i in page)
+        page_index += 1
+
+    cursor_ids = []
+    params = {"pageSize": 3, "catalogBrandId": 3}
+    while True:
+        body = (await client.get("/items", params=params)).json()
+        cursor_ids.extend(i["id"] for i in body["catalog_items"])
+        if body["next_cursor"] is None:
+            break
+        params["cursor"] = body["next_cursor"]
+
+    assert len(cursor_ids) == 7
+    assert cursor_ids == offset_ids
+
+@pytest.mark.asyncio
+async def test_cursor_rejects_changed_filters(client, db_session):
+    repo = CatalogItemRepository(db_session)
+    for i in range(2):
+        await repo.add(CatalogItem(name=f"Filter Item {i}", description="Desc", price=1.0, picture_uri="images/1.png", catalog_brand_id=3, catalog_type_id=4))
+
+    body = (await client.get("/items", params={"pageSize": 1, "catalogBrandId": 3})).json()
+    assert body["next_cursor"] is not None
+
+    response = await client.get("/items", params={"pageSize": 1, "cursor": body["next_cursor"], "catalogBrandId": 3, "catalogTypeId": 4})
+    assert response.status_code == 400
+
+    response = await client.get("/items", params={"pageSize": 1, "catalogBrandId": 3, "cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_list_without_page_size_streams_everything(client, db_session):
+    repo = CatalogItemRepository(db_session)
+    for i in range(5):
+        await repo.add(CatalogItem(name=f"Stream Item {i}", description="Desc", price=2.0, picture_uri="images/2.png", catalog_brand_id=5, catalog_type_id=5))
+
+    response = await client.get("/items", params={"catalogBrandId": 5})
+    assert response.status_code == 200
+    body = response.json()
+    assert [i["name"] for i in body["catalog_items"]] == [f"Stream Item {i}" for i in range(5)]
+    assert body["page_count"] == 1
+
+    response = await client.get("/items", params={"catalogBrandId": 5}, headers={"Accept": "application/x-ndjson"})
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert len(lines) == 5
+
+    empty = (await client.get("/items", params={"catalogBrandId": 999})).json()
+    assert empty == {"catalog_items": [], "page_count": 0, "next_cursor": None}
+
+@pytest.mark.asyncio
+async def test_import_csv_upserts_in_batches_and_reports_rejects(client):
+    csv_body = (
+        "name,description,price,picture_uri,catalog_type_id,catalog_brand_id\n"
+        "Import Mug,\"Mug, large\",4.5,images/m.png,1,6\n"
+        "Import Shirt,Shirt,12,images/s.png,2,6\n"
+        "Import Broken,Broken,not-a-price,images/b.png,2,6\n"
+        "Import Sheet,Sheet,3,images/h.png,3,6\n"
+    )
+    response = await client.post("/items/import", params={"batchSize": 2}, content=csv_body, headers={"Content-Type": "text/csv"})
+    assert response.status_code == 200
+    report = response.json()
+    assert report["rows_imported"] == 3
+    assert report["rows_rejected"] == 1
+    assert report["batches"] == 2
+    assert report["errors"][0].startswith("line 4: price")
+
+    ndjson_body = '{"name": "Import Mug", "description": "Mug", "price": 5.0, "picture_uri": "images/m.png", "catalog_type_id": 1, "catalog_brand_id": 6}\n'
+    response = await client.post("/items/import", content=ndjson_body, headers={"Content-Type": "application/x-ndjson"})
+    assert response.json()["rows_imported"] == 1
+
+    items = (await client.get("/items", params={"catalogBrandId": 6})).json()["catalog_items"]
+    assert {i["name"]: i["price"] for i in items} == {"Import Mug": 5.0, "Import Shirt": 12.0, "Import Sheet": 3.0}
+
+@pytest.mark.asyncio
+async def test_import_streams_csv_split_across_chunks(client):
+    body = (
+        "\ufeffname,description,price,picture_uri,catalog_type_id,catalog_brand_id\r\n"
+        "Stream Mug,\"Two\r\nlines, \"\"quoted\"\"\",4.5,images/m.png,1,7\r\n"
+        "Stream Caf\u00e9,Shirt,12,images/s.png,2,7\r\n"
+    ).encode("utf-8")
+
+    async def chunks():
+        # Three-byte chunks split CRLFs, the quoted newline and the UTF-8 "é".
+        for start in range(0, len(body), 3):
+            yield body[start:start + 3]
+
+    response = await client.post("/items/import", content=chunks(), headers={"Content-Type": "text/csv"})
+    assert response.status_code == 200
+    assert response.json()["rows_imported"] == 2
+
+    items = (await client.get("/items", params={"catalogBrandId": 7})).json()["catalog_items"]
+    assert {i["name"]: i["description"] for i in items} == {
+        "Stream Mug": 'Two\r\nlines, "quoted"',
+        "Stream Caf\u00e9": "Shirt",
+    }
+
+@pytest.mark.asyncio
+async def test_import_rejects_batch_size_over_the_cap(client):
+    response = await client.post(
+        "/items/import",
+        params={"batchSize": catalog_item_router.IMPORT_MAX_BATCH_SIZE + 1},
+        content="name\n",
+        headers={"Content-Type": "text/csv"},
+    )
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_import_rejects_unknown_content_type(client):
+    response = await client.post("/items/import", content="{}", headers={"Content-Type": "application/json"})
+    assert response.status_code == 415
+
+@pytest.mark.asyncio
+async def test_update_unknown_item_returns_404(client):
+    payload = {"id": 987654, "name": "Ghost", "description": "Desc", "price": 1.0, "picture_uri": "", "catalog_type_id": 1, "catalog_brand_id": 1}
+    response = await client.put("/items", json=payload)
+    assert response.status_code == 404
+
+@pytest.mark.asyncio
+async def test_duplicate_names_are_rejected_with_409(client):
+    body = {"name": "Unique Mug", "description": "Desc", "price": 1.0, "picture_uri": "", "catalog_type_id": 1, "catalog_brand_id": 1}
+    first = await client.post("/items", json=body)
+    assert first.status_code == 200
+    response = await client.post("/items", json=body)
+    assert response.status_code == 409
+
+    other = (await client.post("/items", json={**body, "name": "Unique Cup"})).json()
+    response = await client.put("/items", json={**other, "name": "Unique Mug"})
+    assert response.status_code == 409
+    fetched = (await client.get(f"/items/{other['id']}")).json()
+    assert fetched["name"] == "Unique Cup"
+
+@pytest.mark.asyncio
+async def test_batch_returns_items_in_request_order(client, db_session, monkeypatch):
+    repo = CatalogItemRepository(db_session)
+    added = [
+        await repo.add(CatalogItem(name=f"Batch Route {i}", description="Desc", price=1.0, picture_uri="images/1.png", catalog_brand_id=1, catalog_type_id=1))
+        for i in range(3)
+    ]
+    ids = [added[2].id, added[0].id, 999999]
+
+    response = await client.post("/items/batch", json={"ids": ids})
+    assert response.status_code == 200
+    assert [i["id"] for i in response.json()] == [added[2].id, added[0].id]
+
+    monkeypatch.setattr(catalog_item_router, "BATCH_MAX_IDS", 2)
+    response = await client.post("/items/batch", json={"ids": ids})
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_search_returns_paged_matches(client, db_session):
+    repo = CatalogItemRepository(db_session)
+    for i in range(3):
+        await repo.add(CatalogItem(name=f"Lantern {i}", description="Camping light", price=1.0, picture_uri="images/1.png", catalog_brand_id=6, catalog_type_id=1))
+
+    response = await client.get("/items/search", params={"q": "lant", "pageSize": 2, "catalogBrandId": 6})
+    assert response.status_code == 200
+    body = response.json()
+    assert [i["name"] for i in body["catalog_items"]] == ["Lantern 0", "Lantern 1"]
+    assert body["page_count"] == 2
+
+    response = await client.get("/items/search", params={"q": "* :(-"})
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+async def test_price_sorted_cursor_pages_are_stable_across_ties(client, db_session, direction):
+    repo = CatalogItemRepository(db_session)
+    prices = [4.5, 2.25, 4.5, 9.99, 2.25, 4.5, 15.0]
+    for i, price in enumerate(prices):
+        await repo.add(CatalogItem(name=f"Priced {direction} {i}", description="Desc", price=price, picture_uri="images/1.png", catalog_brand_id=9, catalog_type_id=2 if direction == "asc" else 3))
+    base = {"catalogBrandId": 9, "catalogTypeId": 2 if direction == "asc" else 3, "minPrice": "2.25", "maxPrice": "10", "orderBy": "price", "orderDirection": direction}
+
+    full = (await client.get("/items", params={**base, "pageSize": 50})).json()
+    expected = sorted(
+        ((i["price"], i["id"]) for i in full["catalog_items"]), reverse=direction == "desc"
+    )
+    assert [(i["price"], i["id"]) for i in full["catalog_items"]] == expected
+    assert len(expected) == 6
+
+    seen = []
+    params = {**base, "pageSize": 2}
+    while True:
+        body = (await client.get("/items", params=params)).json()
+        assert body["page_count"] == 3
+        seen.extend((i["price"], i["id"]) for i in body["catalog_items"])
+        if body["next_cursor"] is None:
+            break
+        params["cursor"] = body["next_cursor"]
+        # A write between pages must not shift the remaining rows.
+        await repo.add(CatalogItem(name=f"Late {direction} {len(seen)}", description="Desc", price=0.5, picture_uri="images/1.png", catalog_brand_id=9, catalog_type_id=base["catalogTypeId"]))
+    assert seen == expected
+
+    params["orderBy"] = "name"
+    response = await client.get("/items", params=params)
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_price_filtered_cursor_pages_reuse_the_first_page_count(client, db_session):
+    repo = CatalogItemRepository(db_session)
+    for i in range(5):
+        await repo.add(CatalogItem(name=f"Counted {i}", description="Desc", price=3 + i, picture_uri="images/1.png", catalog_brand_id=10, catalog_type_id=1))
+    params = {"catalogBrandId": 10, "minPrice": "3", "maxPrice": "20", "pageSize": 2}
+    first = (await client.get("/items", params=params)).json()
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.lower())
+
+    # The client's sessions share the test engine with db_session.
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        second = (await client.get("/items", params={**params, "cursor": first["next_cursor"]})).json()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert first["page_count"] == second["page_count"] == 3
+    assert len(second["catalog_items"]) == 2
+    assert not any("count(" in statement for statement in statements)
+
+@pytest.mark.asyncio
+async def test_rejects_inverted_price_range(client):
+    response = await client.get("/items", params={"pageSize": 5, "minPrice": "10", "maxPrice": "1"})
+    assert response.status_code == 400
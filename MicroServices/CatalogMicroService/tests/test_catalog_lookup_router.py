@@ -0,0 +1,28 @@
+import pytest
+
+@pytest.mark.asyncio
+async def test_types_are_served_with_etag_and_conditional_get(client):
+    first = await client.get("/types")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"].startswith("public, max-age=")
+
+    not_modified = await client.get("/types", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    created = await client.post("/types", json={"type": "Hoodie"})
+    assert created.status_code == 200
+
+    changed = await client.get("/types", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert "Hoodie" in [t["type"] for t in changed.json()]
+
+@pytest.mark.asyncio
+async def test_brands_answer_weak_and_listed_etags(client):
+    etag = (await client.get("/brands")).headers["etag"]
+
+    response = await client.get("/brands", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert response.status_code == 304
@@ -0,0 +1,81 @@
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app import database
+from app.models.catalog_item import CatalogItem
+
+@pytest.mark.asyncio
+async def test_init_db_migrates_and_seeds_only_once(tmp_path, monkeypatch):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'init.db'}"
+    engine = create_async_engine(url)
+    monkeypatch.setenv("DATABASE_URL", url)
+    monkeypatch.setattr(database, "DB_INIT_MODE", "migrate")
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(database, "async_session", async_sessionmaker(engine, expire_on_commit=False))
+
+    await database.init_db()
+    async with engine.begin() as conn:
+        seeded = (await conn.execute(select(func.count()).select_from(CatalogItem))).scalar_one()
+        await conn.execute(text("DELETE FROM catalogitem WHERE id = 1"))
+    assert seeded > 0
+
+    # A restart must neither rebuild the schema nor reseed a populated catalog.
+    await database.init_db()
+    async with engine.connect() as conn:
+        remaining = (await conn.execute(select(func.count()).select_from(CatalogItem))).scalar_one()
+        revision = (await conn.execute(text("SELECT version_num FROM alembic_version"))).scalar_one()
+    assert remaining == seeded - 1
+    assert revision is not None
+    await engine.dispose()
+
+@pytest.mark.asyncio
+async def test_server_initializes_once_and_workers_skip(tmp_path, monkeypatch):
+    from app import server
+
+    url = f"sqlite+aiosqlite:///{tmp_path / 'workers.db'}"
+    engine = create_async_engine(url)
+    monkeypatch.setenv("DATABASE_URL", url)
+    monkeypatch.setenv("CATALOG_DB_INIT_MODE", "migrate")
+    monkeypatch.setattr(database, "DB_INIT_MODE", "migrate")
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(database, "async_session", async_sessionmaker(engine, expire_on_commit=False))
+
+    # prepare_database drives its own event loop, as it does before uvicorn starts.
+    await asyncio.to_thread(server.prepare_database)
+    assert database.DB_INIT_MODE == "skip"
+    assert os.environ["CATALOG_DB_INIT_MODE"] == "skip"
+
+    async with engine.begin() as conn:
+        await conn.execute(text("DELETE FROM catalogitem"))
+        await conn.execute(text("DELETE FROM catalogbrand"))
+        await conn.execute(text("DELETE FROM catalogtype"))
+    # What each worker's lifespan does: nothing, not even seeding the now-empty catalog.
+    await database.init_db()
+    async with engine.connect() as conn:
+        items = (await conn.execute(select(func.count()).select_from(CatalogItem))).scalar_one()
+    assert items == 0
+    await engine.dispose()
+
+@pytest.mark.asyncio
+async def test_unique_name_migration_reports_duplicate_names(tmp_path, monkeypatch):
+    from alembic import command
+
+    url = f"sqlite+aiosqlite:///{tmp_path / 'duplicates.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+    config = database._alembic_config()
+    await asyncio.to_thread(command.upgrade, config, "0979b5f29407")
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        for _ in range(2):
+            await conn.execute(text(
+                "INSERT INTO catalogitem (name, price, catalog_type_id, catalog_brand_id) "
+                "VALUES ('Twin Mug', 1, 1, 1)"
+            ))
+    await engine.dispose()
+
+    with pytest.raises(RuntimeError, match=r"duplicate names: 'Twin Mug' \(2 rows\)"):
+        await asyncio.to_thread(command.upgrade, config, "head")
@@ -0,0 +1,33 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.db_pool import InstrumentedAsyncQueuePool, pool_checkout_stats, pool_status
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_reports_checkouts_and_usage(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=2,
+        max_overflow=0,
+    )
+    before = pool_checkout_stats.checkouts
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        status = pool_status(engine.pool)
+        assert status["checked_out"] == 1
+        assert status["size"] == 2
+
+    status = pool_status(engine.pool)
+    assert status["checked_out"] == 0
+    assert status["checkouts"] == before + 1
+    assert status["max_wait_ms"] >= 0
+    await engine.dispose()
+
+@pytest.mark.asyncio
+async def test_diagnostics_pool_endpoint(client):
+    response = await client.get("/diagnostics/pool")
+    assert response.status_code == 200
+    assert "checkouts" in response.json()
@@ -0,0 +1,47 @@
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.metrics import instrument_engine
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+@pytest.mark.asyncio
+async def test_requests_are_recorded_by_route_template(client):
+    before = _sample("http_request_duration_seconds_count", method="GET", route="/items/{catalog_item_id}", status="404")
+
+    response = await client.get("/items/987654")
+    assert response.status_code == 404
+    await client.get("/no-such-path")
+
+    assert _sample("http_request_duration_seconds_count", method="GET", route="/items/{catalog_item_id}", status="404") == before + 1
+    assert _sample("http_request_duration_seconds_count", method="GET", route="unmatched", status="404") >= 1
+    assert _sample("http_response_size_bytes_sum", method="GET", route="/items/{catalog_item_id}") >= len(response.content)
+    assert _sample("http_requests_in_flight") == 0
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_serves_prometheus_text(client):
+    await client.get("/types")
+
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'http_request_duration_seconds_bucket{le="0.005",method="GET",route="/types",status="200"}' in response.text
+    assert "db_query_duration_seconds" in response.text
+
+@pytest.mark.asyncio
+async def test_instrumented_engine_times_each_statement(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'metrics.db'}")
+    instrument_engine(engine)
+    before = _sample("db_query_duration_seconds_count", operation="SELECT")
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("select 2"))
+    finally:
+        await engine.dispose()
+
+    assert _sample("db_query_duration_seconds_count", operation="SELECT") == before + 2
@@ -0,0 +1,133 @@
+import os
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlmodel import SQLModel
+
+from app.core.cache import TTLCache
+from app.models.catalog_item import CatalogItem
+from app.repositories.catalog_item_repository import CatalogItemRepository
+
+POSTGRES_URL = os.getenv("CATALOG_TEST_POSTGRES_URL")
+
+
+async def capture_statements(session: AsyncSession, action):
+    """Run ``action`` and return the (sql, params) pairs it sent to the database."""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    sync_engine = session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        await action(CatalogItemRepository(session, count_cache=TTLCache("plans", max_size=1, ttl_seconds=60)))
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+    return [(sql, params) for sql, params in captured if sql.lstrip().upper().startswith("SELECT")]
+
+
+async def explain(session: AsyncSession, prefix: str, sql: str, params) -> str:
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(f"{prefix} {sql}", tuple(params))
+    return " | ".join(str(row[-1]) for row in result.all())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("filters", "expected_index"),
+    [
+        ({"brand_id": 1}, "ix_catalogitem_brand_id_id"),
+        ({"type_id": 1}, "ix_catalogitem_type_id_id"),
+        ({"brand_id": 1, "type_id": 1}, "ix_catalogitem_brand_id_type_id_id"),
+    ],
+)
+async def test_sqlite_listing_uses_filter_indexes(db_session, filters, expected_index):
+    statements = await capture_statements(
+        db_session, lambda repo: repo.list_catalog_items(take=10, after_id=0, **filters)
+    )
+    assert len(statements) == 1
+    plan = await explain(db_session, "EXPLAIN QUERY PLAN", *statements[0])
+    assert expected_index in plan
+    # The index already yields rows in id order.
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.asyncio
+async def test_sqlite_grouped_count_uses_covering_index(db_session):
+    statements = await capture_statements(db_session, lambda repo: repo.count_catalog_items(brand_id=1))
+    assert len(statements) == 1
+    plan = await explain(db_session, "EXPLAIN QUERY PLAN", *statements[0])
+    assert "COVERING INDEX ix_catalogitem_brand_id_type_id_id" in plan
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize(
+    ("order_by", "after_value", "expected_index"),
+    [("price", 10, "ix_catalogitem_price_id"), ("name", "M", "ux_catalogitem_name")],
+)
+async def test_sqlite_sorted_listing_seeks_sort_index(db_session, order_by, after_value, expected_index, descending):
+    statements = await capture_statements(
+        db_session,
+        lambda repo: repo.list_catalog_items(
+            take=10, order_by=order_by, descending=descending, after_id=1, after_value=after_value
+        ),
+    )
+    assert len(statements) == 1
+    plan = await explain(db_session, "EXPLAIN QUERY PLAN", *statements[0])
+    assert expected_index in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.asyncio
+async def test_sqlite_search_uses_fts_index(db_session):
+    statements = await capture_statements(
+        db_session, lambda repo: repo.search_catalog_items(["mug"], take=10, brand_id=1)
+    )
+    plan = await explain(db_session, "EXPLAIN QUERY PLAN", *statements[0])
+    assert "VIRTUAL TABLE INDEX" in plan
+    assert "SCAN catalogitem " not in f"{plan} "
+
+
+@pytest_asyncio.fixture
+async def postgres_session():
+    if not POSTGRES_URL:
+        pytest.skip("CATALOG_TEST_POSTGRES_URL is not set")
+    engine = create_async_engine(POSTGRES_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        # Tiny test tables would otherwise always be planned as sequential scans.
+        await session.execute(text("SET enable_seqscan = off"))
+        yield session
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("filters", "expected_index"),
+    [
+        ({"brand_id": 1}, "ix_catalogitem_brand_id_id"),
+        ({"type_id": 1}, "ix_catalogitem_type_id_id"),
+        ({"brand_id": 1, "type_id": 1}, "ix_catalogitem_brand_id_type_id_id"),
+    ],
+)
+async def test_postgres_listing_uses_filter_indexes(postgres_session, filters, expected_index):
+    statements = await capture_statements(
+        postgres_session, lambda repo: repo.list_catalog_items(take=10, after_id=0, **filters)
+    )
+    assert len(statements) == 1
+    plan = await explain(postgres_session, "EXPLAIN", *statements[0])
+    assert expected_index in plan
+
+
+@pytest.mark.asyncio
+async def test_postgres_search_uses_gin_index(postgres_session):
+    statements = await capture_statements(
+        postgres_session, lambda repo: repo.search_catalog_items(["mug"], take=10)
+    )
+    plan = await explain(postgres_session, "EXPLAIN", *statements[0])
+    assert "ix_catalogitem_search" in plan
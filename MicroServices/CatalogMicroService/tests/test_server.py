@@ -0,0 +1,25 @@
+import ssl
+
+import pytest
+
+from app.server import tune_ssl_context
+
+
+def test_tune_ssl_context_applies_tls_settings(monkeypatch):
+    monkeypatch.setenv("TLS_MIN_VERSION", "1.3")
+    monkeypatch.setenv("TLS_SESSION_TICKETS", "4")
+    context = tune_ssl_context(ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER))
+    assert context.minimum_version == ssl.TLSVersion.TLSv1_3
+    assert context.num_tickets == 4
+    assert not context.options & ssl.OP_NO_TICKET
+
+    monkeypatch.setenv("TLS_SESSION_TICKETS", "0")
+    context = tune_ssl_context(ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER))
+    assert context.num_tickets == 0
+    assert context.options & ssl.OP_NO_TICKET
+
+
+def test_tune_ssl_context_rejects_unknown_version(monkeypatch):
+    monkeypatch.setenv("TLS_MIN_VERSION", "1.1")
+    with pytest.raises(ValueError):
+        tune_ssl_context(ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER))
@@ -0,0 +1,45 @@
+from logging.config import fileConfig
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+from alembic import context
+import os
+import sys
+
+config = context.config
+# The service runs migrations in-process at startup and keeps its own logging setup.
+if config.attributes.get("configure_logger", True):
+    if config.config_file_name is not None:
+        fileConfig(config.config_file_name)
+    else:
+        fileConfig("alembic.ini")
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.db import DATABASE_URL  # noqa: E402
+from app.models import Base  # noqa: E402
+
+target_metadata = Base.metadata
+
+def run_migrations_offline():
+    url = DATABASE_URL
+    context.configure(url=url, target_metadata=target_metadata, literal_binds=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+def do_run_migrations(connection: Connection):
+    context.configure(connection=connection, target_metadata=target_metadata)
+    with context.begin_transaction():
+        context.run_migrations()
+
+async def run_migrations_online():
+    connectable = create_async_engine(DATABASE_URL, poolclass=pool.NullPool)
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await connectable.dispose()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    import asyncio
+    asyncio.run(run_migrations_online())
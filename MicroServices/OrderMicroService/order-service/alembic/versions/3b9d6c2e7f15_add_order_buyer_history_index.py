@@ -0,0 +1,33 @@
+"""add order buyer history index
+
+Revision ID: 3b9d6c2e7f15
+Revises: 6e2a9d4b1c80
+Create Date: 2026-10-17 10:20:47.105923
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9d6c2e7f15'
+down_revision: Union[str, Sequence[str], None] = '6e2a9d4b1c80'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Lets a buyer's history be read newest first and resumed from an
+    # (order_date, id) position without sorting; it also covers plain
+    # buyer_id lookups, so the single-column index goes.
+    op.create_index('ix_orders_buyer_id_order_date_id', 'orders', ['buyer_id', 'order_date', 'id'], unique=False)
+    op.drop_index('ix_orders_buyer_id', table_name='orders')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_orders_buyer_id', 'orders', ['buyer_id'], unique=False)
+    op.drop_index('ix_orders_buyer_id_order_date_id', table_name='orders')
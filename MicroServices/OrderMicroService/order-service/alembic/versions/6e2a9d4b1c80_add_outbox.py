@@ -0,0 +1,38 @@
+"""add outbox
+
+Revision ID: 6e2a9d4b1c80
+Revises: a41f0c8e2d63
+Create Date: 2026-10-17 10:14:02.730551
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e2a9d4b1c80'
+down_revision: Union[str, Sequence[str], None] = 'a41f0c8e2d63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # create_all already made this table on databases that ran the outbox
+    # before migrations were introduced.
+    if sa.inspect(op.get_bind()).has_table('outbox'):
+        return
+    op.create_table('outbox',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('routing_key', sa.String(length=255), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('outbox')
@@ -0,0 +1,30 @@
+"""add order item order id index
+
+Revision ID: 7c5e2f0a9b31
+Revises: f19a3b7c6e52
+Create Date: 2026-10-17 18:41:55.930172
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c5e2f0a9b31'
+down_revision: Union[str, Sequence[str], None] = 'f19a3b7c6e52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Order reads join orderitems on order_id; without an index every
+    # order probes the whole table.
+    op.create_index(op.f('ix_orderitems_order_id'), 'orderitems', ['order_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_orderitems_order_id'), table_name='orderitems')
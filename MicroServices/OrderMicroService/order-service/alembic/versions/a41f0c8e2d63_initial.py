@@ -0,0 +1,57 @@
+"""initial
+
+Revision ID: a41f0c8e2d63
+Revises: 
+Create Date: 2026-10-17 10:12:31.418206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41f0c8e2d63'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Databases created by create_all before migrations existed are stamped
+    # at this revision by app/db.py instead of running it.
+    op.create_table('orders',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('buyer_id', sa.String(length=256), nullable=False),
+    sa.Column('order_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('shiptoaddress_street', sa.String(length=180), nullable=True),
+    sa.Column('shiptoaddress_city', sa.String(length=100), nullable=True),
+    sa.Column('shiptoaddress_state', sa.String(length=60), nullable=True),
+    sa.Column('shiptoaddress_country', sa.String(length=90), nullable=True),
+    sa.Column('shiptoaddress_zipcode', sa.String(length=18), nullable=True),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_orders_buyer_id'), 'orders', ['buyer_id'], unique=False)
+    op.create_index(op.f('ix_orders_id'), 'orders', ['id'], unique=False)
+    op.create_table('orderitems',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('order_id', sa.Integer(), nullable=True),
+    sa.Column('itemordered_catalogitemid', sa.Integer(), nullable=True),
+    sa.Column('itemordered_productname', sa.String(length=50), nullable=True),
+    sa.Column('itemordered_pictureuri', sa.String(length=500), nullable=True),
+    sa.Column('unitprice', sa.Numeric(precision=18, scale=2), nullable=False),
+    sa.Column('units', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('orderitems')
+    op.drop_index(op.f('ix_orders_id'), table_name='orders')
+    op.drop_index(op.f('ix_orders_buyer_id'), table_name='orders')
+    op.drop_table('orders')
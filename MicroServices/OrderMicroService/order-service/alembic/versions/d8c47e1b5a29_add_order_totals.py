@@ -0,0 +1,41 @@
+"""add order totals
+
+Revision ID: d8c47e1b5a29
+Revises: 3b9d6c2e7f15
+Create Date: 2026-10-17 13:05:18.562310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8c47e1b5a29'
+down_revision: Union[str, Sequence[str], None] = '3b9d6c2e7f15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('orders') as batch_op:
+        batch_op.add_column(sa.Column('total', sa.Numeric(precision=18, scale=2), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('item_count', sa.Integer(), server_default='0', nullable=False))
+    # Backfill existing orders from their items; new orders get both values
+    # from services.create_order.
+    op.execute(
+        """
+        UPDATE orders SET
+            total = COALESCE((SELECT SUM(unitprice * units) FROM orderitems WHERE orderitems.order_id = orders.id), 0),
+            item_count = COALESCE((SELECT SUM(units) FROM orderitems WHERE orderitems.order_id = orders.id), 0)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('orders') as batch_op:
+        batch_op.drop_column('item_count')
+        batch_op.drop_column('total')
@@ -0,0 +1,16 @@
+import logging
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from app import db, outbox
+
+router = APIRouter(prefix="/api/v1/diagnostics", tags=["diagnostics"])
+logger = logging.getLogger(__name__)
+
+@router.get("/outbox")
+async def outbox_stats(session: AsyncSession = Depends(db.get_session)):
+    """Backlog and throughput of this worker's outbox relay."""
+    try:
+        return await outbox.relay.stats(session)
+    except Exception as exc:
+        logger.exception("Failed to read outbox stats")
+        raise HTTPException(status_code=500, detail="Unable to read outbox stats") from exc
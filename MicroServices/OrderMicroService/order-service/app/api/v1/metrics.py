@@ -0,0 +1,9 @@
+from fastapi import APIRouter
+from app import metrics
+
+router = APIRouter(tags=["metrics"])
+
+@router.get("/metrics", include_in_schema=False)
+async def read_metrics():
+    """Prometheus text for the scraper in ``Monitoring/``; not under ``/api/v1``."""
+    return metrics.metrics_response()
@@ -1,21 +1,123 @@
 import logging
-from fastapi import APIRouter, Depends, HTTPException
+import os
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from app import schemas, services, db
+from app import schemas, services, db, pagination
 
 router = APIRouter(prefix="/api/v1/orders", tags=["orders"])
 logger = logging.getLogger(__name__)
 
+DEFAULT_LIST_LIMIT = int(os.getenv("ORDER_LIST_DEFAULT_LIMIT", "50"))
+MAX_LIST_LIMIT = int(os.getenv("ORDER_LIST_MAX_LIMIT", "200"))
+BATCH_MAX_ORDERS = int(os.getenv("ORDER_BATCH_MAX_ORDERS", "1000"))
+
+def _list_scope(buyer_id: str, date_from: Optional[datetime], date_to: Optional[datetime]) -> dict:
+    return {
+        "buyer": buyer_id,
+        "from": date_from.isoformat() if date_from else None,
+        "to": date_to.isoformat() if date_to else None,
+    }
+
+def _decode_list_cursor(cursor: str, scope: dict) -> tuple[datetime, int]:
+    """Position encoded by a previous page; only valid for the same buyer and date range."""
+    position = pagination.decode_cursor(cursor)
+    if any(position.get(key) != value for key, value in scope.items()):
+        raise ValueError("Cursor does not match the requested filters")
+    order_id = position.get("id")
+    order_date = position.get("date")
+    if not isinstance(order_id, int) or not isinstance(order_date, str):
+        raise ValueError("Invalid cursor")
+    return datetime.fromisoformat(order_date), order_id
+
+def _history_page_params(
+    buyer_id: str,
+    limit: int = Query(DEFAULT_LIST_LIMIT, ge=1, le=MAX_LIST_LIMIT),
+    cursor: Optional[str] = None,
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+) -> dict:
+    scope = _list_scope(buyer_id, date_from, date_to)
+    after = None
+    if cursor:
+        try:
+            after = _decode_list_cursor(cursor, scope)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return {
+        "scope": scope,
+        "query": {
+            "buyer_id": buyer_id,
+            "limit": limit,
+            "after": after,
+            "date_from": date_from,
+            "date_to": date_to,
+        },
+    }
+
+def _set_next_cursor(response: Response, scope: dict, next_position) -> None:
+    if next_position is not None:
+        order_date, order_id = next_position
+        response.headers["X-Next-Cursor"] = pagination.encode_cursor(
+            {**scope, "date": order_date.isoformat(), "id": order_id}
+        )
+
 @router.post("", response_model=schemas.OrderRead, status_code=201)
-async def create_order(order_in: schemas.OrderCreate, session: AsyncSession = Depends(db.get_session)):
+async def create_order(
+    order_in: schemas.OrderCreate,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    session: AsyncSession = Depends(db.get_session),
+):
+    """Retries with the same ``Idempotency-Key`` (or, without one, the same basket) replay the first order."""
     logger.info("Received create_order request for buyer_id=%s basket_id=%s", order_in.buyer_id, order_in.basket_id)
     try:
-        order = await services.create_order(session, order_in)
+        order, replayed = await services.create_order(session, order_in, idempotency_key)
+    except services.IdempotencyConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
     except Exception as exc:
         logger.exception("Failed to create order for buyer_id=%s basket_id=%s", order_in.buyer_id, order_in.basket_id)
         raise HTTPException(status_code=500, detail="Unable to create order") from exc
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
     return order
 
+@router.post("/batch", response_model=list[schemas.OrderRead], status_code=201)
+async def create_orders(batch: schemas.OrderBatchCreate, session: AsyncSession = Depends(db.get_session)):
+    """Create every order in the batch or none of them; results follow the request order.
+
+    Orders for baskets that were already ordered are replayed, as on ``POST /api/v1/orders``.
+    """
+    if len(batch.orders) > BATCH_MAX_ORDERS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_ORDERS} orders can be created at once")
+    logger.info("Received create_orders request with %s orders", len(batch.orders))
+    try:
+        orders = await services.create_orders(session, batch.orders)
+    except services.IdempotencyConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    except Exception as exc:
+        logger.exception("Failed to create a batch of %s orders", len(batch.orders))
+        raise HTTPException(status_code=500, detail="Unable to create orders") from exc
+    return orders
+
+@router.get("/summary", response_model=list[schemas.OrderSummary])
+async def list_order_summaries(
+    response: Response,
+    page: dict = Depends(_history_page_params),
+    session: AsyncSession = Depends(db.get_session),
+):
+    """Order headers with persisted totals, paged like ``GET /api/v1/orders``; never reads item rows."""
+    buyer_id = page["query"]["buyer_id"]
+    logger.debug("Listing order summaries for buyer_id=%s limit=%s", buyer_id, page["query"]["limit"])
+    try:
+        summaries, next_position = await services.list_order_summaries_for_buyer(session, **page["query"])
+    except Exception as exc:
+        logger.exception("Failed to list order summaries for buyer_id=%s", buyer_id)
+        raise HTTPException(status_code=500, detail="Unable to list order summaries") from exc
+    _set_next_cursor(response, page["scope"], next_position)
+    return summaries
+
 @router.get("/{order_id}", response_model=schemas.OrderRead)
 async def get_order(order_id: int, session: AsyncSession = Depends(db.get_session)):
     logger.debug("Fetching order_id=%s", order_id)
@@ -30,11 +132,18 @@ async def get_order(order_id: int, session: AsyncSession = Depends(db.get_sessio
     return order
 
 @router.get("", response_model=list[schemas.OrderRead])
-async def list_orders(buyer_id: str, session: AsyncSession = Depends(db.get_session)):
-    logger.debug("Listing orders for buyer_id=%s", buyer_id)
+async def list_orders(
+    response: Response,
+    page: dict = Depends(_history_page_params),
+    session: AsyncSession = Depends(db.get_session),
+):
+    """Newest orders first. When more remain, ``X-Next-Cursor`` holds the cursor for the next page."""
+    buyer_id = page["query"]["buyer_id"]
+    logger.debug("Listing orders for buyer_id=%s limit=%s", buyer_id, page["query"]["limit"])
     try:
-        orders = await services.list_orders_for_buyer(session, buyer_id)
+        orders, next_position = await services.list_orders_for_buyer(session, **page["query"])
     except Exception as exc:
         logger.exception("Failed to list orders for buyer_id=%s", buyer_id)
         raise HTTPException(status_code=500, detail="Unable to list orders") from exc
+    _set_next_cursor(response, page["scope"], next_position)
     return orders
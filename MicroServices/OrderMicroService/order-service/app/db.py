@@ -1,14 +1,71 @@
+import asyncio
+import logging
 import os
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
+from app.metrics import instrument_engine
+
 DATABASE_URL = os.getenv(
     "DATABASE_URL", "postgresql+asyncpg://postgres:password@db:5432/orders"
 )
 
+# "migrate" applies pending alembic revisions at startup; "create" runs
+# create_all for throwaway databases; "skip" leaves the schema alone (set by
+# app/server.py for its workers once it has migrated the database itself).
+DB_INIT_MODE = os.getenv("ORDER_DB_INIT_MODE", "migrate").lower()
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+# Schema that create_all produced before the service had migrations.
+BASELINE_REVISION = "a41f0c8e2d63"
+
+logger = logging.getLogger(__name__)
+
 engine = create_async_engine(DATABASE_URL, future=True, echo=False)
+if os.getenv("DB_QUERY_METRICS", "false").lower() in ("1", "true", "yes", "on"):
+    instrument_engine(engine)
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 async def get_session() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         yield session
+
+async def init_db():
+    if DB_INIT_MODE == "skip":
+        logger.info("ORDER_DB_INIT_MODE=skip; leaving schema alone")
+        return
+    if DB_INIT_MODE == "create":
+        from app import models
+        async with engine.begin() as conn:
+            await conn.run_sync(models.Base.metadata.create_all)
+        return
+    await _migrate_schema()
+
+def _alembic_config() -> Config:
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["configure_logger"] = False
+    return config
+
+def _current_revision(sync_conn):
+    return MigrationContext.configure(sync_conn).get_current_revision(), inspect(sync_conn).has_table("orders")
+
+async def _migrate_schema():
+    config = _alembic_config()
+    head = ScriptDirectory.from_config(config).get_current_head()
+    async with engine.connect() as conn:
+        current, has_orders = await conn.run_sync(_current_revision)
+    if current == head:
+        logger.info("Database schema is at head revision %s", head)
+        return
+    # alembic's env.py drives its own event loop, so keep it off this one.
+    if current is None and has_orders:
+        logger.info("Adopting schema created without migrations at revision %s", BASELINE_REVISION)
+        await asyncio.to_thread(command.stamp, config, BASELINE_REVISION)
+    logger.info("Upgrading database schema from %s to %s", current, head)
+    await asyncio.to_thread(command.upgrade, config, "head")
@@ -0,0 +1,54 @@
+# idempotency.py
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app import schemas
+
+CACHE_SIZE = int(os.getenv("ORDER_IDEMPOTENCY_CACHE_SIZE", "1024"))
+
+
+def resolve_key(order_in: schemas.OrderCreate, header_key: Optional[str]) -> str:
+    """The client's ``Idempotency-Key``, or the basket when none was sent.
+
+    A basket is checked out once, so a retried checkout of the same basket
+    is a replay even from clients that do not send the header.
+    """
+    return header_key or f"basket:{order_in.basket_id}"
+
+
+def request_fingerprint(order_in: schemas.OrderCreate) -> str:
+    return hashlib.sha256(order_in.model_dump_json().encode()).hexdigest()
+
+
+class RecentOrders:
+    """Per-worker LRU of recently created orders keyed by (buyer_id, key).
+
+    Answers retries that land on the same worker without a database round
+    trip; the unique key in ``order_idempotency_keys`` covers everything else.
+    """
+
+    def __init__(self, max_size: int = CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: OrderedDict[Tuple[str, str], Tuple[str, schemas.OrderRead]] = OrderedDict()
+
+    def get(self, buyer_id: str, key: str) -> Optional[Tuple[str, schemas.OrderRead]]:
+        entry = self._entries.get((buyer_id, key))
+        if entry is not None:
+            self._entries.move_to_end((buyer_id, key))
+        return entry
+
+    def set(self, buyer_id: str, key: str, fingerprint: str, order: schemas.OrderRead) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[(buyer_id, key)] = (fingerprint, order)
+        self._entries.move_to_end((buyer_id, key))
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+recent_orders = RecentOrders()
@@ -1,8 +1,8 @@
 from fastapi import FastAPI
-from app.api.v1 import orders
-from app import events
-from app.db import engine
-from app import models
+from app.api.v1 import diagnostics, metrics, orders
+from app import events, outbox
+from app.metrics import PrometheusMiddleware, mark_worker_stopped
+from app.db import init_db
 from .logging_config import setup_logging
 import logging
 
@@ -10,19 +10,24 @@ setup_logging()
 logger = logging.getLogger(__name__)
 
 app = FastAPI(title="Order Service")
+app.add_middleware(PrometheusMiddleware)
 app.include_router(orders.router)
+app.include_router(diagnostics.router)
+app.include_router(metrics.router)
 
 @app.on_event("startup")
 async def startup():
     logger.info("Starting up: connecting RabbitMQ and initializing DB")
     await events.publisher.connect()
-    async with engine.begin() as conn:
-        await conn.run_sync(models.Base.metadata.create_all)
+    await init_db()
+    outbox.relay.start()
 
 @app.on_event("shutdown")
 async def shutdown():
-    logger.info("Shutting down: closing RabbitMQ connection")
+    logger.info("Shutting down: stopping outbox relay and closing RabbitMQ connection")
+    await outbox.relay.stop()
     await events.publisher.close()
+    mark_worker_stopped()
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Numeric, ForeignKey
+from sqlalchemy import JSON, Column, Integer, String, DateTime, Numeric, ForeignKey, Index
 from sqlalchemy.orm import relationship, declarative_base
 import datetime
 
@@ -9,8 +9,13 @@ def utcnow():
 
 class Order(Base):
     __tablename__ = "orders"
+    # Serves a buyer's order history newest first, paged on (order_date, id).
+    # Mirrors alembic revision 3b9d6c2e7f15; keep them in sync.
+    __table_args__ = (
+        Index("ix_orders_buyer_id_order_date_id", "buyer_id", "order_date", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
-    buyer_id = Column(String(256), nullable=False, index=True)
+    buyer_id = Column(String(256), nullable=False)
     order_date = Column(DateTime(timezone=True), default=utcnow)
 
     shiptoaddress_street = Column(String(180), nullable=True)
@@ -21,6 +26,10 @@ class Order(Base):
 
     status = Column(String(50), nullable=False, default='PENDING')
 
+    # Computed once when the order is created (see services.create_order).
+    total = Column(Numeric(18,2), nullable=False, default=0, server_default="0")
+    item_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     items = relationship(
         "OrderItem",
         back_populates="order",
@@ -32,7 +41,8 @@ class Order(Base):
 class OrderItem(Base):
     __tablename__ = "orderitems"
     id = Column(Integer, primary_key=True)
-    order_id = Column(Integer, ForeignKey("orders.id", ondelete="CASCADE"))
+    # Indexed for the orders-to-items join; mirrors alembic revision 7c5e2f0a9b31.
+    order_id = Column(Integer, ForeignKey("orders.id", ondelete="CASCADE"), index=True)
 
     itemordered_catalogitemid = Column(Integer, nullable=True)
     itemordered_productname = Column(String(50), nullable=True)
@@ -42,3 +52,30 @@ class OrderItem(Base):
     units = Column(Integer, nullable=False)
 
     order = relationship("Order", back_populates="items")
+
+
+class OutboxMessage(Base):
+    """An event written in the same transaction as the change it announces.
+
+    The outbox relay publishes pending rows and deletes them once the broker
+    has confirmed them.
+    """
+    __tablename__ = "outbox"
+    id = Column(Integer, primary_key=True)
+    routing_key = Column(String(255), nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=utcnow)
+
+
+class OrderIdempotencyKey(Base):
+    """The response an order creation returned, kept so retries can replay it.
+
+    Keyed by the client's Idempotency-Key, or by its basket when it sent none.
+    """
+    __tablename__ = "order_idempotency_keys"
+    buyer_id = Column(String(256), primary_key=True)
+    idempotency_key = Column(String(255), primary_key=True)
+    order_id = Column(Integer, ForeignKey("orders.id", ondelete="CASCADE"), nullable=False)
+    request_hash = Column(String(64), nullable=False)
+    response = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=utcnow)
@@ -0,0 +1,168 @@
+# outbox.py
+import asyncio
+import datetime
+import logging
+import os
+import time
+from collections import deque
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app import events, models
+from app.db import AsyncSessionLocal
+
+BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+POLL_INTERVAL_SECONDS = float(os.getenv("OUTBOX_POLL_INTERVAL_SECONDS", "1.0"))
+MAX_BACKOFF_SECONDS = float(os.getenv("OUTBOX_MAX_BACKOFF_SECONDS", "30"))
+RATE_WINDOW_SECONDS = float(os.getenv("OUTBOX_RATE_WINDOW_SECONDS", "60"))
+
+logger = logging.getLogger(__name__)
+
+
+def _age_seconds(created_at: datetime.datetime, now: datetime.datetime) -> float:
+    if created_at.tzinfo is None:
+        # SQLite hands timestamps back without their zone; they are stored as UTC.
+        created_at = created_at.replace(tzinfo=datetime.timezone.utc)
+    return (now - created_at).total_seconds()
+
+
+class OutboxRelay:
+    """Drains the ``outbox`` table to RabbitMQ with at-least-once delivery.
+
+    Each batch is claimed with ``FOR UPDATE SKIP LOCKED`` so several workers
+    can relay side by side, published with publisher confirms, and deleted in
+    the same transaction only after every message was confirmed. A crash
+    between the confirm and the commit republishes the batch.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker = AsyncSessionLocal,
+        publisher: events.RabbitMQPublisher = events.publisher,
+        batch_size: int = BATCH_SIZE,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        rate_window: float = RATE_WINDOW_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.publisher = publisher
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.rate_window = rate_window
+        # (monotonic time, messages) per batch relayed within the rate window.
+        self._recent_batches: deque[tuple[float, int]] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.started_at = time.monotonic()
+        self.published_total = 0
+        self.failed_batches = 0
+        self.last_batch_size = 0
+        self.last_lag_seconds: float | None = None
+        self.last_published_at: datetime.datetime | None = None
+
+    def notify(self) -> None:
+        """Wake the relay now instead of at its next poll."""
+        self._wakeup.set()
+
+    def start(self) -> None:
+        if self._task is None:
+            self.started_at = time.monotonic()
+            self._task = asyncio.create_task(self._run(), name="outbox-relay")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def relay_once(self) -> int:
+        """Publish and delete one batch; returns how many messages it relayed."""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(models.OutboxMessage)
+                .order_by(models.OutboxMessage.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            messages = result.scalars().all()
+            if not messages:
+                return 0
+            try:
+                await self.publisher.publish_many((m.routing_key, m.payload) for m in messages)
+                await session.execute(
+                    delete(models.OutboxMessage).where(
+                        models.OutboxMessage.id.in_([m.id for m in messages])
+                    )
+                )
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                self.failed_batches += 1
+                raise
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        self.published_total += len(messages)
+        self.last_batch_size = len(messages)
+        self.last_lag_seconds = _age_seconds(messages[0].created_at, now)
+        self.last_published_at = now
+        self._recent_batches.append((time.monotonic(), len(messages)))
+        logger.debug("Relayed %s outbox messages lag=%.3fs", len(messages), self.last_lag_seconds)
+        return len(messages)
+
+    async def _run(self) -> None:
+        backoff = self.poll_interval
+        while True:
+            try:
+                relayed = await self.relay_once()
+                backoff = self.poll_interval
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Outbox relay failed; retrying in %.1fs", backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+                continue
+            if relayed == self.batch_size:
+                continue
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def published_per_second(self) -> float:
+        """Relay rate over the last ``rate_window`` seconds (or since start, if shorter)."""
+        now = time.monotonic()
+        while self._recent_batches and self._recent_batches[0][0] < now - self.rate_window:
+            self._recent_batches.popleft()
+        window = max(min(self.rate_window, now - self.started_at), 1e-9)
+        return sum(count for _, count in self._recent_batches) / window
+
+    async def stats(self, session: AsyncSession) -> dict:
+        pending, oldest = (
+            await session.execute(
+                select(func.count(), func.min(models.OutboxMessage.created_at)).select_from(
+                    models.OutboxMessage
+                )
+            )
+        ).one()
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "pending": pending,
+            "oldest_pending_age_seconds": None if oldest is None else _age_seconds(oldest, now),
+            "published_total": self.published_total,
+            "published_per_second": self.published_per_second(),
+            "rate_window_seconds": self.rate_window,
+            "failed_batches": self.failed_batches,
+            "last_batch_size": self.last_batch_size,
+            "last_lag_seconds": self.last_lag_seconds,
+            "last_published_at": self.last_published_at,
+        }
+
+
+relay = OutboxRelay()
@@ -24,7 +24,11 @@ class OrderCreate(BaseModel):
     buyer_id: str
     basket_id: int
     shipping: Shipping
-    items: List[OrderItemCreate]
+    # An order without items would still queue an empty stock confirmation.
+    items: List[OrderItemCreate] = Field(min_length=1)
+
+class OrderBatchCreate(BaseModel):
+    orders: List[OrderCreate] = Field(min_length=1)
 
 # ----------------------- Output Schemas -----------------------
 class OrderItemRead(BaseModel):
@@ -49,6 +53,14 @@ class OrderRead(BaseModel):
     class Config:
         from_attributes = True
 
+class OrderSummary(BaseModel):
+    id: int
+    buyer_id: str
+    order_date: datetime
+    status: str
+    total: float
+    item_count: int  # units across all lines
+
 
 # ----------------------- Event Schemas -----------------------
 
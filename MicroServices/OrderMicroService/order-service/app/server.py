@@ -1,9 +1,12 @@
+"""``python -m app.server``: runs migrations once, then serves the API over mTLS from worker processes."""
+import asyncio
 import logging
 import os
 import ssl
+import tempfile
 
 import uvicorn
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 
 
 logger = logging.getLogger("orders.server")
@@ -44,22 +47,97 @@ def build_tls_args() -> Optional[Dict[str, Any]]:
         "ssl_keyfile": key_path,
         "ssl_ca_certs": ca_path,
         "ssl_cert_reqs": ssl.CERT_REQUIRED,
-        "ssl_version": ssl.PROTOCOL_TLS,
+        "ssl_version": ssl.PROTOCOL_TLS_SERVER,
+        "ssl_context_factory": tls_context_factory,
     }
 
 
+TLS_MIN_VERSIONS = {"1.2": ssl.TLSVersion.TLSv1_2, "1.3": ssl.TLSVersion.TLSv1_3}
+
+
+def tune_ssl_context(context: ssl.SSLContext) -> ssl.SSLContext:
+    min_version = os.getenv("TLS_MIN_VERSION", "1.2")
+    if min_version not in TLS_MIN_VERSIONS:
+        raise ValueError(f"TLS_MIN_VERSION must be one of {', '.join(TLS_MIN_VERSIONS)}")
+    context.minimum_version = TLS_MIN_VERSIONS[min_version]
+    tickets = int(os.getenv("TLS_SESSION_TICKETS", "2"))
+    if tickets > 0:
+        context.num_tickets = tickets
+    else:
+        context.options |= ssl.OP_NO_TICKET
+        context.num_tickets = 0
+    return context
+
+
+def tls_context_factory(config: uvicorn.Config, default_factory: Callable[[], ssl.SSLContext]) -> ssl.SSLContext:
+    return tune_ssl_context(default_factory())
+
+
+def worker_count() -> int:
+    return max(int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))), 1)
+
+
+def build_worker_args(workers: int) -> Dict[str, Any]:
+    args: Dict[str, Any] = {
+        "workers": workers,
+        "loop": os.getenv("UVICORN_LOOP", "auto"),
+        "http": os.getenv("UVICORN_HTTP", "auto"),
+        "timeout_graceful_shutdown": int(os.getenv("UVICORN_GRACEFUL_SHUTDOWN_SECONDS", "30")),
+    }
+    max_requests = int(os.getenv("UVICORN_LIMIT_MAX_REQUESTS", "0"))
+    if max_requests > 0:
+        if workers > 1:
+            args["limit_max_requests"] = max_requests
+        else:
+            logger.warning("UVICORN_LIMIT_MAX_REQUESTS needs WEB_CONCURRENCY > 1; ignoring it")
+    return args
+
+
+def prepare_database() -> None:
+    """Migrate before the workers start; they run with ``ORDER_DB_INIT_MODE=skip``."""
+    from app import db as database
+
+    async def _init() -> None:
+        try:
+            await database.init_db()
+        finally:
+            await database.engine.dispose()
+
+    asyncio.run(_init())
+    os.environ["ORDER_DB_INIT_MODE"] = "skip"
+    database.DB_INIT_MODE = "skip"
+
+
+def prepare_metrics(workers: int) -> None:
+    if workers <= 1:
+        return
+    path = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if not path:
+        path = tempfile.mkdtemp(prefix="orders-metrics-")
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+
+    from app.metrics import prepare_multiprocess_dir
+
+    prepare_multiprocess_dir(path)
+
+
 def main() -> None:
     port = int(os.getenv("API_PORT", "8001"))
+    workers = worker_count()
+    prepare_metrics(workers)
+    prepare_database()
     tls_args = build_tls_args() or {}
+    logger.info("Starting %s worker(s) on port %s", workers, port)
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=port,
         log_level=os.getenv("UVICORN_LOG_LEVEL", "info"),
+        timeout_keep_alive=int(os.getenv("UVICORN_TIMEOUT_KEEP_ALIVE", "100")),
+        **build_worker_args(workers),
         **tls_args,
     )
 
 
 if __name__ == "__main__":
     main()
-
@@ -1,12 +1,13 @@
 from datetime import datetime, timezone
-from decimal import Decimal
-import asyncio
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
 from typing import List
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Integer, bindparam, insert, select, tuple_
+from sqlalchemy.exc import IntegrityError
 
-from app import models, schemas, events
+from app import idempotency, models, schemas, outbox
 
 import logging
 
@@ -15,13 +16,70 @@ logger = logging.getLogger(__name__)
 # -----------------------
 # Helper: calculate total
 # -----------------------
-def calculate_total(items: List[models.OrderItem]) -> float:
-    return float(sum(item.unitprice * item.units for item in items))
+CENT = Decimal("0.01")
+
+def to_cents(price) -> Decimal:
+    """Round a price the way the Numeric(18,2) columns store it."""
+    return Decimal(str(price)).quantize(CENT, rounding=ROUND_HALF_UP)
+
+def calculate_total(items: List[models.OrderItem]) -> Decimal:
+    # Summing rounded prices matches the backfill migration's SUM.
+    return sum((to_cents(item.unitprice) * item.units for item in items), Decimal("0"))
+
+STOCK_CONFIRM_ROUTING_KEY = "catalog_item_stock.confirm"
+
+def stock_confirm_payload(order_in: schemas.OrderCreate) -> list[dict]:
+    return [
+        schemas.EventItem(
+            itemId=it.itemordered_catalogitemid,
+            amount=it.units,
+            basketId=order_in.basket_id
+        ).model_dump()
+        for it in order_in.items
+    ]
+
+class IdempotencyConflictError(Exception):
+    """An idempotency key was reused for a different order request."""
+
+def _replay(order_in: schemas.OrderCreate, key: str, fingerprint: str, stored_fingerprint: str, order: schemas.OrderRead) -> schemas.OrderRead:
+    if stored_fingerprint != fingerprint:
+        raise IdempotencyConflictError(f"Idempotency key {key!r} was already used for a different order")
+    logger.info("Replaying order id=%s buyer_id=%s key=%s", order.id, order_in.buyer_id, key)
+    return order
+
+async def _stored_order(db: AsyncSession, buyer_id: str, key: str) -> tuple[str, schemas.OrderRead] | None:
+    """Stored (fingerprint, response) for a key already used, from the cache or by primary key."""
+    cached = idempotency.recent_orders.get(buyer_id, key)
+    if cached is not None:
+        return cached
+    record = await db.get(models.OrderIdempotencyKey, (buyer_id, key))
+    if record is None:
+        return None
+    found = (record.request_hash, schemas.OrderRead.model_validate(record.response))
+    idempotency.recent_orders.set(buyer_id, key, *found)
+    return found
 
 # -----------------------
 # Create a new order
 # -----------------------
-async def create_order(db: AsyncSession, order_in: schemas.OrderCreate) -> schemas.OrderRead:
+async def create_order(
+    db: AsyncSession,
+    order_in: schemas.OrderCreate,
+    idempotency_key: str | None = None,
+) -> tuple[schemas.OrderRead, bool]:
+    """Create an order, or replay the one already created under the same key.
+
+    Returns the order and whether it was replayed. The key is looked up before
+    anything is written, so a replay reads only the stored response, writes
+    nothing and queues no stock confirmation; reusing a key for a different
+    request raises :class:`IdempotencyConflictError`.
+    """
+    key = idempotency.resolve_key(order_in, idempotency_key)
+    fingerprint = idempotency.request_fingerprint(order_in)
+    stored = await _stored_order(db, order_in.buyer_id, key)
+    if stored is not None:
+        return _replay(order_in, key, fingerprint, *stored), True
+
     # Create Order model with timezone-aware UTC datetime
     order = models.Order(
         buyer_id=order_in.buyer_id,
@@ -45,9 +103,61 @@ async def create_order(db: AsyncSession, order_in: schemas.OrderCreate) -> schem
             )
         )
 
+    # Totals are persisted once here so reads never need the item rows.
+    order.total = calculate_total(order.items)
+    order.item_count = sum(item.units for item in order.items)
     db.add(order)
+
     try:
+        # INSERT ... RETURNING hands back the generated ids; every other
+        # field, order_date and status included, is already set in memory, so
+        # the response is built without reading the order back.
+        await db.flush()
+        order_read = schemas.OrderRead(
+            id=order.id,
+            buyer_id=order.buyer_id,
+            order_date=order.order_date,
+            shipping=order_in.shipping,
+            status=order.status,
+            items=[
+                schemas.OrderItemRead(
+                    id=i.id,
+                    itemordered_catalogitemid=i.itemordered_catalogitemid,
+                    itemordered_productname=i.itemordered_productname,
+                    itemordered_pictureuri=i.itemordered_pictureuri,
+                    unitprice=float(to_cents(i.unitprice)),
+                    units=i.units,
+                )
+                for i in order.items
+            ],
+            total=float(order.total)
+        )
+        # Queue the stock confirmation in the same transaction as the order;
+        # the outbox relay publishes it once the commit has succeeded. Both
+        # rows go out with the commit.
+        db.add(
+            models.OutboxMessage(
+                routing_key=STOCK_CONFIRM_ROUTING_KEY,
+                payload=stock_confirm_payload(order_in),
+            )
+        )
+        db.add(
+            models.OrderIdempotencyKey(
+                buyer_id=order_in.buyer_id,
+                idempotency_key=key,
+                order_id=order.id,
+                request_hash=fingerprint,
+                response=order_read.model_dump(mode="json"),
+            )
+        )
         await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        # A concurrent request with the same key committed first.
+        stored = await _stored_order(db, order_in.buyer_id, key)
+        if stored is None:
+            raise
+        return _replay(order_in, key, fingerprint, *stored), True
     except Exception:
         await db.rollback()
         logger.exception(
@@ -56,7 +166,8 @@ async def create_order(db: AsyncSession, order_in: schemas.OrderCreate) -> schem
             order_in.basket_id,
         )
         raise
-    await db.refresh(order)
+    outbox.relay.notify()
+    idempotency.recent_orders.set(order_in.buyer_id, key, fingerprint, order_read)
 
     logger.info(
         "Created order id=%s buyer_id=%s item_count=%s",
@@ -64,132 +175,391 @@ async def create_order(db: AsyncSession, order_in: schemas.OrderCreate) -> schem
         order.buyer_id,
         len(order.items),
     )
+    return order_read, False
 
-    # Compute total
-    total_amount = calculate_total(order.items)
-
-    # Publish event to confirm stock
-    confirm_items = [
-        schemas.EventItem(
-            itemId=it.itemordered_catalogitemid,
-            amount=it.units,
-            basketId=order_in.basket_id
+# -----------------------
+# Create many orders in one transaction
+# -----------------------
+async def _stored_orders(
+    db: AsyncSession, pairs: list[tuple[str, str]]
+) -> dict[tuple[str, str], tuple[str, schemas.OrderRead]]:
+    """Stored (fingerprint, response) for each (buyer_id, key) already used."""
+    found = {}
+    misses = []
+    for pair in pairs:
+        cached = idempotency.recent_orders.get(*pair)
+        if cached is not None:
+            found[pair] = cached
+        else:
+            misses.append(pair)
+    if misses:
+        stored = await db.execute(
+            select(models.OrderIdempotencyKey).where(
+                tuple_(
+                    models.OrderIdempotencyKey.buyer_id,
+                    models.OrderIdempotencyKey.idempotency_key,
+                ).in_(misses)
+            )
         )
-        for it in order.items
+        for record in stored.scalars():
+            pair = (record.buyer_id, record.idempotency_key)
+            found[pair] = (record.request_hash, schemas.OrderRead.model_validate(record.response))
+            idempotency.recent_orders.set(*pair, *found[pair])
+    return found
+
+async def create_orders(db: AsyncSession, orders_in: List[schemas.OrderCreate]) -> list[schemas.OrderRead]:
+    """Insert a batch of orders with multi-row ``INSERT ... RETURNING`` statements.
+
+    Orders, items, outbox messages and idempotency keys each go in as one
+    statement, which SQLAlchemy sends as a few multi-row INSERTs on
+    PostgreSQL. SQLite cannot return the generated ids in parameter order, so
+    there it inserts one row per statement. Everything runs in a single
+    transaction, so either the whole batch is stored or none of it. Results
+    come back in request order.
+
+    Each order is keyed by its basket, as in :func:`create_order`: an order
+    whose basket was already ordered with the same body is replayed instead
+    of created, and one ordered with a different body raises
+    :class:`IdempotencyConflictError` for the whole batch.
+    """
+    if not orders_in:
+        return []
+    pairs = [(o.buyer_id, idempotency.resolve_key(o, None)) for o in orders_in]
+    fingerprints = [idempotency.request_fingerprint(o) for o in orders_in]
+    stored = await _stored_orders(db, list(dict.fromkeys(pairs)))
+
+    # The first order for each new basket is created; repeats of it within
+    # the batch get the same response.
+    first_index: dict[tuple[str, str], int] = {}
+    for index, (o, pair, fingerprint) in enumerate(zip(orders_in, pairs, fingerprints)):
+        if pair in stored:
+            _replay(o, pair[1], fingerprint, *stored[pair])
+        elif pair in first_index:
+            if fingerprints[first_index[pair]] != fingerprint:
+                raise IdempotencyConflictError(f"Basket {pair[1]!r} appears twice in the batch with different orders")
+        else:
+            first_index[pair] = index
+    new_indexes = list(first_index.values())
+    if not new_indexes:
+        return [stored[pair][1] for pair in pairs]
+
+    new_orders = [orders_in[i] for i in new_indexes]
+    now = datetime.now(timezone.utc)
+    order_rows = [
+        {
+            "buyer_id": o.buyer_id,
+            "order_date": now,
+            "shiptoaddress_street": o.shipping.street,
+            "shiptoaddress_city": o.shipping.city,
+            "shiptoaddress_state": o.shipping.state,
+            "shiptoaddress_country": o.shipping.country,
+            "shiptoaddress_zipcode": o.shipping.zip,
+            "total": calculate_total(o.items),
+            "item_count": sum(it.units for it in o.items),
+        }
+        for o in new_orders
     ]
-    confirm_payload = [item.model_dump() for item in confirm_items]
-    asyncio.create_task(safe_publish("catalog_item_stock.confirm", confirm_payload))
-
-    # Return OrderRead
-    return schemas.OrderRead(
-        id=order.id,
-        buyer_id=order.buyer_id,
-        order_date=order.order_date,  # use DB value
-        shipping=schemas.Shipping(
-            street=order.shiptoaddress_street,
-            city=order.shiptoaddress_city,
-            state=order.shiptoaddress_state,
-            country=order.shiptoaddress_country,
-            zip=order.shiptoaddress_zipcode,
-        ),
-        status=order.status,
-        items=[
-            schemas.OrderItemRead(
-                id=i.id,
-                itemordered_catalogitemid=i.itemordered_catalogitemid,
-                itemordered_productname=i.itemordered_productname,
-                itemordered_pictureuri=i.itemordered_pictureuri,
-                unitprice=float(i.unitprice),
-                units=i.units,
+    try:
+        result = await db.execute(
+            insert(models.Order).returning(
+                models.Order.id,
+                models.Order.order_date,
+                models.Order.status,
+                sort_by_parameter_order=True,
+            ),
+            order_rows,
+        )
+        headers = result.all()
+        item_rows = [
+            {
+                "order_id": header.id,
+                "itemordered_catalogitemid": it.itemordered_catalogitemid,
+                "itemordered_productname": it.itemordered_productname,
+                "itemordered_pictureuri": it.itemordered_pictureuri,
+                "unitprice": it.unitprice,
+                "units": it.units,
+            }
+            for header, o in zip(headers, new_orders)
+            for it in o.items
+        ]
+        item_ids = []
+        if item_rows:
+            result = await db.execute(
+                insert(models.OrderItem).returning(models.OrderItem.id, sort_by_parameter_order=True),
+                item_rows,
             )
-            for i in order.items
-        ],
-        total=float(total_amount)
-    )
+            item_ids = result.scalars().all()
 
-async def safe_publish(routing_key, payload):
-    try:
-        await events.publisher.publish(routing_key, payload)
-        payload_size = len(payload) if hasattr(payload, "__len__") else "unknown"
-        logger.debug("Published event routing_key=%s payload_size=%s", routing_key, payload_size)
+        remaining_item_ids = iter(item_ids)
+        created = [
+            schemas.OrderRead(
+                id=header.id,
+                buyer_id=o.buyer_id,
+                order_date=header.order_date,
+                shipping=o.shipping,
+                status=header.status,
+                items=[
+                    schemas.OrderItemRead(
+                        id=next(remaining_item_ids),
+                        itemordered_catalogitemid=it.itemordered_catalogitemid,
+                        itemordered_productname=it.itemordered_productname,
+                        itemordered_pictureuri=it.itemordered_pictureuri,
+                        unitprice=float(to_cents(it.unitprice)),
+                        units=it.units,
+                    )
+                    for it in o.items
+                ],
+                total=float(row["total"]),
+            )
+            for header, o, row in zip(headers, new_orders, order_rows)
+        ]
+        # One outbox message per order, as for single orders; the relay
+        # publishes up to OUTBOX_BATCH_SIZE of them per publish_many.
+        await db.execute(
+            insert(models.OutboxMessage),
+            [
+                {"routing_key": STOCK_CONFIRM_ROUTING_KEY, "payload": stock_confirm_payload(o)}
+                for o in new_orders
+            ],
+        )
+        await db.execute(
+            insert(models.OrderIdempotencyKey),
+            [
+                {
+                    "buyer_id": pairs[i][0],
+                    "idempotency_key": pairs[i][1],
+                    "order_id": order.id,
+                    "request_hash": fingerprints[i],
+                    "response": order.model_dump(mode="json"),
+                }
+                for i, order in zip(new_indexes, created)
+            ],
+        )
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        # A concurrent request ordered one of these baskets first; retrying
+        # the batch replays it.
+        raise IdempotencyConflictError("A basket in this batch was ordered concurrently; retry the batch") from exc
     except Exception:
-        logger.exception("Failed to publish event '%s'", routing_key)
+        await db.rollback()
+        logger.exception("Database failure while creating a batch of %s orders", len(new_orders))
+        raise
+    outbox.relay.notify()
+    logger.info(
+        "Created %s orders with %s items in one batch; replayed %s",
+        len(created),
+        len(item_ids),
+        len(orders_in) - len(created),
+    )
+
+    for i, order in zip(new_indexes, created):
+        stored[pairs[i]] = (fingerprints[i], order)
+        idempotency.recent_orders.set(*pairs[i], fingerprints[i], order)
+    return [stored[pair][1] for pair in pairs]
+
+# -----------------------
+# Read path: an order and its items in one joined query
+# -----------------------
+# Core table columns rather than ORM attributes: the statements below then
+# skip ORM result processing (identity map, the selectin load of
+# Order.items) and yield plain tuples.
+_orders = models.Order.__table__
+_items = models.OrderItem.__table__
+
+ORDER_COLUMNS = (
+    _orders.c.id,
+    _orders.c.buyer_id,
+    _orders.c.order_date,
+    _orders.c.shiptoaddress_street,
+    _orders.c.shiptoaddress_city,
+    _orders.c.shiptoaddress_state,
+    _orders.c.shiptoaddress_country,
+    _orders.c.shiptoaddress_zipcode,
+    _orders.c.status,
+    _orders.c.total,
+)
+
+ITEM_COLUMNS = (
+    _items.c.id,
+    _items.c.itemordered_catalogitemid,
+    _items.c.itemordered_productname,
+    _items.c.itemordered_pictureuri,
+    _items.c.unitprice,
+    _items.c.units,
+)
+
+def _with_items(orders):
+    """Outer-join ``orders`` (the table or a subquery of ORDER_COLUMNS) to its items."""
+    return (
+        select(*(orders.c[c.key] for c in ORDER_COLUMNS), *ITEM_COLUMNS)
+        .select_from(orders.outerjoin(_items, _items.c.order_id == orders.c.id))
+    )
+
+def _orders_from_rows(rows) -> list[schemas.OrderRead]:
+    """Fold joined rows, grouped by order, into OrderRead objects in row order."""
+    grouped: dict[int, tuple] = {}
+    for (order_id, buyer_id, order_date, street, city, state, country, zipcode, status, total,
+         item_id, catalog_item_id, product_name, picture_uri, unitprice, units) in rows:
+        items = grouped.get(order_id)
+        if items is None:
+            items = []
+            grouped[order_id] = (
+                schemas.OrderRead(
+                    id=order_id,
+                    buyer_id=buyer_id,
+                    order_date=order_date,  # use DB value
+                    shipping=schemas.Shipping(
+                        street=street, city=city, state=state, country=country, zip=zipcode
+                    ),
+                    status=status,
+                    items=[],
+                    total=float(total),
+                ),
+                items,
+            )
+        else:
+            items = items[1]
+        if item_id is not None:
+            items.append(
+                schemas.OrderItemRead(
+                    id=item_id,
+                    itemordered_catalogitemid=catalog_item_id,
+                    itemordered_productname=product_name,
+                    itemordered_pictureuri=picture_uri,
+                    unitprice=float(unitprice),
+                    units=units,
+                )
+            )
+    orders = []
+    for order, items in grouped.values():
+        order.items = items
+        orders.append(order)
+    return orders
 
 # -----------------------
 # Get single order by ID
 # -----------------------
+_ORDER_BY_ID = (
+    _with_items(_orders).where(_orders.c.id == bindparam("order_id")).order_by(_items.c.id)
+)
+
 async def get_order(db: AsyncSession, order_id: int) -> schemas.OrderRead | None:
-    result = await db.execute(select(models.Order).where(models.Order.id == order_id))
-    order = result.scalars().first()
-    if not order:
+    result = await db.execute(_ORDER_BY_ID, {"order_id": order_id})
+    found = _orders_from_rows(result.all())
+    if not found:
         logger.debug("Order id=%s not found in database", order_id)
         return None
+    return found[0]
 
-    total_amount = calculate_total(order.items)
-
-    return schemas.OrderRead(
-        id=order.id,
-        buyer_id=order.buyer_id,
-        order_date=order.order_date,  # use DB value
-        shipping=schemas.Shipping(
-            street=order.shiptoaddress_street,
-            city=order.shiptoaddress_city,
-            state=order.shiptoaddress_state,
-            country=order.shiptoaddress_country,
-            zip=order.shiptoaddress_zipcode,
-        ),
-        status=order.status,
-        items=[
-            schemas.OrderItemRead(
-                id=i.id,
-                itemordered_catalogitemid=i.itemordered_catalogitemid,
-                itemordered_productname=i.itemordered_productname,
-                itemordered_pictureuri=i.itemordered_pictureuri,
-                unitprice=float(i.unitprice),
-                units=i.units,
-            )
-            for i in order.items
-        ],
-        total=float(total_amount)
+# -----------------------
+# Keyset paging over a buyer's order history
+# -----------------------
+# The paged statements only differ in which filters are present, so each
+# shape is built once with bind parameters; building the joined statement
+# costs more than running it for small pages.
+def _buyer_history_page(stmt, has_after: bool, has_from: bool, has_to: bool):
+    order_date_type = _orders.c.order_date.type
+    stmt = stmt.where(_orders.c.buyer_id == bindparam("buyer_id"))
+    if has_from:
+        stmt = stmt.where(_orders.c.order_date >= bindparam("date_from", type_=order_date_type))
+    if has_to:
+        stmt = stmt.where(_orders.c.order_date < bindparam("date_to", type_=order_date_type))
+    if has_after:
+        stmt = stmt.where(
+            tuple_(_orders.c.order_date, _orders.c.id)
+            < tuple_(bindparam("after_date", type_=order_date_type), bindparam("after_id", type_=Integer))
+        )
+    return stmt.order_by(_orders.c.order_date.desc(), _orders.c.id.desc()).limit(
+        bindparam("limit", type_=Integer)
     )
 
+def _history_params(buyer_id, limit, after, date_from, date_to) -> tuple[tuple[bool, bool, bool], dict]:
+    # One extra row tells whether another page follows.
+    params = {"buyer_id": buyer_id, "limit": limit + 1}
+    if after is not None:
+        params["after_date"], params["after_id"] = after
+    if date_from is not None:
+        params["date_from"] = date_from
+    if date_to is not None:
+        params["date_to"] = date_to
+    return (after is not None, date_from is not None, date_to is not None), params
+
+def _split_page(rows, limit):
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, (rows[-1].order_date, rows[-1].id)
+
 # -----------------------
-# List all orders for a buyer
+# List a buyer's orders, newest first, one page at a time
 # -----------------------
-async def list_orders_for_buyer(db: AsyncSession, buyer_id: str) -> list[schemas.OrderRead]:
-    result = await db.execute(
-        select(models.Order)
-        .where(models.Order.buyer_id == buyer_id)
-        .order_by(models.Order.order_date.desc())
-    )
-    orders = result.scalars().all()
+@lru_cache(maxsize=None)
+def _order_page_statement(has_after: bool, has_from: bool, has_to: bool):
+    # The page of orders (plus the probe row) is picked in a subquery so the
+    # limit counts orders, not joined item rows.
+    page = _buyer_history_page(select(*ORDER_COLUMNS), has_after, has_from, has_to).subquery()
+    return _with_items(page).order_by(page.c.order_date.desc(), page.c.id.desc(), _items.c.id)
+
+async def list_orders_for_buyer(
+    db: AsyncSession,
+    buyer_id: str,
+    limit: int = 50,
+    after: tuple[datetime, int] | None = None,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+) -> tuple[list[schemas.OrderRead], tuple[datetime, int] | None]:
+    """Return up to ``limit`` orders and the (order_date, id) position after them.
+
+    ``after`` resumes from a position returned by an earlier call; the
+    position is ``None`` on the last page. ``date_from`` is inclusive and
+    ``date_to`` exclusive. Walks ix_orders_buyer_id_order_date_id, so the cost
+    follows the page size rather than the buyer's lifetime order count.
+    """
+    shape, params = _history_params(buyer_id, limit, after, date_from, date_to)
+    result = await db.execute(_order_page_statement(*shape), params)
+    orders, next_position = _split_page(_orders_from_rows(result.all()), limit)
     logger.info("Fetched %s orders for buyer_id=%s", len(orders), buyer_id)
+    return orders, next_position
+
+# -----------------------
+# List a buyer's order summaries (no item rows)
+# -----------------------
+SUMMARY_COLUMNS = (
+    _orders.c.id,
+    _orders.c.buyer_id,
+    _orders.c.order_date,
+    _orders.c.status,
+    _orders.c.total,
+    _orders.c.item_count,
+)
+
+@lru_cache(maxsize=None)
+def _summary_page_statement(has_after: bool, has_from: bool, has_to: bool):
+    return _buyer_history_page(select(*SUMMARY_COLUMNS), has_after, has_from, has_to)
+
+async def list_order_summaries_for_buyer(
+    db: AsyncSession,
+    buyer_id: str,
+    limit: int = 50,
+    after: tuple[datetime, int] | None = None,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+) -> tuple[list[schemas.OrderSummary], tuple[datetime, int] | None]:
+    """Same paging as :func:`list_orders_for_buyer`, reading only ``orders`` columns."""
+    shape, params = _history_params(buyer_id, limit, after, date_from, date_to)
+    result = await db.execute(_summary_page_statement(*shape), params)
+    rows, next_position = _split_page(result.all(), limit)
+    logger.info("Fetched %s order summaries for buyer_id=%s", len(rows), buyer_id)
 
     return [
-        schemas.OrderRead(
-            id=o.id,
-            buyer_id=o.buyer_id,
-            order_date=o.order_date,  # use DB value
-            shipping=schemas.Shipping(
-                street=o.shiptoaddress_street,
-                city=o.shiptoaddress_city,
-                state=o.shiptoaddress_state,
-                country=o.shiptoaddress_country,
-                zip=o.shiptoaddress_zipcode,
-            ),
-            status=o.status,
-            items=[
-                schemas.OrderItemRead(
-                    id=i.id,
-                    itemordered_catalogitemid=i.itemordered_catalogitemid,
-                    itemordered_productname=i.itemordered_productname,
-                    itemordered_pictureuri=i.itemordered_pictureuri,
-                    unitprice=float(i.unitprice),
-                    units=i.units,
-                )
-                for i in o.items
-            ],
-            total=float(calculate_total(o.items))
+        schemas.OrderSummary(
+            id=r.id,
+            buyer_id=r.buyer_id,
+            order_date=r.order_date,
+            status=r.status,
+            total=float(r.total),
+            item_count=r.item_count,
         )
-        for o in orders
-    ]
+        for r in rows
+    ], next_position
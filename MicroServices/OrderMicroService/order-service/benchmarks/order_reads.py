@@ -0,0 +1,137 @@
+"""Per-order cost of reading orders with their items.
+
+Compares the entity path the service used before (``select(Order)``, a second
+selectin query for ``Order.items``, then copying every ORM attribute into
+``OrderRead``) with the joined column path ``get_order`` and
+``list_orders_for_buyer`` use now. Runs against an in-memory SQLite database,
+so it measures Python-side cost; on PostgreSQL the joined path also saves the
+selectin round trip:
+
+    python -m benchmarks.order_reads --orders 2000 --items-per-order 4 --page-sizes 1 10 50 200
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app import models, schemas, services
+
+
+async def _populate(session: AsyncSession, orders: int, items_per_order: int) -> None:
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    await session.execute(
+        models.Order.__table__.insert(),
+        [
+            {
+                "id": n + 1,
+                "buyer_id": "bench",
+                "order_date": start + timedelta(minutes=n),
+                "shiptoaddress_street": "1 Main St",
+                "shiptoaddress_city": "Seattle",
+                "shiptoaddress_state": "WA",
+                "shiptoaddress_country": "US",
+                "shiptoaddress_zipcode": "98101",
+                "status": "PENDING",
+                "total": 19.99 * items_per_order,
+                "item_count": items_per_order,
+            }
+            for n in range(orders)
+        ],
+    )
+    await session.execute(
+        models.OrderItem.__table__.insert(),
+        [
+            {
+                "order_id": n + 1,
+                "itemordered_catalogitemid": i + 1,
+                "itemordered_productname": f"Item {i + 1}",
+                "itemordered_pictureuri": f"images/products/{i + 1}.png",
+                "unitprice": 19.99,
+                "units": 1,
+            }
+            for n in range(orders)
+            for i in range(items_per_order)
+        ],
+    )
+    await session.commit()
+
+
+def _entity_to_read(o: models.Order) -> schemas.OrderRead:
+    return schemas.OrderRead(
+        id=o.id,
+        buyer_id=o.buyer_id,
+        order_date=o.order_date,
+        shipping=schemas.Shipping(
+            street=o.shiptoaddress_street,
+            city=o.shiptoaddress_city,
+            state=o.shiptoaddress_state,
+            country=o.shiptoaddress_country,
+            zip=o.shiptoaddress_zipcode,
+        ),
+        status=o.status,
+        items=[
+            schemas.OrderItemRead(
+                id=i.id,
+                itemordered_catalogitemid=i.itemordered_catalogitemid,
+                itemordered_productname=i.itemordered_productname,
+                itemordered_pictureuri=i.itemordered_pictureuri,
+                unitprice=float(i.unitprice),
+                units=i.units,
+            )
+            for i in o.items
+        ],
+        total=float(o.total),
+    )
+
+
+async def _entity_path(session: AsyncSession, page_size: int) -> list[schemas.OrderRead]:
+    stmt = (
+        select(models.Order)
+        .where(models.Order.buyer_id == "bench")
+        .order_by(models.Order.order_date.desc(), models.Order.id.desc())
+        .limit(page_size)
+    )
+    orders = (await session.execute(stmt)).scalars().all()
+    return [_entity_to_read(o) for o in orders]
+
+
+async def _joined_path(session: AsyncSession, page_size: int) -> list[schemas.OrderRead]:
+    orders, _ = await services.list_orders_for_buyer(session, "bench", limit=page_size)
+    return orders
+
+
+async def _time_per_order(session: AsyncSession, path, page_size: int, rounds: int) -> float:
+    assert len(await path(session, page_size)) == page_size
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await path(session, page_size)
+        # Keep the identity map from turning later rounds into cache hits.
+        session.expunge_all()
+    return (time.perf_counter() - started) / (rounds * page_size)
+
+
+async def main(orders: int, items_per_order: int, page_sizes: list[int], rounds: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        await _populate(session, orders, items_per_order)
+        print(f"{'page size':>10} {'entity us/order':>16} {'joined us/order':>16} {'speedup':>8}")
+        for page_size in page_sizes:
+            entity = await _time_per_order(session, _entity_path, page_size, rounds)
+            joined = await _time_per_order(session, _joined_path, page_size, rounds)
+            print(f"{page_size:>10} {entity * 1e6:>16.1f} {joined * 1e6:>16.1f} {entity / joined:>7.1f}x")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--items-per-order", type=int, default=4)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[1, 10, 50, 200])
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.orders, args.items_per_order, args.page_sizes, args.rounds))
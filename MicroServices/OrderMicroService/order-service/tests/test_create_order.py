@@ -0,0 +1,137 @@
+from collections import Counter
+
+import pytest
+from sqlalchemy import func, select
+
+from app import models, schemas, services
+
+
+def make_order(basket_id=1, items=1, buyer_id="buyer-1", unitprice=9.99):
+    return schemas.OrderCreate(
+        buyer_id=buyer_id,
+        basket_id=basket_id,
+        shipping=schemas.Shipping(street="1 Main St", city="Seattle", state="WA", country="US", zip="98101"),
+        items=[
+            schemas.OrderItemCreate(
+                itemordered_catalogitemid=i + 1,
+                itemordered_productname=f"Item {i + 1}",
+                itemordered_pictureuri=None,
+                unitprice=unitprice,
+                units=i + 1,
+            )
+            for i in range(items)
+        ],
+    )
+
+
+def statement_kinds(statements):
+    """("INSERT", table) / ("SELECT", ...) pairs, ignoring transaction control."""
+    kinds = []
+    for statement in statements:
+        words = statement.split()
+        if words[0] == "INSERT":
+            kinds.append(("INSERT", words[2]))
+        elif words[0] in ("SELECT", "UPDATE", "DELETE"):
+            kinds.append((words[0], statement))
+    return kinds
+
+
+@pytest.mark.asyncio
+async def test_create_order_inserts_without_reading_back(db_session, statements):
+    order, replayed = await services.create_order(db_session, make_order(unitprice=1.005))
+
+    # The key lookup, one flush for the order and its item, then the outbox
+    # message and the idempotency record with the commit. No refresh, no
+    # selectin reload.
+    kinds = statement_kinds(statements)
+    assert kinds[0][0] == "SELECT" and "order_idempotency_keys" in kinds[0][1]
+    assert kinds[1:3] == [("INSERT", "orders"), ("INSERT", "orderitems")]
+    assert sorted(kinds[3:]) == [("INSERT", "order_idempotency_keys"), ("INSERT", "outbox")]
+    assert not replayed
+    assert order.status == "PENDING"
+    assert order.order_date is not None
+    assert order.items[0].id is not None
+    # Prices come back rounded the way the column stores them.
+    assert order.items[0].unitprice == 1.01
+    assert order.total == 1.01
+
+
+@pytest.mark.asyncio
+async def test_create_order_with_many_items_selects_only_the_key(engine, db_session, statements):
+    order, _ = await services.create_order(db_session, make_order(items=5))
+
+    # PostgreSQL inserts the items as one multi-row INSERT ... RETURNING.
+    # SQLite cannot return autoincrement ids in parameter order, so the ORM
+    # falls back to one statement per item there.
+    item_inserts = 5 if engine.dialect.name == "sqlite" else 1
+    kinds = statement_kinds(statements)
+    assert [kind for kind, _ in kinds].count("SELECT") == 1
+    assert Counter(kind for kind in kinds if kind[0] == "INSERT") == {
+        ("INSERT", "orders"): 1,
+        ("INSERT", "orderitems"): item_inserts,
+        ("INSERT", "outbox"): 1,
+        ("INSERT", "order_idempotency_keys"): 1,
+    }
+    assert len({item.id for item in order.items}) == 5
+
+
+@pytest.mark.asyncio
+async def test_created_order_matches_what_get_order_reads(db_session, session_factory):
+    created, _ = await services.create_order(db_session, make_order(items=3))
+
+    async with session_factory() as session:
+        loaded = await services.get_order(session, created.id)
+
+    assert loaded.model_dump(exclude={"order_date"}) == created.model_dump(exclude={"order_date"})
+    assert loaded.order_date.replace(tzinfo=None) == created.order_date.replace(tzinfo=None)
+
+
+@pytest.mark.asyncio
+async def test_retry_is_replayed_from_cache_without_statements(db_session, statements):
+    first, _ = await services.create_order(db_session, make_order())
+    statements.clear()
+
+    replay, replayed = await services.create_order(db_session, make_order())
+
+    assert replayed
+    assert replay == first
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_retry_on_another_worker_replays_stored_response(db_session, session_factory, statements):
+    from app import idempotency
+
+    first, _ = await services.create_order(db_session, make_order(), "key-1")
+    idempotency.recent_orders.clear()
+    statements.clear()
+
+    async with session_factory() as session:
+        replay, replayed = await services.create_order(session, make_order(), "key-1")
+
+    assert replayed
+    assert replay == first
+    kinds = statement_kinds(statements)
+    # The stored key is found before the order is built, so nothing is written.
+    assert [kind for kind, _ in kinds] == ["SELECT"]
+    assert "order_idempotency_keys" in kinds[0][1]
+    assert ("INSERT", "orderitems") not in kinds
+    async with session_factory() as session:
+        orders = (await session.execute(select(func.count()).select_from(models.Order))).scalar_one()
+        messages = (await session.execute(select(func.count()).select_from(models.OutboxMessage))).scalar_one()
+    assert (orders, messages) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_reusing_a_key_for_another_order_is_a_conflict(client):
+    body = make_order().model_dump()
+    assert (await client.post("/api/v1/orders", json=body, headers={"Idempotency-Key": "k"})).status_code == 201
+
+    replay = await client.post("/api/v1/orders", json=body, headers={"Idempotency-Key": "k"})
+    other = await client.post(
+        "/api/v1/orders", json=make_order(basket_id=2).model_dump(), headers={"Idempotency-Key": "k"}
+    )
+
+    assert replay.status_code == 201
+    assert replay.headers["Idempotent-Replayed"] == "true"
+    assert other.status_code == 409
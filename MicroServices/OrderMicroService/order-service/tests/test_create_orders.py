@@ -0,0 +1,120 @@
+import pytest
+from sqlalchemy import func, select
+
+from app import idempotency, models, services
+from tests.test_create_order import make_order
+
+
+async def count(session_factory, model):
+    async with session_factory() as session:
+        return (await session.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_single_order_after_batch_replays_the_batch_order(db_session, session_factory):
+    [batch_order] = await services.create_orders(db_session, [make_order(basket_id=1)])
+    idempotency.recent_orders.clear()
+
+    async with session_factory() as session:
+        order, replayed = await services.create_order(session, make_order(basket_id=1))
+
+    assert replayed
+    assert order == batch_order
+    assert await count(session_factory, models.Order) == 1
+
+
+@pytest.mark.asyncio
+async def test_retried_batch_replays_created_orders_and_creates_new_ones(db_session, session_factory):
+    first = await services.create_orders(db_session, [make_order(basket_id=1), make_order(basket_id=2)])
+    idempotency.recent_orders.clear()
+
+    async with session_factory() as session:
+        retried = await services.create_orders(
+            session, [make_order(basket_id=1), make_order(basket_id=3), make_order(basket_id=2)]
+        )
+
+    assert [retried[0], retried[2]] == first
+    assert retried[1].id not in {o.id for o in first}
+    assert await count(session_factory, models.Order) == 3
+    assert await count(session_factory, models.OutboxMessage) == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_reusing_a_basket_for_another_order_is_a_conflict(db_session, session_factory):
+    await services.create_order(db_session, make_order(basket_id=1))
+
+    async with session_factory() as session:
+        with pytest.raises(services.IdempotencyConflictError):
+            await services.create_orders(session, [make_order(basket_id=2), make_order(basket_id=1, items=2)])
+
+    assert await count(session_factory, models.Order) == 1
+
+
+@pytest.mark.asyncio
+async def test_repeated_basket_within_a_batch_is_created_once(db_session, session_factory):
+    orders = await services.create_orders(db_session, [make_order(basket_id=1), make_order(basket_id=1)])
+
+    assert orders[0] == orders[1]
+    assert await count(session_factory, models.Order) == 1
+
+
+def order_body(basket_id, items=1, buyer_id="buyer-1"):
+    return make_order(basket_id=basket_id, items=items, buyer_id=buyer_id).model_dump()
+
+
+@pytest.mark.asyncio
+async def test_batch_ids_follow_request_order(client, session_factory):
+    bodies = [order_body(1, items=3, buyer_id="b"), order_body(2, items=1, buyer_id="a"), order_body(3, items=2, buyer_id="c")]
+
+    response = await client.post("/api/v1/orders/batch", json={"orders": bodies})
+
+    assert response.status_code == 201
+    created = response.json()
+    assert [o["buyer_id"] for o in created] == ["b", "a", "c"]
+    assert [len(o["items"]) for o in created] == [3, 1, 2]
+    async with session_factory() as session:
+        for order in created:
+            stored = await services.get_order(session, order["id"])
+            assert [item.id for item in stored.items] == [item["id"] for item in order["items"]]
+            assert stored.buyer_id == order["buyer_id"]
+
+
+@pytest.mark.asyncio
+async def test_batch_over_the_limit_is_rejected(client, monkeypatch, session_factory):
+    from app.api.v1 import orders
+
+    monkeypatch.setattr(orders, "BATCH_MAX_ORDERS", 2)
+
+    response = await client.post("/api/v1/orders/batch", json={"orders": [order_body(n) for n in range(3)]})
+
+    assert response.status_code == 400
+    assert await count(session_factory, models.Order) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_stores_nothing(client, monkeypatch, session_factory):
+    real_payload = services.stock_confirm_payload
+
+    def failing_payload(order_in):
+        if order_in.basket_id == 2:
+            raise RuntimeError("boom")
+        return real_payload(order_in)
+
+    # Fails after the orders and items were inserted, before the commit.
+    monkeypatch.setattr(services, "stock_confirm_payload", failing_payload)
+
+    response = await client.post("/api/v1/orders/batch", json={"orders": [order_body(1), order_body(2)]})
+
+    assert response.status_code == 500
+    for model in (models.Order, models.OrderItem, models.OutboxMessage, models.OrderIdempotencyKey):
+        assert await count(session_factory, model) == 0
+
+
+@pytest.mark.asyncio
+async def test_orders_without_items_are_rejected(client, session_factory):
+    body = order_body(1)
+    body["items"] = []
+
+    assert (await client.post("/api/v1/orders", json=body)).status_code == 422
+    assert (await client.post("/api/v1/orders/batch", json={"orders": [order_body(2), body]})).status_code == 422
+    assert await count(session_factory, models.OutboxMessage) == 0
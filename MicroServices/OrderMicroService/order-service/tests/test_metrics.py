@@ -0,0 +1,27 @@
+import pytest
+from prometheus_client import REGISTRY
+
+from app.metrics import instrument_engine
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_metrics_record_route_template_and_query_time(client, engine):
+    instrument_engine(engine)
+    route = "/api/v1/orders/{order_id}"
+    requests_before = sample("http_request_duration_seconds_count", method="GET", route=route, status="404")
+    selects_before = sample("db_query_duration_seconds_count", operation="SELECT")
+
+    response = await client.get("/api/v1/orders/424242")
+    assert response.status_code == 404
+
+    assert sample("http_request_duration_seconds_count", method="GET", route=route, status="404") == requests_before + 1
+    assert sample("db_query_duration_seconds_count", operation="SELECT") >= selects_before + 1
+    assert sample("http_requests_in_flight") == 0
+
+    metrics = await client.get("/metrics")
+    assert metrics.status_code == 200
+    assert f'route="{route}"' in metrics.text
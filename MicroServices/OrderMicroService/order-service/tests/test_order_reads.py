@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app import models, services
+
+
+async def add_orders(session, count, buyer_id="buyer-1"):
+    """``count`` orders a day apart; order n has n items (order 0 has none)."""
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for n in range(count):
+        order = models.Order(
+            buyer_id=buyer_id,
+            order_date=start + timedelta(days=n),
+            shiptoaddress_street="1 Main St",
+            shiptoaddress_city="Seattle",
+            shiptoaddress_state="WA",
+            shiptoaddress_country="US",
+            shiptoaddress_zipcode="98101",
+            total=sum(2 * (i + 1) for i in range(n)),
+            item_count=sum(i + 1 for i in range(n)),
+        )
+        for i in range(n):
+            order.items.append(
+                models.OrderItem(
+                    itemordered_catalogitemid=i + 1,
+                    itemordered_productname=f"Item {i + 1}",
+                    unitprice=2,
+                    units=i + 1,
+                )
+            )
+        session.add(order)
+    await session.commit()
+
+
+def selects(statements):
+    return [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+
+@pytest.mark.asyncio
+async def test_get_order_reads_order_and_items_in_one_query(db_session, session_factory, statements):
+    await add_orders(db_session, 4)
+    statements.clear()
+
+    async with session_factory() as session:
+        order = await services.get_order(session, 4)
+        missing = await services.get_order(session, 999)
+
+    assert len(selects(statements)) == 2
+    assert [item.units for item in order.items] == [1, 2, 3]
+    assert order.total == 12.0
+    assert order.shipping.city == "Seattle"
+    assert missing is None
+
+
+@pytest.mark.asyncio
+async def test_get_order_without_items(db_session, session_factory):
+    await add_orders(db_session, 1)
+
+    async with session_factory() as session:
+        order = await services.get_order(session, 1)
+
+    assert order.items == []
+
+
+@pytest.mark.asyncio
+async def test_list_pages_count_orders_not_item_rows(db_session, session_factory, statements):
+    await add_orders(db_session, 6)
+    await add_orders(db_session, 2, buyer_id="buyer-2")
+    statements.clear()
+
+    pages = []
+    after = None
+    async with session_factory() as session:
+        while True:
+            orders, after = await services.list_orders_for_buyer(session, "buyer-1", limit=4, after=after)
+            pages.append(orders)
+            if after is None:
+                break
+
+    # One joined query per page, however many items the orders have.
+    assert len(selects(statements)) == 2
+    assert [[o.id for o in page] for page in pages] == [[6, 5, 4, 3], [2, 1]]
+    assert [len(o.items) for page in pages for o in page] == [5, 4, 3, 2, 1, 0]
+    assert all(o.buyer_id == "buyer-1" for page in pages for o in page)
+
+
+@pytest.mark.asyncio
+async def test_history_endpoint_filters_by_date_and_follows_cursor(db_session, client):
+    await add_orders(db_session, 6)
+    params = {"buyer_id": "buyer-1", "limit": 2, "from": "2026-01-02T00:00:00Z", "to": "2026-01-06T00:00:00Z"}
+
+    first = await client.get("/api/v1/orders", params=params)
+    second = await client.get("/api/v1/orders", params={**params, "cursor": first.headers["X-Next-Cursor"]})
+    summaries = await client.get("/api/v1/orders/summary", params=params)
+    mismatched = await client.get(
+        "/api/v1/orders", params={**params, "to": "2026-01-07T00:00:00Z", "cursor": first.headers["X-Next-Cursor"]}
+    )
+
+    assert [o["id"] for o in first.json()] == [5, 4]
+    assert [o["id"] for o in second.json()] == [3, 2]
+    assert "X-Next-Cursor" not in second.headers
+    assert [(o["id"], o["item_count"]) for o in summaries.json()] == [(5, 10), (4, 6)]
+    assert mismatched.status_code == 400
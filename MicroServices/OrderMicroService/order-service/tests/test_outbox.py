@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+
+from app import models
+from app.outbox import OutboxRelay
+
+
+class FakePublisher:
+    """Records each ``publish_many`` call; fails the first ``failures`` of them."""
+
+    def __init__(self, session_factory, failures=0):
+        self.session_factory = session_factory
+        self.failures = failures
+        self.batches = []
+        self.pending_during_publish = []
+
+    async def publish_many(self, messages):
+        messages = list(messages)
+        self.pending_during_publish.append(await pending(self.session_factory))
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("broker unavailable")
+        self.batches.append(messages)
+
+
+async def pending(session_factory):
+    async with session_factory() as session:
+        return (await session.execute(select(func.count()).select_from(models.OutboxMessage))).scalar_one()
+
+
+async def add_messages(session_factory, count):
+    async with session_factory() as session:
+        session.add_all(
+            models.OutboxMessage(routing_key="catalog_item_stock.confirm", payload=[{"n": n}]) for n in range(count)
+        )
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_messages_are_deleted_only_after_publish_returns(session_factory):
+    publisher = FakePublisher(session_factory)
+    relay = OutboxRelay(session_factory, publisher, batch_size=10)
+    await add_messages(session_factory, 3)
+
+    assert await relay.relay_once() == 3
+
+    assert publisher.pending_during_publish == [3]
+    assert [payload for _, payload in publisher.batches[0]] == [[{"n": 0}], [{"n": 1}], [{"n": 2}]]
+    assert await pending(session_factory) == 0
+    assert relay.published_total == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_keeps_messages_for_the_next_attempt(session_factory):
+    publisher = FakePublisher(session_factory, failures=1)
+    relay = OutboxRelay(session_factory, publisher, batch_size=10)
+    await add_messages(session_factory, 2)
+
+    with pytest.raises(ConnectionError):
+        await relay.relay_once()
+
+    assert relay.failed_batches == 1
+    assert await pending(session_factory) == 2
+    assert await relay.relay_once() == 2
+    assert await pending(session_factory) == 0
+
+
+@pytest.mark.asyncio
+async def test_relay_drains_full_batches_without_waiting_for_the_poll(session_factory):
+    publisher = FakePublisher(session_factory)
+    relay = OutboxRelay(session_factory, publisher, batch_size=2, poll_interval=60)
+    await add_messages(session_factory, 5)
+
+    relay.start()
+    try:
+        await asyncio.wait_for(_until(lambda: relay.published_total == 5), timeout=5)
+    finally:
+        await relay.stop()
+
+    assert [len(batch) for batch in publisher.batches] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_notify_wakes_an_idle_relay(session_factory):
+    publisher = FakePublisher(session_factory)
+    relay = OutboxRelay(session_factory, publisher, batch_size=10, poll_interval=60)
+    relay.start()
+    try:
+        # Let the relay find the outbox empty and start its 60s wait.
+        await asyncio.sleep(0.05)
+        await add_messages(session_factory, 1)
+        relay.notify()
+        await asyncio.wait_for(_until(lambda: relay.published_total == 1), timeout=5)
+    finally:
+        await relay.stop()
+
+    assert await pending(session_factory) == 0
+
+
+@pytest.mark.asyncio
+async def test_publish_rate_covers_only_the_recent_window(session_factory, db_session):
+    relay = OutboxRelay(session_factory, FakePublisher(session_factory), rate_window=60)
+    relay.started_at -= 600
+    # A burst ten minutes ago no longer counts towards the current rate.
+    relay._recent_batches.append((relay.started_at, 1000))
+    await add_messages(session_factory, 30)
+    await relay.relay_once()
+
+    stats = await relay.stats(db_session)
+
+    assert stats["published_total"] == 30
+    assert stats["published_per_second"] == pytest.approx(30 / 60, rel=0.01)
+
+
+async def _until(condition):
+    while not condition():
+        await asyncio.sleep(0.01)
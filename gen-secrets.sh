@@ -51,6 +51,9 @@ done
 # --- Gateway client cert (for mTLS to services)
 gen_client gateway
 
+# --- Prometheus client cert (scrapes /metrics over mTLS)
+gen_client prometheus
+
 # --- App secret key ---
 if [[ ! -f "$SECRETS/jwt/secret.key" ]]; then
   openssl rand -base64 32 > "$SECRETS/jwt/secret.key"